@@ -0,0 +1,232 @@
+#!/usr/bin/python3
+"""Cog to get daily on bonjourmadame picture."""
+
+import asyncio
+import datetime
+import logging
+import os
+from functools import partial
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from httpx import HTTPError
+
+from gourgandin import NSFW_BOT_CHANNEL
+
+from .madame_archive import MadameArchive, backfill
+from .madame_feed import FeedState
+from .madame_scraper import latest_madame
+from .madame_stage import StagedMadame, StagingError, stage_madame, stage_until
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_PATH = Path(os.getenv("BONJOUR_ARCHIVE", Path(__file__).parent / "bonjour_archive.jsonl"))
+BACKFILL_CONCURRENCY = int(os.getenv("BONJOUR_BACKFILL_CONCURRENCY", "4"))
+BACKFILL_MAX_DAYS = int(os.getenv("BONJOUR_BACKFILL_MAX_DAYS", "92"))  # jours par commande
+# "feed" (RSS, repli sur le HTML) ou "html" (scraping de la page d'accueil)
+INGEST_BACKEND = os.getenv("BONJOUR_BACKEND", "feed")
+# Envoyer l'image en pièce jointe plutôt que son URL
+ATTACH_IMAGE = os.getenv("BONJOUR_ATTACH", "").strip().lower() in ("1", "true", "yes", "on")
+
+# Heure de Paris : sans tzinfo, tasks.loop utilise l'UTC (9h30 partait à 10h30 en hiver)
+PARIS = ZoneInfo("Europe/Paris")
+PUBLISH_TIME = datetime.time(hour=9, minute=30, tzinfo=PARIS)
+PREFETCH_TIME = datetime.time(hour=9, minute=20, tzinfo=PARIS)
+RETRY_DELAY = 30  # secondes entre deux tentatives de pré-staging
+ATTEMPT_MARGIN = 60  # pas de nouvelle tentative moins d'une minute avant la publication
+
+
+def load_excludes() -> list[str]:
+    """Liste des domaines de "book" à ne pas poster (bonjour_exclude.txt)."""
+    try:
+        p = Path(__file__).parent / "bonjour_exclude.txt"
+        with open(p, encoding="utf-8") as f:
+            return f.read().splitlines()
+    except FileNotFoundError:
+        logger.error("cogs/bonjourmadame/bonjour_exclude.txt is missing")
+        return []
+
+
+class BonjourMadame(commands.Cog):
+    """Cog for the loop fetching BonjourMadame"""
+
+    def __init__(self, bot, guild_id, nsfw_channel_name):
+        self.bot = bot
+        self.guild_id = guild_id
+        self.nsfw_channel_name = nsfw_channel_name
+        self.archive = MadameArchive(ARCHIVE_PATH)
+        self.feed_state = FeedState()
+        self.staged: StagedMadame | None = None
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        guild = self.bot.get_guild(self.guild_id)
+        self.nsfw_channel = discord.utils.get(guild.text_channels, name=self.nsfw_channel_name)
+
+        if not self.prefetch_madame.is_running():
+            self.prefetch_madame.start()
+        if not self.bonjour_madame.is_running():
+            self.bonjour_madame.start()
+            logger.info("on_ready finished.")
+
+    async def _stage(self, day: datetime.date) -> StagedMadame:
+        return await stage_madame(
+            day,
+            state=self.feed_state,
+            backend=INGEST_BACKEND,
+            excludes=load_excludes(),
+            attach=ATTACH_IMAGE,
+        )
+
+    @tasks.loop(time=PREFETCH_TIME)
+    async def prefetch_madame(self):
+        """Prépare la madame du jour avant l'heure de publication, avec retries."""
+        now = datetime.datetime.now(PARIS)
+        if not 0 <= now.weekday() <= 4:
+            return
+        deadline = datetime.datetime.combine(now.date(), PUBLISH_TIME)
+        staged = await stage_until(
+            partial(self._stage, now.date()), deadline, RETRY_DELAY, ATTEMPT_MARGIN
+        )
+        if staged is not None:
+            self.staged = staged
+            logger.info("madame pré-stagée : %s / %s", staged.image_url, staged.title)
+
+    @tasks.loop(time=PUBLISH_TIME)
+    async def bonjour_madame(self):
+        """Send daily bonjourmadame."""
+        today = datetime.datetime.now(PARIS).date()
+        if not 0 <= today.weekday() <= 4:
+            return
+        staged, self.staged = self.staged, None
+        if staged is None or staged.day != today:
+            logger.warning("rien de pré-stagé pour %s, dernière tentative", today)
+            try:
+                staged = await self._stage(today)
+            except (HTTPError, StagingError) as e:
+                logger.error("madame du jour introuvable : %s", e)
+                return
+        logger.info(
+            "try to post madame with %s / %s / %s", staged.image_url, staged.title, staged.book
+        )
+        await self.nsfw_channel.send(
+            **staged.to_message_kwargs(self.nsfw_channel.guild.filesize_limit)
+        )
+        logger.info("madame sent")
+
+    @app_commands.command(
+        name="madame",
+        description="Une madame de l'archive (au hasard, ou d'un jour donné)",
+        nsfw=True,
+    )
+    @app_commands.describe(jour="Date au format AAAA-MM-JJ (vide = au hasard)")
+    async def madame(self, interaction: discord.Interaction, jour: str | None = None) -> None:
+        """Sert une madame depuis l'archive locale, sans requête réseau."""
+        if jour:
+            try:
+                day = datetime.date.fromisoformat(jour)
+            except ValueError:
+                await interaction.response.send_message(
+                    "❌ Date invalide, format attendu : AAAA-MM-JJ", ephemeral=True
+                )
+                return
+            entry = self.archive.get(day)
+        else:
+            entry = self.archive.random()
+
+        if entry is None:
+            await interaction.response.send_message(
+                "📂 Aucune madame dans l'archive pour cette demande.", ephemeral=True
+            )
+            return
+
+        header = f"{entry.date:%d/%m/%Y}"
+        if entry.title:
+            header += f" — {entry.title}"
+        content = f"{header}\n{entry.image_url}"
+        await interaction.response.send_message(content)
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    @commands.has_any_role("modo", "Admin")
+    async def madame_backfill(self, ctx: commands.Context, debut: str, fin: str) -> None:
+        """Remplit l'archive bonjourmadame entre deux dates (AAAA-MM-JJ).
+
+        Args:
+            debut (str): premier jour (inclus)
+            fin (str): dernier jour (inclus)
+        """
+        try:
+            start = datetime.date.fromisoformat(debut)
+            end = datetime.date.fromisoformat(fin)
+        except ValueError:
+            await ctx.send("❌ Dates invalides, format attendu : AAAA-MM-JJ")
+            return
+        if start > end:
+            start, end = end, start
+        days = (end - start).days + 1
+        if days > BACKFILL_MAX_DAYS:
+            await ctx.send(
+                f"❌ {days} jours demandés : {BACKFILL_MAX_DAYS} au maximum par commande, "
+                "découpez la période."
+            )
+            return
+
+        await ctx.defer(ephemeral=False)
+        added, failed = await backfill(self.archive, start, end, concurrency=BACKFILL_CONCURRENCY)
+        await ctx.send(
+            f"🗄️ Archive madame : {added} jours ajoutés, {failed} en erreur "
+            f"({self.archive.images_count()} madames au total)."
+        )
+        logger.info("madame_backfill %s → %s done", start, end)
+
+    @bonjour_madame.before_loop
+    async def before_bonjour_madame(self):
+        """Intiliaze bonjour_madame loop."""
+        # await self.bot.wait_until_ready()
+        logger.info("Bonjour loop OK")
+        # await asyncio.sleep(41400)  # Wait 10hours 30min, to lauch at 10:30AM
+
+
+async def setup(bot):
+    """
+    Sets up the LeMonde cog for the provided Discord bot instance.
+
+    This asynchronous function adds the BonjourMadame cog to the bot and logs a message
+    indicating the successful addition of the cog.
+
+    Args:
+        bot: The Discord bot instance to which the cog will be added.
+        guild_id (int): main guild id
+        nsfw_channel_name (str): name to search for the nsfw channel used by bot
+    Returns:
+        None
+    """
+    guild_id = int(os.environ["GUILD_ID"])
+    # nsfw_channel = os.getenv("NSFW_CHANNEL")
+    # nsfw_manual = os.getenv("NSFW_MANUAL_CHANNEL")
+    await bot.add_cog(
+        BonjourMadame(
+            bot,
+            guild_id=guild_id,
+            nsfw_channel_name=NSFW_BOT_CHANNEL,
+        )
+    )
+    logger.info("BonjourMadame cog added")
+
+
+# main is for debugging purpose
+if __name__ == "__main__":  # python -m cogs.bonjourmadame.bonjourmadame from root folder
+    logger.setLevel(logging.DEBUG)
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG)
+    logger.addHandler(console_handler)
+
+    async def main():
+        url, title, book = await latest_madame()
+        print(url)
+        print(title)
+
+    asyncio.run(main())
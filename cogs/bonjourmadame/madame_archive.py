@@ -0,0 +1,162 @@
+"""
+madame_archive.py
+
+Archive locale des posts bonjourmadame.
+Il fournit :
+- MadameEntry : une entrée de l'index (date, image, titre, book)
+- MadameArchive : l'index sur disque (JSON lines, une ligne par jour)
+- backfill : crawl concurrent d'une plage de dates, reprenable après interruption
+
+Les jours sans post (week-ends, 404) sont aussi enregistrés, pour ne pas être
+re-crawlés à la reprise.
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from httpx import HTTPError
+
+from .madame_scraper import fetch_madame_day, make_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class MadameEntry:
+    date: datetime.date
+    image_url: str | None
+    title: str | None
+    book: str | None
+
+    @property
+    def has_image(self) -> bool:
+        return bool(self.image_url)
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["date"] = self.date.isoformat()
+        return json.dumps(data, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> "MadameEntry":
+        data = json.loads(line)
+        data["date"] = datetime.date.fromisoformat(data["date"])
+        return cls(**data)
+
+
+class MadameArchive:
+    """
+    Index local des madames, persisté en JSON lines.
+
+    Chaque entrée est ajoutée en fin de fichier dès qu'elle est récupérée :
+    un crawl interrompu reprend là où il s'est arrêté.
+
+    Args:
+        path (Path): chemin du fichier d'index.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[datetime.date, MadameEntry] = {}
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = MadameEntry.from_json(line)
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning("ligne invalide dans %s : %s", self.path, line.strip())
+                        continue
+                    self._entries[entry.date] = entry
+        except FileNotFoundError:
+            logger.info("Pas encore d'archive madame (%s)", self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, day: datetime.date) -> bool:
+        return day in self._entries
+
+    def add(self, entry: MadameEntry) -> None:
+        """Ajoute une entrée à l'index (mémoire + disque)."""
+        self._entries[entry.date] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open(mode="a", encoding="utf-8") as f:
+            f.write(entry.to_json() + "\n")
+
+    def get(self, day: datetime.date) -> MadameEntry | None:
+        """Retourne la madame d'un jour donné, si elle est dans l'index."""
+        entry = self._entries.get(day)
+        return entry if entry and entry.has_image else None
+
+    def random(self) -> MadameEntry | None:
+        """Retourne une madame au hasard dans l'index."""
+        entries = [e for e in self._entries.values() if e.has_image]
+        return random.choice(entries) if entries else None
+
+    def images_count(self) -> int:
+        return sum(1 for e in self._entries.values() if e.has_image)
+
+
+def date_range(start: datetime.date, end: datetime.date) -> list[datetime.date]:
+    """Liste des jours entre start et end inclus."""
+    return [start + datetime.timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+async def backfill(
+    archive: MadameArchive,
+    start: datetime.date,
+    end: datetime.date,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> tuple[int, int]:
+    """
+    Crawl les archives bonjourmadame entre deux dates, avec une concurrence bornée.
+
+    Les jours déjà présents dans l'index sont ignorés (reprise après interruption).
+    Les erreurs réseau sur un jour sont loguées et le jour n'est pas enregistré :
+    il sera retenté au prochain backfill.
+
+    Args:
+        archive (MadameArchive): index local à compléter.
+        start (datetime.date): premier jour (inclus).
+        end (datetime.date): dernier jour (inclus).
+        concurrency (int): nombre maximum de requêtes simultanées.
+
+    Returns:
+        tuple[int, int]: nombre de jours ajoutés à l'index, nombre de jours en erreur.
+    """
+    todo = [day for day in date_range(start, end) if day not in archive]
+    logger.info("backfill madame : %d jours à récupérer (%s → %s)", len(todo), start, end)
+    semaphore = asyncio.Semaphore(concurrency)
+    added = 0
+    failed = 0
+
+    async with make_client() as client:
+
+        async def fetch_one(day: datetime.date) -> None:
+            nonlocal added, failed
+            async with semaphore:
+                try:
+                    image_url, title, book = await fetch_madame_day(client, day)
+                except HTTPError as e:
+                    logger.warning("backfill madame : échec pour %s : %s", day, e)
+                    failed += 1
+                    return
+            archive.add(MadameEntry(date=day, image_url=image_url, title=title, book=book))
+            added += 1
+
+        await asyncio.gather(*(fetch_one(day) for day in todo))
+
+    logger.info("backfill madame terminé : %d ajoutés, %d en erreur", added, failed)
+    return added, failed
@@ -0,0 +1,169 @@
+"""
+madame_feed.py
+
+Récupération de la dernière madame via le flux RSS WordPress (/feed/).
+Il fournit :
+- FeedState : validateurs HTTP (ETag, Last-Modified) et dernier résultat connu
+- fetch_latest_feed : requête conditionnelle, parsing incrémental arrêté au premier <item>
+- ingest_latest : choix du backend (feed ou html), avec repli sur le scraping HTML
+
+Le flux est lu en streaming : dès que le premier <item> est complet, la connexion
+est fermée, sans télécharger ni parser le reste des entrées.
+"""
+
+import logging
+import time
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+
+from httpx import AsyncClient, HTTPError
+from selectolax.parser import HTMLParser
+
+from .madame_scraper import (
+    BASE_URL,
+    IngestStats,
+    MadameTuple,
+    extract_content,
+    fetch_latest_html,
+    make_client,
+)
+
+logger = logging.getLogger(__name__)
+
+FEED_URL = f"{BASE_URL}feed/"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+
+class FeedError(Exception):
+    """Le flux est inexploitable (XML invalide, aucune entrée, pas d'image)."""
+
+
+@dataclass
+class FeedState:
+    """Validateurs HTTP du dernier appel, pour les requêtes conditionnelles."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    last_madame: MadameTuple | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        if self.last_madame is None:
+            return {}
+        cond = {}
+        if self.etag:
+            cond["If-None-Match"] = self.etag
+        if self.last_modified:
+            cond["If-Modified-Since"] = self.last_modified
+        return cond
+
+
+def parse_item(item: ET.Element) -> MadameTuple:
+    """Extrait (image, titre, book) d'un <item> RSS."""
+    title = (item.findtext("title") or "").strip() or None
+    html = item.findtext(CONTENT_NS) or item.findtext("description") or ""
+    content = HTMLParser(html).css_first("p")
+    image_url, book = extract_content(content)
+    return image_url, title, book
+
+
+async def fetch_latest_feed(
+    client: AsyncClient, state: FeedState
+) -> tuple[MadameTuple, IngestStats]:
+    """Récupère la dernière madame depuis le flux RSS.
+
+    Args:
+        client (AsyncClient): client httpx
+        state (FeedState): validateurs du dernier appel (mis à jour)
+
+    Returns:
+        MadameTuple: (image url, titre, book)
+        IngestStats: octets téléchargés et temps de parsing
+
+    Raises:
+        HTTPError: erreur réseau ou HTTP
+        FeedError: flux invalide ou sans madame exploitable
+    """
+    stats = IngestStats(backend="feed")
+    async with client.stream("GET", FEED_URL, headers=state.conditional_headers()) as resp:
+        if resp.status_code == 304 and state.last_madame is not None:
+            stats.not_modified = True
+            stats.bytes_downloaded = resp.num_bytes_downloaded
+            return state.last_madame, stats
+        resp.raise_for_status()
+
+        parser: ET.XMLPullParser[ET.Element] = ET.XMLPullParser(events=("end",))
+        item: ET.Element | None = None
+        try:
+            async for chunk in resp.aiter_bytes():
+                start = time.perf_counter()
+                parser.feed(chunk)
+                for event in parser.read_events():
+                    elem = event[-1]  # ("end", élément)
+                    if isinstance(elem, ET.Element) and elem.tag == "item":
+                        item = elem
+                        break
+                stats.parse_ms += (time.perf_counter() - start) * 1000
+                if item is not None:
+                    break
+        except ET.ParseError as e:
+            raise FeedError(f"flux XML invalide : {e}") from e
+        stats.bytes_downloaded = resp.num_bytes_downloaded
+
+        if item is None:
+            raise FeedError("aucune entrée dans le flux")
+        start = time.perf_counter()
+        madame = parse_item(item)
+        stats.parse_ms += (time.perf_counter() - start) * 1000
+
+        if not madame[0]:
+            raise FeedError("pas d'image dans la dernière entrée du flux")
+
+        state.etag = resp.headers.get("ETag")
+        state.last_modified = resp.headers.get("Last-Modified")
+        state.last_madame = madame
+    return madame, stats
+
+
+async def ingest_latest(state: FeedState, backend: str = "feed") -> MadameTuple:
+    """Récupère la dernière madame avec le backend choisi.
+
+    Le backend "feed" retombe sur le scraping HTML si le flux est cassé.
+
+    Args:
+        state (FeedState): état du flux, conservé entre deux appels
+        backend (str): "feed" ou "html"
+
+    Returns:
+        MadameTuple: (image url, titre, book)
+    """
+    async with make_client() as client:
+        if backend == "feed":
+            try:
+                madame, stats = await fetch_latest_feed(client, state)
+                logger.info("madame ingest — %s", stats)
+                return madame
+            except (HTTPError, FeedError) as e:
+                logger.warning("flux bonjourmadame inutilisable (%s), repli sur le HTML", e)
+        madame, stats = await fetch_latest_html(client)
+    logger.info("madame ingest — %s", stats)
+    return madame
+
+
+# main is for benchmarking purpose : compare both backends
+if __name__ == "__main__":  # python -m cogs.bonjourmadame.madame_feed from root folder
+    import asyncio
+
+    logging.basicConfig(level=logging.INFO)
+
+    async def main():
+        async with make_client() as client:
+            state = FeedState()
+            feed_madame, feed_stats = await fetch_latest_feed(client, state)
+            html_madame, html_stats = await fetch_latest_html(client)
+            _, cond_stats = await fetch_latest_feed(client, state)
+        print(feed_stats)
+        print(html_stats)
+        print(f"{cond_stats} (second call, conditional)")
+        print("same result :", feed_madame == html_madame)
+
+    asyncio.run(main())
@@ -0,0 +1,164 @@
+"""
+madame_scraper.py
+
+Ce module gère le scraping de bonjourmadame.fr.
+Il fournit :
+- l'extraction (selectolax) de l'image, du titre et du lien "book" d'une page
+- la récupération de la page d'accueil (dernière madame)
+- la récupération de la page d'archive d'un jour donné
+
+Utilisé par bonjourmadame.py (cog), madame_feed.py (fallback HTML)
+et madame_archive.py (backfill).
+"""
+
+import datetime
+import logging
+import time
+from dataclasses import dataclass
+
+from httpx import AsyncClient
+from selectolax.parser import HTMLParser, Node
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.bonjourmadame.fr/"
+
+headers = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+    )
+}
+
+MadameTuple = tuple[str | None, str | None, str | None]
+
+
+@dataclass
+class IngestStats:
+    """Mesures d'une récupération de la dernière madame, pour comparer les backends."""
+
+    backend: str
+    bytes_downloaded: int = 0
+    parse_ms: float = 0.0
+    not_modified: bool = False
+
+    def __str__(self) -> str:
+        status = " (304 Not Modified)" if self.not_modified else ""
+        return (
+            f"{self.backend}: {self.bytes_downloaded / 1024:.1f} KiB, "
+            f"parse {self.parse_ms:.2f} ms{status}"
+        )
+
+
+def make_client(timeout: float = 10.0) -> AsyncClient:
+    """Client httpx configuré pour bonjourmadame (headers, redirections, timeout)."""
+    return AsyncClient(
+        headers=headers,
+        follow_redirects=True,
+        timeout=timeout,
+    )
+
+
+def extract_madame(html: str) -> MadameTuple:
+    """Extrait la première madame d'une page HTML bonjourmadame.
+
+    Args:
+        html (str): contenu HTML de la page (accueil ou archive d'un jour)
+
+    Returns:
+        str: image url
+        str: image description
+        str: book if exist, or None
+    """
+    tree = HTMLParser(html)
+
+    # Selectolax: CSS selectors identiques à BS4
+    content = tree.css_first("div.post-content > p")
+    title_node = tree.css_first("header.post-header > h1 > a")
+
+    title_txt = title_node.text(strip=True) if title_node else None
+    image_url, book = extract_content(content)
+    return image_url, title_txt, book
+
+
+def extract_content(content: Node | None) -> tuple[str | None, str | None]:
+    """Extrait l'image et le lien "book" du paragraphe de contenu d'un post.
+
+    Args:
+        content (Node | None): premier paragraphe du contenu du post
+
+    Returns:
+        str: image url, or None
+        str: book if exist, or None
+    """
+    # Book link
+    book = None
+    if content:
+        a = content.css_first("a[href]")
+        if a:
+            book = a.attributes.get("href")
+
+    # Image URL
+    image_url = None
+    if content:
+        img = content.css_first("img[src]")
+        if img and (src := img.attributes.get("src")):
+            image_url = src.split("?")[0]
+
+    return image_url, book
+
+
+def day_url(day: datetime.date) -> str:
+    """URL de l'archive WordPress d'un jour donné (ex: .../2024/10/03/)."""
+    return f"{BASE_URL}{day:%Y/%m/%d}/"
+
+
+async def fetch_madame_day(client: AsyncClient, day: datetime.date) -> MadameTuple:
+    """Récupère la madame publiée un jour donné.
+
+    Args:
+        client (AsyncClient): client httpx partagé (pool de connexions)
+        day (datetime.date): jour à récupérer
+
+    Returns:
+        MadameTuple: (image url, titre, book), tout à None si pas de post ce jour-là
+    """
+    resp = await client.get(day_url(day))
+    if resp.status_code == 404:
+        logger.debug("no madame on %s", day)
+        return None, None, None
+    resp.raise_for_status()
+    return extract_madame(resp.text)
+
+
+async def latest_madame() -> MadameTuple:
+    """Fetch latest bonjourmadame img
+
+    Returns:
+        str: image url
+        str: image description
+        str: book if exist, or None
+    """
+    async with make_client() as client:
+        madame, _ = await fetch_latest_html(client)
+    return madame
+
+
+async def fetch_latest_html(client: AsyncClient) -> tuple[MadameTuple, IngestStats]:
+    """Récupère la dernière madame en scrapant la page d'accueil complète.
+
+    Args:
+        client (AsyncClient): client httpx
+
+    Returns:
+        MadameTuple: (image url, titre, book)
+        IngestStats: octets téléchargés et temps de parsing
+    """
+    resp = await client.get(BASE_URL)
+    resp.raise_for_status()
+    stats = IngestStats(backend="html", bytes_downloaded=resp.num_bytes_downloaded)
+
+    start = time.perf_counter()
+    madame = extract_madame(resp.text)
+    stats.parse_ms = (time.perf_counter() - start) * 1000
+    return madame, stats
@@ -0,0 +1,148 @@
+"""
+madame_stage.py
+
+Préparation (pré-staging) du post bonjourmadame quotidien.
+Il fournit :
+- StagedMadame : le message prêt à partir (texte, image déjà téléchargée)
+- stage_madame : récupère, valide et télécharge tout ce qu'il faut avant l'heure de publication
+- stage_until : réessaie le staging jusqu'à réussite, tant qu'il reste du temps avant la publication
+
+Le cog n'a plus qu'un seul `send` à faire à l'heure pile.
+"""
+
+import asyncio
+import datetime
+import io
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from urllib.parse import urlparse
+
+import discord
+from httpx import AsyncClient, HTTPError
+
+from .madame_feed import FeedState, ingest_latest
+from .madame_scraper import make_client
+
+logger = logging.getLogger(__name__)
+
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+
+
+class StagingError(Exception):
+    """La madame du jour n'a pas pu être préparée."""
+
+
+@dataclass
+class StagedMadame:
+    day: datetime.date
+    title: str
+    image_url: str
+    book: str | None = None
+    image: bytes | None = None
+    filename: str = "madame.jpg"
+
+    def content(self, with_url: bool) -> str:
+        lines = [self.title]
+        if with_url:
+            lines.append(self.image_url)
+        if self.book:
+            lines.append(self.book)
+        return "\n".join(lines)
+
+    def to_message_kwargs(self, filesize_limit: int) -> dict:
+        """Arguments de `channel.send` : image en pièce jointe si possible, sinon l'URL."""
+        if self.image is not None and len(self.image) <= filesize_limit:
+            return {
+                "content": self.content(with_url=False),
+                "file": discord.File(io.BytesIO(self.image), filename=self.filename),
+            }
+        return {"content": self.content(with_url=True)}
+
+
+async def download_image(
+    client: AsyncClient, url: str, max_bytes: int = MAX_IMAGE_BYTES
+) -> bytes | None:
+    """Télécharge une image, sans dépasser max_bytes.
+
+    Returns:
+        bytes | None: le contenu de l'image, ou None si ce n'est pas une image ou si elle est
+        trop lourde (on postera alors l'URL).
+    """
+    async with client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        if not resp.headers.get("Content-Type", "").startswith("image/"):
+            logger.warning("madame : %s n'est pas une image", url)
+            return None
+        buffer = bytearray()
+        async for chunk in resp.aiter_bytes():
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                logger.info("madame : image trop lourde (> %d octets), on postera l'URL", max_bytes)
+                return None
+    return bytes(buffer)
+
+
+async def stage_madame(
+    day: datetime.date,
+    state: FeedState,
+    backend: str,
+    excludes: list[str],
+    attach: bool,
+) -> StagedMadame:
+    """Récupère et valide la madame du jour, et télécharge l'image si demandé.
+
+    Args:
+        day (datetime.date): jour de publication
+        state (FeedState): état du flux RSS (requêtes conditionnelles)
+        backend (str): "feed" ou "html"
+        excludes (list[str]): domaines de "book" à ne pas poster
+        attach (bool): télécharger l'image pour l'envoyer en pièce jointe
+
+    Raises:
+        StagingError: pas de madame exploitable
+        httpx.HTTPError: erreur réseau
+    """
+    url, title, book = await ingest_latest(state, backend=backend)
+    if not url:
+        raise StagingError("pas d'image trouvée")
+    if book and any(excl in book for excl in excludes):
+        logger.info("bonjourmadame book was found, but excluded")
+        book = None
+
+    staged = StagedMadame(day=day, title=title or "", image_url=url, book=book)
+    if attach:
+        async with make_client(timeout=20.0) as client:
+            staged.image = await download_image(client, url)
+        staged.filename = PurePosixPath(urlparse(url).path).name or staged.filename
+    return staged
+
+
+async def stage_until(
+    stage: Callable[[], Awaitable[StagedMadame]],
+    deadline: datetime.datetime,
+    retry_delay: float,
+    margin: float,
+) -> StagedMadame | None:
+    """Appelle `stage` jusqu'à réussite, toutes les `retry_delay` secondes.
+
+    Args:
+        stage: le staging à tenter
+        deadline (datetime.datetime): heure de publication (avec fuseau)
+        retry_delay (float): secondes entre deux tentatives
+        margin (float): pas de nouvelle tentative moins de `margin` secondes avant `deadline`
+
+    Returns:
+        StagedMadame | None: la madame prête, ou None si le temps a manqué
+    """
+    while True:
+        try:
+            return await stage()
+        except (HTTPError, StagingError) as e:
+            logger.warning("pré-staging madame échoué : %s", e)
+        remaining = (deadline - datetime.datetime.now(deadline.tzinfo)).total_seconds()
+        if remaining < retry_delay + margin:
+            logger.error("pré-staging madame abandonné, plus le temps avant %s", deadline)
+            return None
+        await asyncio.sleep(retry_delay)
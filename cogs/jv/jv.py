@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+"""JV cog."""
+
+import logging
+import os
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from discord import ButtonStyle, Embed, Interaction
+from discord.ext import commands, tasks
+from discord.ui import Button, View
+
+from .jv_index import ReleaseIndex
+from .jv_scraper import JVClient
+
+logger = logging.getLogger(__name__)
+
+INDEX_REFRESH_HOURS = float(os.getenv("JV_INDEX_REFRESH_HOURS", "3"))
+
+DAY = timedelta(days=1)
+WEEK = timedelta(days=7)
+MONTH = timedelta(days=31)
+QUARTER = timedelta(days=91)
+
+
+def index_age_text(age: float | None) -> str:
+    """Pied de l'embed : ancienneté de l'index des sorties."""
+    if age is None:
+        return ""
+    minutes = int(age // 60)
+    if minutes < 1:
+        return "Sorties mises à jour à l'instant"
+    if minutes < 60:
+        return f"Sorties mises à jour il y a {minutes} min"
+    return f"Sorties mises à jour il y a {minutes // 60} h {minutes % 60:02d}"
+
+
+class ReleaseView(View):
+    """Boutons des sorties : plateforme choisie et index du cog."""
+
+    def __init__(self, index: ReleaseIndex) -> None:
+        super().__init__()
+        self.platform: str | None = None
+        self.index = index
+
+
+class TimeButton(Button[ReleaseView]):
+    """Class for the buttons 'Jour', 'Semaine', 'Mois'"""
+
+    def __init__(self, label: str, row: int, delta: timedelta, embedtitle: str) -> None:
+        """Each button has his own label, row, timedelta and embed title"""
+        super().__init__(label=label, row=row)
+        self.delta = delta
+        self.title = embedtitle
+
+    async def callback(self, interaction: Interaction) -> None:
+        view = self.view
+        if view is None:
+            return
+        platform = view.platform or "Toutes"
+        one_platform = platform != "Toutes"
+
+        # change style to green when clicked
+        self.style = ButtonStyle.green
+        await interaction.response.edit_message(view=view)
+
+        full_title = f"{self.title} sur {platform}" if one_platform else self.title
+        embed = Embed(title=full_title)
+        start = time.perf_counter()
+        today = date.today()
+        games = await view.index.query(platform, today, today + self.delta)
+        logger.debug(
+            "sorties %s %s : %d jeux en %.1f ms",
+            platform,
+            self.label,
+            len(games),
+            (time.perf_counter() - start) * 1000,
+        )
+        for game in games:
+            if game.platforms != "no platform":
+                value = f"{game.release}\n{game.platforms}\n{game.url}"
+            else:
+                value = f"{game.release}\n{game.url}"
+            embed.add_field(name=game.name, value=value, inline=False)
+        embed.set_footer(text=index_age_text(view.index.age(platform)))
+        await interaction.followup.send(embed=embed)
+
+
+class PlatformButton(Button[ReleaseView]):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+    async def callback(self, interaction: Interaction) -> None:
+        # await interraction.response.defer()
+        if self.view is None:
+            return
+        self.view.platform = self.label
+        # change style to green when clicked
+        self.style = ButtonStyle.green
+        await interaction.response.edit_message(view=self.view)
+
+
+class JV(commands.Cog):
+    """Fetch Video games release date."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.client: JVClient | None = None
+        self.index: ReleaseIndex | None = None
+
+    async def cog_load(self) -> None:
+        self.client = JVClient()
+        # au-delà de deux rafraîchissements manqués, un clic reconstruit l'index lui-même
+        self.index = ReleaseIndex(self.client, max_age=2 * INDEX_REFRESH_HOURS * 3600)
+        self.refresh_index.start()
+
+    async def cog_unload(self) -> None:
+        self.refresh_index.cancel()
+        if self.client is not None:
+            await self.client.aclose()
+
+    @tasks.loop(hours=INDEX_REFRESH_HOURS)
+    async def refresh_index(self) -> None:
+        """Reconstruit l'index des sorties en tâche de fond."""
+        if self.index is not None:
+            await self.index.refresh()
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    async def sorties(self, ctx: commands.Context) -> None:
+        """Permet de voir les prochaines sorties."""
+        if self.index is None:  # cog pas encore chargé
+            return
+        await ctx.defer(ephemeral=False)
+
+        view = ReleaseView(self.index)
+
+        platbutton1 = PlatformButton(label="Toutes", row=0)
+        platbutton2 = PlatformButton(label="PS5", row=0)
+        platbutton3 = PlatformButton(label="Xbox", row=0)
+        platbutton4 = PlatformButton(label="Switch", row=0)
+        platbutton5 = PlatformButton(label="PC", row=0)
+
+        button1 = TimeButton(label="Jour", row=1, delta=DAY, embedtitle="Sorties du jour")
+        button2 = TimeButton(label="Semaine", row=1, delta=WEEK, embedtitle="Sorties de la semaine")
+        button3 = TimeButton(label="Mois", row=1, delta=MONTH, embedtitle="Sorties du mois")
+
+        view.add_item(platbutton1)
+        view.add_item(platbutton2)
+        view.add_item(platbutton3)
+        view.add_item(platbutton4)
+        view.add_item(platbutton5)
+        view.add_item(button1)
+        view.add_item(button2)
+        view.add_item(button3)
+
+        await ctx.send(view=view)
+
+
+async def setup(bot):
+    "Add the cog to the bot."
+    await bot.add_cog(JV(bot))
+    logger.info("⚙️ Cog JV added")
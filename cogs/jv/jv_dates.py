@@ -0,0 +1,111 @@
+"""
+jv_dates.py
+
+Dates de sortie des pages jeuxvideo.com ("Sortie: 12 mars 2025", "mars 2025", "2025", "TBA"...).
+Il fournit :
+- parse_release_date : date d'une sortie, ou None si elle est inconnue
+
+Les formats courants sont lus par une expression régulière, mémorisée par chaîne brute ;
+dateparser n'est importé (lentement) qu'au premier format inconnu, en dernier recours.
+Les dates partielles suivent les choix de dateparser : "mars 2025" -> le jour d'aujourd'hui
+en mars 2025, "2025" -> aujourd'hui en 2025.
+"""
+
+import calendar
+import logging
+import re
+import unicodedata
+from datetime import date
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+MONTHS = {
+    "janvier": 1,
+    "fevrier": 2,
+    "mars": 3,
+    "avril": 4,
+    "mai": 5,
+    "juin": 6,
+    "juillet": 7,
+    "aout": 8,
+    "septembre": 9,
+    "octobre": 10,
+    "novembre": 11,
+    "decembre": 12,
+}
+UNKNOWN = {"", "tba", "tbd", "date inconnue", "inconnue", "a venir", "prochainement"}
+
+PREFIX_RE = re.compile(r"^\s*sortie\s*:\s*", re.IGNORECASE)
+DAY_MONTH_YEAR_RE = re.compile(r"^(?:(\d{1,2})(?:er)?\s+)?([a-z]+)\s+(\d{4})$")
+NUMERIC_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+YEAR_RE = re.compile(r"^(\d{4})$")
+
+Parts = tuple[int | None, int | None, int]  # jour, mois, année (None : non précisé)
+
+
+def _fold(text: str) -> str:
+    """Minuscules, sans accents ni espaces superflus."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    return " ".join("".join(c for c in text if not unicodedata.combining(c)).split())
+
+
+def _parse_fast(text: str) -> Parts | None:
+    if m := DAY_MONTH_YEAR_RE.match(text):
+        day, month_name, year = m.groups()
+        if (month := MONTHS.get(month_name)) is None:
+            return None
+        return (int(day) if day else None), month, int(year)
+    if m := NUMERIC_RE.match(text):
+        return int(m[1]), int(m[2]), int(m[3])
+    if m := YEAR_RE.match(text):
+        return None, None, int(m[1])
+    return None
+
+
+@lru_cache(maxsize=1)
+def _dateparser():
+    from dateparser.date import DateDataParser  # ~1 s et des dizaines de Mo : à la demande
+
+    logger.info("📅 dateparser chargé pour une date de sortie inconnue")
+    return DateDataParser(languages=["fr"])
+
+
+def _parse_fallback(raw: str) -> Parts | None:
+    date_obj = _dateparser().get_date_data(raw).date_obj
+    if date_obj is None:
+        return None
+    return date_obj.day, date_obj.month, date_obj.year
+
+
+@lru_cache(maxsize=4096)
+def _parse_parts(raw: str) -> Parts | None:
+    text = _fold(PREFIX_RE.sub("", raw))
+    if text in UNKNOWN:
+        return None
+    if (parts := _parse_fast(text)) is not None:
+        return parts
+    return _parse_fallback(PREFIX_RE.sub("", raw))
+
+
+def parse_release_date(raw: str, today: date | None = None) -> date | None:
+    """Date d'une sortie jeuxvideo.com.
+
+    Args:
+        raw (str): texte de la page, ex. "Sortie: 12 mars 2025"
+        today (date | None): référence des dates partielles (aujourd'hui par défaut)
+
+    Returns:
+        date | None: la date, ou None si elle est inconnue ou invalide
+    """
+    parts = _parse_parts(raw)
+    if parts is None:
+        return None
+    day, month, year = parts
+    today = today or date.today()
+    month = month or today.month
+    try:
+        day = day or min(today.day, calendar.monthrange(year, month)[1])
+        return date(year, month, day)
+    except ValueError:  # "31 février", "12/13/2025"...
+        return None
@@ -0,0 +1,116 @@
+"""
+jv_index.py
+
+Index en mémoire des sorties de jeux, reconstruit périodiquement en tâche de fond.
+Il fournit :
+- PLATFORMS : plateformes proposées par /sorties
+- ReleaseIndex : par plateforme, les jeux du mois courant et du mois suivant triés par date :
+  - refresh / refresh_platform : reconstruction depuis jeuxvideo.com
+  - query : jeux sortant entre deux dates (recherche dichotomique)
+  - age : ancienneté de l'index d'une plateforme
+
+Un clic sur Jour/Semaine/Mois lit l'index au lieu de re-télécharger les pages.
+"""
+
+import asyncio
+import logging
+import time
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+
+from .jv_scraper import JVClient, NewGame, generate_url, next_month
+
+logger = logging.getLogger(__name__)
+
+PLATFORMS = ("Toutes", "PS5", "Xbox", "Switch", "PC")
+
+
+@dataclass
+class PlatformIndex:
+    built: float  # time.monotonic() de la construction
+    month: tuple[int, int]  # (mois, année) courant à la construction
+    dates: list[date]
+    games: list[NewGame]
+
+
+class ReleaseIndex:
+    """
+    Sorties du mois courant et du mois suivant, par plateforme, triées par date.
+
+    Args:
+        client (JVClient): client jeuxvideo.com du cog.
+        max_age (float): au-delà (secondes), l'index d'une plateforme est reconstruit
+            à la demande plutôt que servi.
+    """
+
+    def __init__(self, client: JVClient, max_age: float) -> None:
+        self.client = client
+        self.max_age = max_age
+        self._platforms: dict[str, PlatformIndex] = {}
+        self._locks = {platform: asyncio.Lock() for platform in PLATFORMS}
+
+    def __contains__(self, platform: str) -> bool:
+        return platform in self._platforms
+
+    def age(self, platform: str) -> float | None:
+        """Ancienneté de l'index de `platform`, en secondes (None : pas encore construit)."""
+        index = self._platforms.get(platform)
+        return None if index is None else time.monotonic() - index.built
+
+    def is_fresh(self, platform: str) -> bool:
+        today = date.today()
+        index = self._platforms.get(platform)
+        return (
+            index is not None
+            and index.month == (today.month, today.year)
+            and time.monotonic() - index.built < self.max_age
+        )
+
+    async def _build(self, platform: str) -> None:
+        today = date.today()
+        urls = [
+            generate_url(today.month, today.year, platform=platform),
+            generate_url(*next_month(today.month, today.year), platform=platform),
+        ]
+        months = await asyncio.gather(*(self.client.fetch_month(url) for url in urls))
+        games = sorted((g for month in months for g in month), key=lambda g: g.date)
+        self._platforms[platform] = PlatformIndex(
+            built=time.monotonic(),
+            month=(today.month, today.year),
+            dates=[g.date for g in games],
+            games=games,
+        )
+        logger.info("🎮 index des sorties %s : %d jeux", platform, len(games))
+
+    async def refresh_platform(self, platform: str) -> None:
+        """Reconstruit l'index de `platform` (mois courant et suivant)."""
+        async with self._locks[platform]:
+            await self._build(platform)
+
+    async def refresh(self) -> None:
+        """Reconstruit l'index de toutes les plateformes ; un échec garde l'ancien index."""
+        results = await asyncio.gather(
+            *(self.refresh_platform(p) for p in PLATFORMS), return_exceptions=True
+        )
+        for platform, result in zip(PLATFORMS, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("index des sorties %s non reconstruit : %s", platform, result)
+
+    async def query(self, platform: str, start: date, end: date) -> list[NewGame]:
+        """Jeux de `platform` qui sortent entre `start` et `end` (inclus).
+
+        L'index est reconstruit d'abord s'il manque, est trop vieux ou date du mois dernier ;
+        si la reconstruction échoue, l'ancien index est servi quand il existe.
+        """
+        if not self.is_fresh(platform):
+            async with self._locks[platform]:  # un seul rebuild pour des clics simultanés
+                if not self.is_fresh(platform):
+                    try:
+                        await self._build(platform)
+                    except Exception as e:
+                        if platform not in self._platforms:
+                            raise
+                        logger.warning("index des sorties %s périmé servi : %s", platform, e)
+        index = self._platforms[platform]
+        return index.games[bisect_left(index.dates, start) : bisect_right(index.dates, end)]
@@ -0,0 +1,245 @@
+"""
+jv_scraper.py
+
+Récupération des dates de sortie de jeux sur jeuxvideo.com.
+Il fournit :
+- NewGame : un jeu (nom, date de sortie, plateformes, lien)
+- generate_url / next_month : pages mensuelles des sorties, par plateforme
+- extract_rows / parse_page : jeux et liens de pagination d'une page (selectolax)
+- JVClient : client HTTP partagé (créé une fois par cog) avec :
+  - mémo des pages déjà téléchargées (même mois, même plateforme), pour PAGE_TTL secondes
+  - pagination téléchargée en parallèle dès que les liens des pages sont connus
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import date
+from urllib.parse import urljoin
+
+import httpx
+from selectolax.parser import HTMLParser, Node
+
+from .jv_dates import parse_release_date
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = "https://www.jeuxvideo.com"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36",  # noqa: E501
+}
+PAGE_TTL = float(os.getenv("JV_PAGE_TTL", "1800"))  # durée de vie d'une page mémorisée
+MAX_CONCURRENT_PAGES = 4  # pages téléchargées en même temps au plus
+HTTP_TIMEOUT = 15.0
+
+UNKNOWN_DATE = date(year=3000, month=1, day=1)  # TBA : après toutes les autres sorties
+
+
+class NewGame:
+    """Class for keeping informations on a game, such as name, release date, etc..."""
+
+    __slots__ = ("name", "release", "platforms", "url", "date")
+
+    def __init__(self, name: str, release: str, platforms: str, part_url: str | None) -> None:
+        self.name = name
+        self.release = release
+        self.platforms = platforms
+        self.url = urljoin(BASE_URL, part_url or "")
+        self.date = parse_release_date(self.release) or UNKNOWN_DATE
+
+    def __str__(self) -> str:
+        return f"{self.name}\n{self.release}\n{self.platforms}\n{self.url}\n{self.date}\n----------"
+
+
+def _unbloat_title(title: Node | None) -> None:
+    if title is not None and (em := title.css_first("em")) is not None:
+        em.decompose()  # remove some bloats
+
+
+def find_next_page(tag: Node | None) -> tuple[bool, str]:
+    """Find if there is a button "next page".
+
+    Args:
+        tag (Node | None): bloc de pagination
+
+    Returns:
+        bool, str: if found, then give the url for next page
+    """
+    if tag is not None and (nextpage := tag.css_first("a[class*='page']")) is not None:
+        return True, urljoin(BASE_URL, nextpage.attributes.get("href"))
+    return False, ""
+
+
+def find_page_urls(tag: Node | None) -> list[str]:
+    """Toutes les pages liées par la pagination, dans l'ordre, sans doublon."""
+    if tag is None:
+        return []
+    hrefs = (a.attributes.get("href") for a in tag.css("a[class*='page']"))
+    return list(dict.fromkeys(urljoin(BASE_URL, href) for href in hrefs if href))
+
+
+def generate_url(month: int, year: int, platform: str | None = None) -> str:
+    """generate JV url
+
+    Args:
+        month (int):
+        year (int):
+        platform (str | None): "Toutes", "PC", "PS5", "Switch" ou "Xbox"
+
+    Returns:
+        str: url
+
+    Raises:
+        ValueError: plateforme inconnue
+    """
+    french_months = [
+        "janvier",
+        "fevrier",
+        "mars",
+        "avril",
+        "mai",
+        "juin",
+        "juillet",
+        "aout",
+        "septembre",
+        "octobre",
+        "novembre",
+        "decembre",
+    ]
+    french_m = french_months[month - 1]
+    logger.debug("generate_url - platform: %s", platform)
+    if platform == "PC":
+        return f"https://www.jeuxvideo.com/sorties/dates-de-sortie-pc-{french_m}-{year}-date.htm"
+    elif platform == "PS5":
+        return f"https://www.jeuxvideo.com/sorties/dates-de-sortie-ps5-playstation-5-{french_m}-{year}-date.htm"
+    elif platform == "Switch":
+        return f"https://www.jeuxvideo.com/sorties/dates-de-sortie-switch-nintendo-switch-{french_m}-{year}-date.htm"
+    elif platform == "Xbox":
+        return f"https://www.jeuxvideo.com/sorties/dates-de-sortie-xbox-series-{french_m}-{year}-date.htm"
+    elif platform == "Toutes":
+        return f"https://www.jeuxvideo.com/sorties/dates-de-sortie-{french_m}-{year}-date.htm"
+    else:
+        raise ValueError(f"plateforme inconnue : {platform}")
+
+
+def next_month(month: int, year: int) -> tuple[int, int]:
+    """Return a tuple of month and year for next month.
+
+    Args:
+        month(int): current month
+        year(int): current year
+
+    Returns:
+        (int, int): next month tuple of month and year
+    """
+    return (month + 1, year) if month != 12 else (1, year + 1)
+
+
+Row = tuple[str, str, str, str | None]  # nom, sortie, plateformes, lien relatif
+
+
+def extract_rows(html: str) -> tuple[list[Row], list[str]]:
+    """Lignes brutes d'une page de sorties, et urls des pages liées par la pagination.
+
+    Args:
+        html (str): page des sorties du mois
+
+    Returns:
+        tuple[list[Row], list[str]]: (nom, sortie, plateformes, lien) par jeu, urls de pagination
+    """
+    tree = HTMLParser(html)
+    pages = find_page_urls(tree.css_first("div[class*='pagination']"))
+
+    rows: list[Row] = []
+    for sortie in tree.css("div[class*='gameMetadatas']"):
+        title_tag = sortie.css_first("a[class*='gameTitleLink']")
+        date_tag = sortie.css_first("span[class*='releaseDate']")
+        if title_tag is None or date_tag is None:
+            continue
+        _unbloat_title(title_tag)
+        title = title_tag.text()
+        _date = date_tag.text()
+        if (tmp := sortie.css_first("div[class*='platforms']")) is not None:
+            platform = f"Plateformes :\t {tmp.text()}"
+        else:
+            platform = "no platform"
+        link = sortie.css_first("div > span > h2 > a")
+        part = link.attributes.get("href") if link is not None else None
+        rows.append((title, _date, platform, part))
+    return rows, pages
+
+
+def parse_page(html: str) -> tuple[list[NewGame], list[str]]:
+    """Jeux d'une page de sorties, et urls des pages liées par la pagination."""
+    rows, pages = extract_rows(html)
+    return [NewGame(*row) for row in rows], pages
+
+
+class JVClient:
+    """
+    Client jeuxvideo.com, à créer une fois et à fermer avec `aclose()`.
+
+    Args:
+        client (httpx.AsyncClient | None): client HTTP à utiliser (tests), sinon un client dédié.
+        ttl (float): durée pendant laquelle une page téléchargée est réutilisée.
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None, ttl: float = PAGE_TTL) -> None:
+        self._client = client or httpx.AsyncClient(
+            headers=HEADERS, timeout=HTTP_TIMEOUT, follow_redirects=True
+        )
+        self.ttl = ttl
+        self.fetched = 0  # pages réellement téléchargées
+        self._pages: dict[str, tuple[float, asyncio.Task]] = {}
+        self._limit = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def aclose(self) -> None:
+        for _, task in self._pages.values():
+            task.cancel()
+        self._pages.clear()
+        await self._client.aclose()
+
+    async def _download(self, url: str) -> tuple[list[NewGame], list[str]]:
+        async with self._limit:
+            resp = await self._client.get(url)
+            resp.raise_for_status()
+            self.fetched += 1
+        return parse_page(resp.text)
+
+    async def fetch_page(self, url: str) -> tuple[list[NewGame], list[str]]:
+        """Jeux et pagination d'une page, depuis le mémo si elle est assez récente.
+
+        Deux demandes simultanées de la même page partagent le même téléchargement.
+        """
+        now = time.monotonic()
+        for key in [k for k, (t, _) in self._pages.items() if now - t >= self.ttl]:
+            del self._pages[key]
+        if url not in self._pages:
+            self._pages[url] = (now, asyncio.create_task(self._download(url)))
+        task = self._pages[url][1]
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._pages.get(url, (None, None))[1] is task:
+                del self._pages[url]  # pas de mémo pour un échec
+            raise
+
+    async def fetch_month(self, url: str) -> list[NewGame]:
+        """Fetch all games in a month, even if there are several pages."""
+        logger.debug("fetch_month url : %s", url)
+        first_games, links = await self.fetch_page(url)
+        games = list(first_games)  # la liste du mémo est partagée : ne pas l'étendre
+        seen = {url}
+        frontier = [link for link in links if link not in seen]
+        while frontier:
+            seen.update(frontier)
+            pages = await asyncio.gather(*(self.fetch_page(link) for link in frontier))
+            frontier = []
+            for page_games, page_links in pages:
+                games += page_games
+                frontier += [link for link in page_links if link not in seen]
+            frontier = list(dict.fromkeys(frontier))
+        # la page 1 peut revenir sous une autre url (?p=1) : pas de doublon
+        unique = {(game.name, game.release, game.url): game for game in games}
+        return list(unique.values())
@@ -0,0 +1,638 @@
+"""Lemonde -> PDF cog."""
+
+import asyncio
+import contextlib
+import io
+import logging
+import os
+import tempfile
+import time
+from functools import partial
+from pathlib import Path
+from typing import Literal
+
+from discord import (
+    ButtonStyle,
+    Embed,
+    File,
+    HTTPException,
+    Interaction,
+    Message,
+    app_commands,
+    utils,
+)
+from discord.ext import commands  # noqa: F401
+from discord.ui import Button, View, button
+
+from utils.decorators import async_retry
+from utils.monitoring import get_ram_usage_mb
+
+from .lemonde_cache import ArticleCache, canonical_article_id
+from .lemonde_compress import PROFILES, compress_all, compress_pdf
+from .lemonde_delivery import deliver_pdfs, join_lines
+from .lemonde_flight import Flight, SingleFlight
+from .lemonde_models import ArticlePdf
+from .lemonde_pool import RenderPool
+from .lemonde_prerender import (
+    PRERENDER_CHANNELS,
+    PrerenderStats,
+    find_article_urls,
+    memory_pressure,
+)
+from .lemonde_queue import (
+    PRIORITY_SPECULATIVE,
+    PRIORITY_USER,
+    AdmissionError,
+    QueueFullError,
+    RenderQueue,
+    UserLimitError,
+)
+from .lemonde_render import get_article, render_to_dir
+from .lemonde_session import LeMondeSession
+from .lemonde_text import (
+    fetch_article_text,
+    make_text_client,
+    paginate,
+    split_image,
+)
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+# logger.addHandler(logging.StreamHandler())
+
+
+# Retry
+TRIES = 3
+DELAY = 2
+MAX_DELAY = 10
+BACKOFF = 1.2
+# JITTER = 0
+JITTER = (0, 1)
+
+# Cache des PDFs
+CACHE_DIR = Path(os.getenv("LM_CACHE_DIR", Path(tempfile.gettempdir()) / "gourgandin_lemonde"))
+CACHE_MAX_BYTES = int(os.getenv("LM_CACHE_MAX_MB", "200")) * 1024 * 1024
+CACHE_TTL = float(os.getenv("LM_CACHE_TTL_HOURS", "24")) * 3600
+
+# Pool de processus de rendu (0 = rendu dans le processus du bot)
+WORKERS = int(os.getenv("LM_WORKERS", "1"))
+WORKER_MAX_JOBS = int(os.getenv("LM_WORKER_MAX_JOBS", "10"))
+# RLIMIT_AS : espace d'adressage virtuel (bibliothèques partagées comprises), pas le RSS ;
+# un simple garde-fou contre un rendu qui s'emballe, la RAM est bornée par WORKER_MAX_RSS_MB
+WORKER_MEM_MB = int(os.getenv("LM_WORKER_MEM_MB", "1024"))
+WORKER_MAX_RSS_MB = float(os.getenv("LM_WORKER_MAX_RSS_MB", "128"))  # VM de 256 Mo
+WORKER_JOB_TIMEOUT = float(os.getenv("LM_WORKER_JOB_TIMEOUT", "180"))
+
+# File d'attente des rendus
+QUEUE_WORKERS = int(os.getenv("LM_QUEUE_WORKERS", str(max(WORKERS, 1))))
+QUEUE_MAX = int(os.getenv("LM_QUEUE_MAX", "10"))
+QUEUE_PER_USER = int(os.getenv("LM_QUEUE_PER_USER", "2"))
+
+# Mode texte
+TEXT_PAGE_CHARS = 3900  # description d'embed : 4096 max
+TEXT_PAGER_TIMEOUT = 900  # secondes pendant lesquelles les boutons de page répondent
+
+# Plusieurs articles d'un coup
+BATCH_MAX = int(os.getenv("LM_BATCH_MAX", "10"))
+
+
+def oversized_notice(article: ArticlePdf, size_limit: int) -> str:
+    """Message pour un PDF plus lourd que la limite d'upload du serveur."""
+    return (
+        f"📦 `{article.path.name}` ({article.size / (1024 * 1024):.1f} MB) dépasse la limite "
+        f"d'envoi de ce serveur ({size_limit / (1024 * 1024):.0f} MB)."
+    )
+
+
+class TextPager(View):
+    """Article en mode texte : un seul message, feuilleté avec ◀️ / ▶️."""
+
+    def __init__(self, pages: list[str], url: str, image_url: str | None) -> None:
+        super().__init__(timeout=TEXT_PAGER_TIMEOUT)
+        self.pages = pages
+        self.url = url
+        self.image_url = image_url
+        self.index = 0
+        self.message: Message | None = None
+        self._sync_buttons()
+
+    def embed(self) -> Embed:
+        embed = Embed(description=self.pages[self.index], url=self.url)
+        if self.index == 0 and self.image_url:
+            embed.set_image(url=self.image_url)
+        embed.set_footer(text=f"Page {self.index + 1}/{len(self.pages)}")
+        return embed
+
+    def _sync_buttons(self) -> None:
+        self.previous_page.disabled = self.index == 0
+        self.next_page.disabled = self.index == len(self.pages) - 1
+
+    async def _show(self, interaction: Interaction, index: int) -> None:
+        self.index = index
+        self._sync_buttons()
+        await interaction.response.edit_message(embed=self.embed(), view=self)
+
+    @button(emoji="◀️", style=ButtonStyle.secondary)
+    async def previous_page(self, interaction: Interaction, _: Button) -> None:
+        await self._show(interaction, self.index - 1)
+
+    @button(emoji="▶️", style=ButtonStyle.secondary)
+    async def next_page(self, interaction: Interaction, _: Button) -> None:
+        await self._show(interaction, self.index + 1)
+
+    async def on_timeout(self) -> None:
+        if self.message is not None:
+            with contextlib.suppress(HTTPException):
+                await self.message.edit(view=None)
+
+
+class LeMonde(commands.Cog):
+    """LeMonde commands"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.cache = ArticleCache(CACHE_DIR, max_bytes=CACHE_MAX_BYTES, ttl=CACHE_TTL)
+        self.flights = SingleFlight()
+        # session du bot (rendu sans pool) ; chaque worker du pool a la sienne,
+        # elles partagent le fichier de cookies
+        self.session = LeMondeSession()
+        self.pool: RenderPool | None = None
+        if WORKERS > 0:
+            self.pool = RenderPool(
+                size=WORKERS,
+                max_jobs=WORKER_MAX_JOBS,
+                mem_mb=WORKER_MEM_MB,
+                job_timeout=WORKER_JOB_TIMEOUT,
+                max_rss_mb=WORKER_MAX_RSS_MB,
+            )
+        self.queue = RenderQueue(
+            workers=QUEUE_WORKERS,
+            max_pending=QUEUE_MAX,
+            per_user=QUEUE_PER_USER,
+            pressure=memory_pressure,
+        )
+        self.prerender = PrerenderStats()
+        self.text_client = make_text_client()
+        self._prerender_tasks: set[asyncio.Task] = set()
+
+    async def cog_load(self) -> None:
+        self.queue.start()
+
+    async def cog_unload(self) -> None:
+        for task in self._prerender_tasks:
+            task.cancel()
+        await self.queue.close()
+        if self.pool is not None:
+            await self.pool.close()
+        await self.session.close()
+        await self.text_client.aclose()
+
+    async def _render_to_dir(self, url: str, out_dir: Path) -> list[ArticlePdf]:
+        """Rendu dans un worker si le pool est actif, sinon dans le processus du bot."""
+        before = get_ram_usage_mb()
+        if self.pool is not None:
+            articles = await self.pool.render(url, out_dir)
+        else:
+            articles = await render_to_dir(url, out_dir, session=self.session)
+        after = get_ram_usage_mb()
+        logger.info(
+            "RAM du bot : %.1f MB (delta: %.1f MB), latence gateway : %.0f ms",
+            after,
+            after - before,
+            self.bot.latency * 1000,
+        )
+        return articles
+
+    async def _render(
+        self,
+        key: str,
+        url: str,
+        user_id: int,
+        flight: Flight,
+        priority: int = PRIORITY_USER,
+    ) -> list[ArticlePdf]:
+        """Rendu (avec retry) partagé par toutes les demandes du même article.
+
+        Le rendu passe par la file d'attente, au nom du premier demandeur
+        (ou en priorité basse pour un pré-rendu).
+        Les messages de retry et la position dans la file sont diffusés à chaque
+        demandeur via `flight.emit`.
+        """
+        if priority == PRIORITY_SPECULATIVE and flight.owner is not None:
+            # un utilisateur a rejoint le pré-rendu avant sa mise en file : c'est son rendu
+            user_id, priority = flight.owner, PRIORITY_USER
+
+        # --- FONCTION UTILITAIRE AVEC RETRY ---
+        @async_retry(
+            tries=TRIES,
+            delay=DELAY,
+            max_delay=MAX_DELAY,
+            backoff=BACKOFF,
+            jitter=JITTER,
+            exceptions=(asyncio.exceptions.TimeoutError,),
+            on_retry=partial(flight.emit, "on_retry"),
+        )
+        # async def retry_get_article(url, mobile, dark_mode):
+        #     return await get_article(url=url, mobile=mobile, dark_mode=dark_mode)
+        async def retry_get_article(url: str) -> list[ArticlePdf]:
+            with tempfile.TemporaryDirectory(prefix="lemonde_") as tmp:
+                articles = await self._render_to_dir(url, Path(tmp))
+                articles = await compress_all(articles)
+                # les PDFs sont déplacés dans le cache avant la suppression du dossier
+                return self.cache.put(key, articles)
+
+        # my_article: MyArticle = await retry_get_article(
+        #     url=url, mobile=mobile, dark_mode=dark_mode
+        # )
+        articles: list[ArticlePdf] = await self.queue.submit(
+            partial(retry_get_article, url=url),
+            user_id=user_id,
+            on_position=partial(flight.emit, "on_position"),
+            priority=priority,
+            key=key,
+        )
+        logger.info("PDFs généré avec succès (%d en attente)", flight.waiters)
+        return articles
+
+    async def _claim_prerender(self, key: str, user_id: int) -> None:
+        """Un utilisateur rejoint un pré-rendu : il passe en priorité utilisateur.
+
+        Qu'il soit déjà en file, déjà en cours ou pas encore soumis, il ne peut plus être
+        abandonné ni interrompu.
+        """
+        flight = self.flights.get(key)
+        if flight is not None and flight.owner is None:
+            flight.owner = user_id
+        await self.queue.promote(key)
+
+    async def _prerender(self, key: str, url: str) -> None:
+        """Rendu spéculatif en arrière-plan : rien n'est envoyé, le PDF attend dans le cache."""
+        self.prerender.record_start(key)
+        ok = False
+        try:
+            await self.flights.run(
+                key, partial(self._render, key, url, 0, priority=PRIORITY_SPECULATIVE)
+            )
+            ok = True
+            logger.info("🔮 article pré-rendu : %s", url)
+        except Exception as e:
+            logger.info("🔮 pré-rendu abandonné pour %s : %s", url, e)
+        finally:
+            self.prerender.record_end(key, ok)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: Message) -> None:
+        """Pré-rend les articles du Monde postés dans les salons LM_PRERENDER_CHANNELS."""
+        if message.author.bot or message.channel.id not in PRERENDER_CHANNELS:
+            return
+        for url in find_article_urls(message.content):
+            key = canonical_article_id(url)
+            if key in self.cache or key in self.flights:
+                continue
+            if memory_pressure():
+                self.queue.drop_speculative("mémoire")
+                return
+            try:
+                self.queue.check_admission(0, PRIORITY_SPECULATIVE)
+            except AdmissionError:
+                return
+            task = asyncio.create_task(self._prerender(key, url))
+            self._prerender_tasks.add(task)
+            task.add_done_callback(self._prerender_tasks.discard)
+
+    async def _render_text(self, key: str, url: str, flight: Flight) -> tuple[str, str | None]:
+        """Article en Markdown (sans PDF), mis en cache seulement s'il est complet.
+
+        Returns:
+            tuple[str, str | None]: le Markdown, et un avertissement s'il est partiel.
+        """
+        article, warning = await fetch_article_text(self.text_client, url)
+        markdown = article.to_markdown()
+        if warning is not None:  # tronqué par le paywall : pas de cache
+            return markdown, warning
+        self.cache.put_text(key, markdown)
+        return markdown, None
+
+    async def _lemonde_text(self, interaction: Interaction, url: str, as_file: bool) -> None:
+        """/lemonde en mode texte : un embed feuilletable, ou fichier Markdown."""
+        key = canonical_article_id(url)
+        start = time.perf_counter()
+        cached = self.cache.get_text(key)
+        try:
+            if cached is not None:
+                markdown, warning = cached, None
+            else:
+                # clé de flight distincte : un rendu PDF du même article peut tourner en même temps
+                markdown, warning = await self.flights.run(
+                    f"{key}:text", partial(self._render_text, key, url)
+                )
+        except Exception as exc:
+            logger.error("Mode texte échoué pour %s : %s", url, exc)
+            await interaction.followup.send("❌ Impossible de récupérer le texte de l’article.")
+            return
+
+        filename = f"{key.replace(':', '_')}.md"
+        body, image_url = split_image(markdown)
+        if as_file:
+            data = io.BytesIO(markdown.encode("utf-8"))
+            await interaction.followup.send(file=File(data, filename=filename))
+        else:
+            pager = TextPager(paginate(body, TEXT_PAGE_CHARS), url, image_url)
+            if len(pager.pages) == 1:
+                await interaction.followup.send(embed=pager.embed())
+            else:
+                pager.message = await interaction.followup.send(
+                    embed=pager.embed(), view=pager, wait=True
+                )
+        if warning:
+            await interaction.followup.send(warning)
+        logger.info(
+            "📰 mode texte servi en %.2fs (cache=%s)", time.perf_counter() - start, bool(cached)
+        )
+
+    async def _send_oversized(
+        self, interaction: Interaction, article: ArticlePdf, size_limit: int
+    ) -> None:
+        """PDF trop lourd : on tente une version très compressée, sinon un simple message."""
+        with tempfile.TemporaryDirectory(prefix="lemonde_small_") as tmp:
+            result = await compress_pdf(
+                article, PROFILES["minimal"], dest=Path(tmp) / article.path.name
+            )
+            if result.after <= size_limit:
+                logger.info("📦 %s envoyé en version compressée", article.path.name)
+                await deliver_pdfs(interaction.followup.send, [result.article], size_limit)
+                return
+        await interaction.followup.send(oversized_notice(article, size_limit))
+
+    @app_commands.command(name="lemonde", description="Télécharge un article du Monde")
+    @app_commands.describe(
+        url="URL de l'article à télécharger",
+        rendu="PDF, texte dans Discord, ou fichier Markdown",
+        # mode="Choisir mobile et/ou dark theme",
+    )
+    async def lemonde(
+        self,
+        interaction: Interaction,
+        url: str,
+        rendu: Literal["PDF", "Texte", "Markdown"] = "PDF",
+        # mode: Literal[
+        #     "Normal Clair", "Normal Dark", "Mobile Clair", "Mobile Dark"
+        # ] = "Normal Clair",
+    ) -> None:
+        """
+        Télécharge un article depuis Lemonde.fr et l'affiche dans Discord.
+
+        Args:
+            interaction(discord.Interaction): L'interaction Discord.
+            url (str): Lien vers l'article.
+            rendu (Literal["PDF", "Texte", "Markdown"]): PDF, ou texte seul (rapide).
+            mobile (Literal["Oui", "Non"]): Mode mobile.
+            dark_mode (Literal["Oui", "Non"]): Mode sombre.
+
+        Comportement :
+            - Affiche les paramètres reçus dans un message de suivi.
+            - Tente de récupérer l'article avec plusieurs essais en cas de timeout.
+            - Utilise `to_bool()` pour convertir les paramètres en booléens.
+        """
+
+        # --- CALLBACK POUR LE RETRY ---
+        async def retry_callback(attempt, delay, exc):
+            await interaction.followup.send(
+                f"Tentative {attempt} échouée — nouvel essai dans {delay:.2f}s…",
+                delete_after=delay + 1.9,
+            )  # type: ignore[call-overload]
+
+        # --- CALLBACK POUR LA FILE D'ATTENTE ---
+        async def position_callback(position: int, eta: float) -> None:
+            if position == 0:
+                await msg_wait.edit(content="⏳ Traitement en cours…")
+            else:
+                await msg_wait.edit(
+                    content=f"⏳ En file d'attente : position {position} (≈ {eta:.0f}s)"
+                )
+
+        # --- PARAMÈTRES ---
+        # mobile = "Mobile" in mode
+        # dark_mode = "Dark" in mode
+
+        await interaction.response.defer(ephemeral=False)
+
+        logger.info("Commande /lemonde appelée avec url=%s", url)
+
+        await interaction.followup.send(
+            # f"📄 Article: {url}\n📱 Mobile: {mobile}\n🌙 Mode sombre: {dark_mode}"
+            f"📄 Article: {url}"
+        )
+
+        if rendu != "PDF":
+            await self._lemonde_text(interaction, url, as_file=rendu == "Markdown")
+            return
+
+        msg_wait: Message = await interaction.followup.send("⏳ Traitement en cours…")  # type: ignore[func-returns-value,assignment]  # noqa: E501
+
+        # --- CACHE ---
+        key = canonical_article_id(url)
+        articles: list[ArticlePdf] | None = self.cache.get(key)
+        if self.prerender.record_hit(key):
+            logger.info("🔮 article déjà pré-rendu : %s", key)
+            await self._claim_prerender(key, interaction.user.id)
+
+        # --- APPEL AVEC RETRY (un seul rendu par article, partagé) ---
+        if articles is None:
+            try:
+                if key not in self.flights:  # un nouveau rendu : admission dans la file
+                    self.queue.check_admission(interaction.user.id)
+                articles = await self.flights.run(
+                    key,
+                    partial(self._render, key, url, interaction.user.id),
+                    on_retry=retry_callback,
+                    on_position=position_callback,
+                )
+            except QueueFullError:
+                logger.warning("file lemonde pleine, %s refusé", url)
+                await msg_wait.edit(
+                    content="🚦 Trop d'articles en attente, réessayez dans quelques minutes."
+                )
+                return
+            except UserLimitError:
+                await msg_wait.edit(
+                    content=f"🚦 Vous avez déjà {QUEUE_PER_USER} articles en cours, "
+                    "patientez avant d'en demander un autre."
+                )
+                return
+            except Exception as exc:
+                logger.error(f"Erreur fatale: {exc}")
+                await interaction.followup.send(
+                    "❌ Impossible de récupérer l’article après plusieurs tentatives."
+                )
+                await msg_wait.delete()
+                return
+
+        # --- ENVOI DU PDF ---
+        # Les fichiers appartiennent au cache : envoyés depuis leur fichier, jamais supprimés
+        size_limit = (
+            interaction.guild.filesize_limit
+            if interaction.guild
+            else utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+        )
+        try:
+            report = await deliver_pdfs(interaction.followup.send, articles, size_limit)
+            for article in report.oversized:
+                await self._send_oversized(interaction, article, size_limit)
+            for my_article in articles:
+                if my_article.warning:
+                    await interaction.followup.send(my_article.warning)
+        except (TypeError, FileNotFoundError, HTTPException) as e:
+            logger.error("Envoi des PDFs échoué : %s", e)
+            await interaction.followup.send("Echec de la commande. Réessayez peut-être.")
+        finally:
+            await msg_wait.delete()
+            logger.info("------------------")
+
+    async def _batch_one(
+        self, url: str, user_id: int, semaphore: asyncio.Semaphore
+    ) -> list[ArticlePdf]:
+        """Un article d'un lot : cache, sinon rendu partagé (au plus `semaphore` à la fois)."""
+        key = canonical_article_id(url)
+        if self.prerender.record_hit(key):
+            await self._claim_prerender(key, user_id)
+        articles = self.cache.get(key)
+        if articles is not None:
+            return articles
+        async with semaphore:
+            return await self.flights.run(key, partial(self._render, key, url, user_id))
+
+    @app_commands.command(
+        name="lemonde_lot", description="Télécharge plusieurs articles du Monde d'un coup"
+    )
+    @app_commands.describe(urls="URLs des articles, séparées par des espaces")
+    async def lemonde_lot(self, interaction: Interaction, urls: str) -> None:
+        """
+        Télécharge plusieurs articles et les envoie regroupés dans le moins de messages possible.
+
+        Les articles passent par la même file que /lemonde, au plus LM_QUEUE_PER_USER à la
+        fois pour ce lot ; un article en échec n'empêche pas l'envoi des autres.
+
+        Args:
+            interaction(discord.Interaction): L'interaction Discord.
+            urls (str): Liens vers les articles.
+        """
+        await interaction.response.defer(ephemeral=False)
+        # variantes d'une même URL (AMP, mobile…) : un seul rendu et un seul envoi
+        by_key: dict[str, str] = {}
+        for url in find_article_urls(urls, limit=BATCH_MAX):
+            by_key.setdefault(canonical_article_id(url), url)
+        article_urls = list(by_key.values())
+        logger.info("Commande /lemonde_lot appelée avec %d articles", len(article_urls))
+        if not article_urls:
+            await interaction.followup.send("❌ Aucun lien d'article du Monde trouvé.")
+            return
+
+        msg_wait: Message = await interaction.followup.send(  # type: ignore[func-returns-value,assignment]  # noqa: E501
+            f"⏳ Traitement de {len(article_urls)} articles…"
+        )
+        ready = 0
+
+        async def track(coro):
+            nonlocal ready
+            try:
+                return await coro
+            finally:
+                ready += 1
+                # la progression est facultative : un échec d'edit ne fait pas échouer l'article
+                with contextlib.suppress(HTTPException):
+                    await msg_wait.edit(content=f"⏳ {ready}/{len(article_urls)} articles traités…")
+
+        semaphore = asyncio.Semaphore(QUEUE_PER_USER)
+        results = await asyncio.gather(
+            *(track(self._batch_one(url, interaction.user.id, semaphore)) for url in article_urls),
+            return_exceptions=True,
+        )
+
+        articles: list[ArticlePdf] = []
+        failures: list[str] = []
+        for url, result in zip(article_urls, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error("lot lemonde : %s en échec : %r", url, result)
+                if isinstance(result, QueueFullError):
+                    reason = "file d'attente pleine"
+                elif isinstance(result, UserLimitError):
+                    reason = f"déjà {QUEUE_PER_USER} articles en cours pour vous"
+                elif isinstance(result, TimeoutError):
+                    reason = "délai dépassé"
+                else:
+                    reason = "échec du rendu"
+                failures.append(f"❌ <{url}> : {reason}")
+            else:
+                articles.extend(result)
+
+        size_limit = (
+            interaction.guild.filesize_limit
+            if interaction.guild
+            else utils.DEFAULT_FILE_SIZE_LIMIT_BYTES
+        )
+        try:
+            report = await deliver_pdfs(interaction.followup.send, articles, size_limit)
+            for article in report.oversized:
+                await self._send_oversized(interaction, article, size_limit)
+            warnings = [article.warning for article in articles if article.warning]
+            summary = [f"📚 {len(article_urls) - len(failures)}/{len(article_urls)} articles"]
+            await interaction.followup.send(join_lines(summary + failures + warnings))
+        except (TypeError, FileNotFoundError, HTTPException) as e:
+            logger.error("Envoi du lot échoué : %s", e)
+            await interaction.followup.send("Echec de la commande. Réessayez peut-être.")
+        finally:
+            await msg_wait.delete()
+            logger.info("------------------")
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    @commands.has_any_role("modo", "Admin")
+    async def lemonde_stats(self, ctx: commands.Context) -> None:
+        """Statistiques de la file de rendu Le Monde (attente, rendu, profondeur)."""
+        await ctx.send(
+            f"📊 File lemonde : {self.queue.depth} en attente, "
+            f"{QUEUE_WORKERS} rendus simultanés\n{self.queue.stats.summary()}\n"
+            f"{self.prerender.summary()}"
+        )
+
+
+async def setup(bot):
+    """
+    Sets up the LeMonde cog for the provided Discord bot instance.
+
+    This asynchronous function adds the LeMonde cog to the bot and logs a message
+    indicating the successful addition of the cog.
+
+    Args:
+        bot: The Discord bot instance to which the cog will be added.
+
+    Returns:
+        None
+    """
+    await bot.add_cog(LeMonde(bot))
+    logger.info("⚙️ Cog LeMonde added")
+
+
+# TESTING
+if __name__ == "__main__":  # python -m cogs.lemonde.lemonde from root folder
+    # Testing lemonde pdf
+    import sys
+
+    from dotenv import load_dotenv
+
+    # Parse a .env file and then load all the variables found as environment variables.
+    load_dotenv()
+
+    logging.basicConfig(level=logging.DEBUG)
+
+    # URL = "https://www.lemonde.fr/international/article/2024/10/03/face-a-l-iran-la-france-se-range-derriere-israel_6342763_3210.html"
+    URL = "https://www.lemonde.fr/societe/article/2024/10/05/proces-des-viols-de-mazan-le-huis-clos-leve-les-accuses-maintiennent-leur-version-apres-le-visionnage-des-videos_6344040_3224.html"
+    # URL = "https://www.lemonde.fr/les-decodeurs/article/2025/09/25/condamnation-de-nicolas-sarkozy-la-chronologie-complete-de-l-affaire-du-financement-libyen_6482596_4355771.html"
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+    try:
+        asyncio.run(get_article(URL))
+    except OSError as e:
+        logger.error("Erreur OSError")
+        logger.error(e)
@@ -0,0 +1,197 @@
+"""
+lemonde_cache.py
+
+Cache disque des PDFs et des textes générés par /lemonde.
+Il fournit :
+- canonical_article_id : identifiant canonique d'un article à partir de son URL
+- ArticleCache : cache adressé par identifiant, avec TTL, taille max et éviction LRU :
+  - get / put : les PDFs d'un article
+  - get_text / put_text : son texte Markdown (mode texte)
+
+Chaque entrée est un dossier (nommé par le hash du type et de l'identifiant) qui contient
+les fichiers et un `meta.json` (date de création, fichiers, avertissements, et type
+"text" pour un texte). Les deux types d'un même article sont deux entrées distinctes.
+La date de modification de `meta.json` sert de date de dernier accès pour l'éviction LRU.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .lemonde_models import ArticlePdf
+
+logger = logging.getLogger(__name__)
+
+META = "meta.json"
+TEXT_FILE = "article.md"
+KIND_PDF = "pdf"
+KIND_TEXT = "text"
+
+# .../article/2024/10/05/titre-de-l-article_6344040_3224.html -> 6344040
+ARTICLE_ID_RE = re.compile(r"_(\d+)_\d+\.html$")
+HOST_PREFIXES = ("www.", "m.", "amp.")
+
+
+def canonical_article_id(url: str) -> str:
+    """
+    Identifiant canonique d'un article du Monde.
+
+    Les query strings et fragments sont ignorés, les variantes AMP ou mobile
+    pointent vers le même article.
+
+    Example:
+        canonical_article_id("https://www.lemonde.fr/amp/societe/article/2024/10/05/x_6344040_3224.html?utm=1")
+        # → "lemonde:6344040"
+    """  # noqa: E501
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in HOST_PREFIXES:
+        host = host.removeprefix(prefix)
+    path = re.sub(r"^/amp(?=/)", "", parts.path).removesuffix("/amp/").rstrip("/")
+
+    if m := ARTICLE_ID_RE.search(path):
+        return f"lemonde:{m.group(1)}"
+    return f"{host}{path}"
+
+
+class ArticleCache:
+    """
+    Cache des PDFs et des textes d'articles, sur disque.
+
+    Args:
+        root (Path): dossier racine du cache.
+        max_bytes (int): taille maximale totale, au-delà on évince les entrées les moins
+            récemment utilisées.
+        ttl (float): durée de vie d'une entrée, en secondes.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, ttl: float) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def _entry_dir(self, key: str, kind: str = KIND_PDF) -> Path:
+        name = key if kind == KIND_PDF else f"{kind}:{key}"
+        return self.root / hashlib.sha256(name.encode()).hexdigest()[:24]
+
+    def _meta(self, key: str, kind: str) -> dict | None:
+        """meta.json de l'entrée `key` du type `kind`, ou None (absente, expirée, autre type)."""
+        entry = self._entry_dir(key, kind)
+        try:
+            meta: dict = json.loads((entry / META).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+        if meta.get("kind", KIND_PDF) != kind:
+            return None
+        if time.time() - meta["created"] > self.ttl:
+            logger.info("cache lemonde : %s (%s) expiré", key, kind)
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        return meta
+
+    def _touch(self, key: str, kind: str) -> None:
+        os.utime(self._entry_dir(key, kind) / META)  # dernier accès, pour le LRU
+        logger.info("cache lemonde : hit pour %s (%s)", key, kind)
+
+    def get(self, key: str) -> list[ArticlePdf] | None:
+        """Retourne les PDFs en cache pour `key`, ou None (absent, expiré ou incomplet)."""
+        meta = self._meta(key, KIND_PDF)
+        if meta is None:
+            return None
+        entry = self._entry_dir(key)
+        articles = [
+            ArticlePdf(path=entry / f["name"], warning=f.get("warning")) for f in meta["files"]
+        ]
+        if not all(article.path.exists() for article in articles):
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        self._touch(key, KIND_PDF)
+        return articles
+
+    def get_text(self, key: str) -> str | None:
+        """Retourne le texte Markdown en cache pour `key`, ou None."""
+        if self._meta(key, KIND_TEXT) is None:
+            return None
+        path = self._entry_dir(key, KIND_TEXT) / TEXT_FILE
+        try:
+            markdown = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            shutil.rmtree(path.parent, ignore_errors=True)
+            return None
+        self._touch(key, KIND_TEXT)
+        return markdown
+
+    def _new_entry(self, key: str, kind: str) -> Path:
+        entry = self._entry_dir(key, kind)
+        shutil.rmtree(entry, ignore_errors=True)
+        entry.mkdir(parents=True)
+        return entry
+
+    def _commit(self, entry: Path, meta: dict) -> None:
+        (entry / META).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        self._evict(keep=entry)
+
+    def put(self, key: str, articles: list[ArticlePdf]) -> list[ArticlePdf]:
+        """
+        Déplace les PDFs générés dans le cache et retourne leurs nouveaux chemins.
+
+        Args:
+            key (str): identifiant canonique de l'article.
+            articles (list[ArticlePdf]): PDFs fraîchement générés (fichiers temporaires).
+
+        Returns:
+            list[ArticlePdf]: les mêmes PDFs, désormais possédés par le cache.
+        """
+        entry = self._new_entry(key, KIND_PDF)
+        cached = []
+        for article in articles:
+            dest = entry / article.path.name
+            shutil.move(article.path, dest)
+            cached.append(ArticlePdf(path=dest, warning=article.warning))
+
+        meta = {  # sans "kind" : format d'origine, lu comme KIND_PDF
+            "key": key,
+            "created": time.time(),
+            "files": [{"name": a.path.name, "warning": a.warning} for a in cached],
+        }
+        self._commit(entry, meta)
+        return cached
+
+    def put_text(self, key: str, markdown: str) -> None:
+        """Met en cache le texte Markdown complet de l'article `key`."""
+        entry = self._new_entry(key, KIND_TEXT)
+        (entry / TEXT_FILE).write_text(markdown, encoding="utf-8")
+        meta = {"key": key, "kind": KIND_TEXT, "created": time.time(), "files": []}
+        self._commit(entry, meta)
+
+    def __contains__(self, key: str) -> bool:
+        """Des PDFs sont-ils en cache pour `key` ?"""
+        return (self._entry_dir(key) / META).exists()
+
+    def _evict(self, keep: Path) -> None:
+        """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+        entries = []
+        total = 0
+        for entry in self.root.iterdir():
+            meta_path = entry / META
+            if not meta_path.exists():
+                continue
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((meta_path.stat().st_mtime, size, entry))
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            logger.info("cache lemonde : éviction de %s (%.1f MB)", entry.name, size / 1e6)
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
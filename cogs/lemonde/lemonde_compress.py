@@ -0,0 +1,161 @@
+"""
+lemonde_compress.py
+
+Recompression des images des PDFs Le Monde avec Ghostscript.
+Il fournit :
+- PdfProfile / PROFILES : préréglages (résolution et qualité JPEG des images)
+- compress_pdf : réencode un PDF dans un sous-processus `gs`, hors de la boucle asyncio
+- compress_all : applique un profil à tous les PDFs d'un article et logue le gain
+
+Si Ghostscript n'est pas installé, ou si le résultat n'est pas plus petit, le PDF
+d'origine est gardé tel quel. Un seul `gs` tourne à la fois dans le processus (VM de
+256 Mo) ; un `gs` trop long ou dont l'appelant est annulé est tué et attendu.
+"""
+
+import asyncio
+import logging
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+
+from .lemonde_models import ArticlePdf
+
+logger = logging.getLogger(__name__)
+
+GS = os.getenv("LM_GS_PATH") or shutil.which("gs")
+PDF_PROFILE = os.getenv("LM_PDF_PROFILE", "mobile").strip().lower()  # "off" : pas de recompression
+COMPRESS_TIMEOUT = float(os.getenv("LM_PDF_COMPRESS_TIMEOUT", "60"))
+GS_SLOTS = asyncio.Semaphore(1)  # processus gs simultanés, tous articles confondus
+
+
+@dataclass(frozen=True)
+class PdfProfile:
+    name: str
+    dpi: int
+    jpeg_quality: int
+
+
+PROFILES = {
+    # lecture sur téléphone : photos légères
+    "mobile": PdfProfile("mobile", dpi=110, jpeg_quality=60),
+    # conservation : photos nettes, seulement les plus grosses sont réduites
+    "archival": PdfProfile("archival", dpi=200, jpeg_quality=85),
+    # dernier recours pour passer sous la limite d'upload Discord
+    "minimal": PdfProfile("minimal", dpi=72, jpeg_quality=40),
+}
+
+
+@dataclass
+class CompressResult:
+    article: ArticlePdf
+    before: int
+    after: int
+
+    @property
+    def ratio(self) -> float:
+        return self.after / self.before if self.before else 1.0
+
+
+def gs_command(profile: PdfProfile, src: Path, dest: Path) -> list[str]:
+    """Ligne de commande Ghostscript pour réencoder les images de `src` dans `dest`."""
+    assert GS is not None
+    args = [GS, "-sDEVICE=pdfwrite", "-dCompatibilityLevel=1.5"]
+    args += ["-dNOPAUSE", "-dBATCH", "-dQUIET", "-dSAFER", "-dDetectDuplicateImages=true"]
+    for kind in ("Color", "Gray"):
+        args += [
+            f"-dDownsample{kind}Images=true",
+            f"-d{kind}ImageDownsampleType=/Bicubic",
+            f"-d{kind}ImageResolution={profile.dpi}",
+            f"-dAutoFilter{kind}Images=false",
+            f"-d{kind}ImageFilter=/DCTEncode",
+        ]
+    args += [f"-dJPEGQ={profile.jpeg_quality}", f"-sOutputFile={dest}", str(src)]
+    return args
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Tue `gs` s'il tourne encore et attend sa fin (pas de processus orphelin)."""
+    if proc.returncode is None:
+        proc.kill()
+    await proc.wait()
+
+
+async def compress_pdf(
+    article: ArticlePdf, profile: PdfProfile, dest: Path | None = None
+) -> CompressResult:
+    """
+    Réencode les images d'un PDF selon `profile`.
+
+    Args:
+        article (ArticlePdf): le PDF à recompresser.
+        profile (PdfProfile): le préréglage à appliquer.
+        dest (Path | None): fichier de sortie ; par défaut le PDF est remplacé sur place.
+
+    Returns:
+        CompressResult: le PDF obtenu (l'original si échec ou pas de gain), tailles avant/après.
+    """
+    before = article.size
+    if GS is None:
+        return CompressResult(article, before, before)
+
+    target = dest or article.path
+    tmp = target.with_name(f".{target.stem}.{profile.name}.tmp.pdf")
+    async with GS_SLOTS:
+        proc = await asyncio.create_subprocess_exec(
+            *gs_command(profile, article.path, tmp),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=COMPRESS_TIMEOUT)
+        except TimeoutError:
+            await _kill(proc)
+            tmp.unlink(missing_ok=True)
+            logger.warning("gs trop long sur %s, PDF gardé tel quel", article.path.name)
+            return CompressResult(article, before, before)
+        except asyncio.CancelledError:
+            await _kill(proc)
+            tmp.unlink(missing_ok=True)
+            raise
+
+    if proc.returncode != 0 or not tmp.exists() or tmp.stat().st_size >= before:
+        if proc.returncode != 0:
+            logger.warning("gs en erreur sur %s : %s", article.path.name, stderr.decode()[-300:])
+        tmp.unlink(missing_ok=True)
+        return CompressResult(article, before, before)
+
+    os.replace(tmp, target)
+    result = ArticlePdf(path=target, warning=article.warning)
+    return CompressResult(result, before, result.size)
+
+
+async def compress_all(
+    articles: list[ArticlePdf], profile_name: str = PDF_PROFILE
+) -> list[ArticlePdf]:
+    """
+    Recompresse sur place tous les PDFs d'un article (profil inconnu ou "off" : rien),
+    un par un : un seul Ghostscript en mémoire à la fois.
+
+    Returns:
+        list[ArticlePdf]: les PDFs, dans le même ordre.
+    """
+    profile = PROFILES.get(profile_name)
+    if profile is None or GS is None:
+        if profile_name != "off":
+            logger.info("pas de recompression (profil %r, gs=%s)", profile_name, GS)
+        return articles
+
+    results = []
+    for article in articles:
+        r = await compress_pdf(article, profile)
+        results.append(r)
+        logger.info(
+            "🗜️ %s [%s] : %.1f MB → %.1f MB (%.0f%%)",
+            r.article.path.name,
+            profile.name,
+            r.before / (1024 * 1024),
+            r.after / (1024 * 1024),
+            r.ratio * 100,
+        )
+    return [r.article for r in results]
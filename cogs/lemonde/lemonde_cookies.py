@@ -0,0 +1,60 @@
+"""
+lemonde_cookies.py
+
+Cookies de la session Le Monde, sauvegardés sur disque.
+Il fournit :
+- COOKIE_PATH : fichier JSON partagé par le bot et les workers de rendu (LM_COOKIES)
+- read_cookies : les cookies sauvegardés, s'ils n'ont pas expiré
+- write_cookies : sauvegarde atomique (fichier lisible par le seul propriétaire)
+
+Ne dépend pas de lemonde_sl : le mode texte s'en sert avec son propre client httpx.
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+COOKIE_PATH = Path(
+    os.getenv("LM_COOKIES", Path.home() / ".cache" / "gourgandin" / "lemonde_cookies.json")
+)
+
+
+def read_cookies(path: Path = COOKIE_PATH) -> httpx.Cookies | None:
+    """Cookies de session sauvegardés, ou None s'il n'y en a pas (ou s'ils ont expiré)."""
+    try:
+        saved = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    now = time.time()
+    if any(c["expires"] is not None and c["expires"] < now for c in saved):
+        logger.info("cookies lemonde périmés : nouveau login")
+        path.unlink(missing_ok=True)
+        return None
+    cookies = httpx.Cookies()
+    for c in saved:
+        cookies.set(c["name"], c["value"], domain=c["domain"], path=c["path"])
+    return cookies
+
+
+def write_cookies(cookies: httpx.Cookies, path: Path = COOKIE_PATH) -> None:
+    data = [
+        {
+            "name": c.name,
+            "value": c.value,
+            "domain": c.domain,
+            "path": c.path,
+            "expires": c.expires,
+        }
+        for c in cookies.jar
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    tmp.chmod(0o600)
+    os.replace(tmp, path)  # atomique : plusieurs workers partagent le fichier
@@ -0,0 +1,146 @@
+"""
+lemonde_delivery.py
+
+Envoi des PDFs Le Monde sur Discord.
+Il fournit :
+- group_pdfs : regroupement en messages de 10 pièces jointes maximum, sous la limite d'upload
+- deliver_pdfs : envoi directement depuis les fichiers du cache, message par message
+- DeliveryReport : messages envoyés, PDFs trop lourds, temps d'upload et hausse de RSS
+- join_lines : texte d'un message, tronqué sous la limite Discord de 2000 caractères
+
+Les PDFs restent la propriété du cache : ils ne sont ouverts que le temps d'un message
+(discord.py les lit par morceaux, sans copie en mémoire), jamais supprimés ni gardés
+ouverts, même si l'upload échoue.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from discord import File
+
+from utils.monitoring import get_ram_usage_mb
+
+from .lemonde_models import ArticlePdf
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTACHMENTS = 10  # limite Discord par message
+MAX_MESSAGE_CHARS = 2000  # limite Discord par message
+
+
+@dataclass
+class DeliveryReport:
+    messages: int = 0
+    files: int = 0
+    bytes_sent: int = 0
+    upload_s: float = 0.0
+    rss_delta_mb: float = 0.0  # hausse maximale du RSS pendant cet envoi
+    oversized: list[ArticlePdf] = field(default_factory=list)
+
+
+def group_pdfs(
+    articles: list[ArticlePdf], size_limit: int, max_files: int = MAX_ATTACHMENTS
+) -> tuple[list[list[ArticlePdf]], list[ArticlePdf]]:
+    """
+    Regroupe les PDFs en messages : au plus `max_files` pièces jointes et `size_limit`
+    octets par message, dans l'ordre de l'article.
+
+    Args:
+        articles (list[ArticlePdf]): PDFs à envoyer.
+        size_limit (int): limite d'upload Discord (`guild.filesize_limit`).
+        max_files (int): nombre maximum de pièces jointes par message.
+
+    Returns:
+        tuple[list[list[ArticlePdf]], list[ArticlePdf]]: les messages à envoyer,
+        et les PDFs plus lourds que la limite (à traiter à part).
+    """
+    batches: list[list[ArticlePdf]] = []
+    oversized: list[ArticlePdf] = []
+    current: list[ArticlePdf] = []
+    current_size = 0
+
+    for article in articles:
+        size = article.size
+        if size > size_limit:
+            oversized.append(article)
+            continue
+        if len(current) == max_files or current_size + size > size_limit:
+            batches.append(current)
+            current, current_size = [], 0
+        current.append(article)
+        current_size += size
+
+    if current:
+        batches.append(current)
+    return batches, oversized
+
+
+def join_lines(lines: list[str], limit: int = MAX_MESSAGE_CHARS) -> str:
+    """
+    Lignes d'un message, coupées entre deux lignes pour ne pas dépasser `limit` caractères.
+
+    Args:
+        lines (list[str]): lignes du message, dans l'ordre.
+        limit (int): taille maximale du message.
+
+    Returns:
+        str: le message ; les lignes retirées sont annoncées à la fin.
+    """
+    text = "\n".join(lines)
+    if len(text) <= limit:
+        return text
+    for kept in range(len(lines) - 1, -1, -1):
+        more = f"… et {len(lines) - kept} lignes de plus"
+        text = "\n".join([*lines[:kept], more])
+        if len(text) <= limit:
+            return text
+    return text[: limit - 1] + "…"
+
+
+async def deliver_pdfs(
+    send: Callable[..., Awaitable[Any]], articles: list[ArticlePdf], size_limit: int
+) -> DeliveryReport:
+    """
+    Envoie les PDFs en autant de messages que nécessaire.
+
+    Args:
+        send (Callable[..., Awaitable[Any]]): fonction d'envoi (ex: `interaction.followup.send`),
+            appelée avec `files=`.
+        articles (list[ArticlePdf]): PDFs à envoyer.
+        size_limit (int): limite d'upload Discord.
+
+    Returns:
+        DeliveryReport: bilan de l'envoi ; les PDFs trop lourds sont dans `oversized`.
+    """
+    batches, oversized = group_pdfs(articles, size_limit)
+    report = DeliveryReport(oversized=oversized)
+    rss_before = get_ram_usage_mb()
+
+    for batch in batches:
+        files: list[File] = []
+        try:
+            for article in batch:
+                files.append(File(article.path, filename=article.path.name))
+            start = time.perf_counter()
+            await send(files=files)
+            report.upload_s += time.perf_counter() - start
+            report.rss_delta_mb = max(report.rss_delta_mb, get_ram_usage_mb() - rss_before)
+        finally:
+            for file in files:
+                file.close()
+        report.messages += 1
+        report.files += len(batch)
+        report.bytes_sent += sum(article.size for article in batch)
+
+    logger.info(
+        "📤 %d PDFs (%.1f MB) en %d messages, upload %.1fs, RSS +%.1f MB",
+        report.files,
+        report.bytes_sent / (1024 * 1024),
+        report.messages,
+        report.upload_s,
+        report.rss_delta_mb,
+    )
+    return report
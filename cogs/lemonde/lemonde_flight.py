@@ -0,0 +1,104 @@
+"""
+lemonde_flight.py
+
+Déduplication des rendus concurrents ("single-flight").
+Il fournit :
+- Flight : un rendu en cours, et la liste de ceux qui l'attendent
+- SingleFlight : une seule exécution par clé, partagée par toutes les demandes simultanées
+
+Les événements d'un rendu (ex: `on_retry` de async_retry) sont diffusés à tous les
+demandeurs, chacun avec ses propres callbacks.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import partial
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+Listener = dict[str, Callable[..., Awaitable[Any]]]
+
+
+class Flight:
+    """Un rendu en cours pour une clé, et ses demandeurs."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.listeners: list[Listener] = []
+        self.task: asyncio.Task | None = None
+        self.owner: int | None = None  # utilisateur qui a rejoint un pré-rendu
+
+    @property
+    def waiters(self) -> int:
+        return len(self.listeners)
+
+    async def emit(self, event: str, *args: Any) -> None:
+        """Appelle le callback `event` de chaque demandeur (les erreurs sont seulement loguées)."""
+        callbacks = [listener[event] for listener in list(self.listeners) if event in listener]
+        results = await asyncio.gather(*(cb(*args) for cb in callbacks), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("flight %s : callback %s en erreur : %s", self.key, event, result)
+
+
+class SingleFlight:
+    """
+    Partage une exécution en cours entre toutes les demandes de la même clé.
+
+    Le premier demandeur lance `factory(flight)` ; les suivants attendent le même résultat
+    (ou la même exception). Un demandeur annulé n'annule pas le rendu des autres.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[str, Flight] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._flights
+
+    def get(self, key: str) -> Flight | None:
+        return self._flights.get(key)
+
+    async def run(
+        self,
+        key: str,
+        factory: Callable[[Flight], Coroutine[Any, Any, T]],
+        **listener: Callable[..., Awaitable[Any]],
+    ) -> T:
+        """
+        Exécute `factory` pour `key`, ou rejoint l'exécution déjà en cours.
+
+        Args:
+            key (str): clé de déduplication (identifiant canonique de l'article).
+            factory (Callable[[Flight], Coroutine[Any, Any, T]]): coroutine à lancer si aucun rendu
+                n'est en cours ; reçoit le Flight pour diffuser ses événements.
+            **listener: callbacks de ce demandeur, par nom d'événement (ex: on_retry=...).
+
+        Returns:
+            T: le résultat partagé.
+        """
+        flight = self._flights.get(key)
+        task: asyncio.Task[T]
+        if flight is None or flight.task is None:
+            flight = Flight(key)
+            self._flights[key] = flight
+            task = flight.task = asyncio.create_task(factory(flight))
+            task.add_done_callback(partial(self._done, flight))
+        else:
+            logger.info("flight %s : rendu déjà en cours, on attend le même résultat", key)
+            task = flight.task
+
+        flight.listeners.append(listener)
+        try:
+            return await asyncio.shield(task)
+        finally:
+            flight.listeners.remove(listener)
+
+    def _done(self, flight: Flight, task: asyncio.Task) -> None:
+        if self._flights.get(flight.key) is flight:
+            del self._flights[flight.key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.info("flight %s terminé en erreur : %s", flight.key, task.exception())
@@ -0,0 +1,38 @@
+"""
+lemonde_models.py
+
+Modèles partagés par le cog LeMonde.
+Il fournit :
+- ArticlePdf : un PDF généré (chemin sur disque + avertissement éventuel)
+
+Les `MyArticle` de lemonde_sl sont convertis en ArticlePdf dès la fin du rendu,
+pour pouvoir être mis en cache et servis sans dépendre de la librairie.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lemonde_sl import MyArticle
+
+
+@dataclass
+class ArticlePdf:
+    path: Path
+    warning: str | None = None
+
+    @property
+    def has_warning(self) -> bool:
+        return bool(self.warning)
+
+    @property
+    def size(self) -> int:
+        return self.path.stat().st_size
+
+    @classmethod
+    def from_my_article(cls, article: "MyArticle") -> "ArticlePdf":
+        return cls(
+            path=Path(article.path),
+            warning=article.warning if article.has_warning else None,
+        )
@@ -0,0 +1,153 @@
+"""
+lemonde_pool.py
+
+Pool de processus de rendu PDF pour le cog LeMonde.
+Il fournit :
+- RenderWorker : un processus lemonde_worker, piloté par stdin/stdout
+- RenderPool : N workers, recyclés après un nombre de jobs ou au-delà d'un RSS,
+  relancés s'ils meurent
+
+Le rendu (WeasyPrint) ne tourne plus dans le processus du bot : la boucle asyncio
+(heartbeats Discord) n'est jamais bloquée, et la RAM du rendu est rendue à l'OS
+quand le worker est recyclé.
+
+La limite mem_mb (RLIMIT_AS) plafonne l'espace d'adressage virtuel, pas la RAM
+résidente : c'est un garde-fou contre un rendu qui s'emballe. La RAM réellement
+occupée est bornée par max_rss_mb, mesurée par le worker après chaque job.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from .lemonde_models import ArticlePdf
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+
+
+class RenderError(Exception):
+    """Le worker n'a pas pu produire les PDFs (erreur, mémoire, crash)."""
+
+
+class RenderWorker:
+    """Un processus de rendu, qui traite un job à la fois."""
+
+    def __init__(self, mem_mb: int) -> None:
+        self.mem_mb = mem_mb
+        self.proc: asyncio.subprocess.Process | None = None
+        self.jobs_done = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self) -> None:
+        env = {**os.environ, "LM_WORKER_MEM_MB": str(self.mem_mb)}
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "cogs.lemonde.lemonde_worker",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            cwd=ROOT_DIR,
+            env=env,
+        )
+        self.jobs_done = 0
+        logger.info("worker lemonde lancé (pid %d)", self.proc.pid)
+
+    async def render(self, url: str, out_dir: Path, timeout: float) -> dict:
+        assert self.proc is not None and self.proc.stdin and self.proc.stdout
+        job = json.dumps({"url": url, "out_dir": str(out_dir)}) + "\n"
+        self.proc.stdin.write(job.encode())
+        await self.proc.stdin.drain()
+        line = await asyncio.wait_for(self.proc.stdout.readline(), timeout=timeout)
+        self.jobs_done += 1
+        if not line:
+            await self.proc.wait()
+            raise RenderError(f"le worker s'est arrêté (code {self.proc.returncode})")
+        reply: dict = json.loads(line)
+        return reply
+
+    async def stop(self, grace: float = 5.0) -> None:
+        if not self.alive:
+            return
+        assert self.proc is not None and self.proc.stdin
+        self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), timeout=grace)
+        except TimeoutError:
+            self.proc.kill()
+            await self.proc.wait()
+        logger.info("worker lemonde arrêté (pid %d, %d jobs)", self.proc.pid, self.jobs_done)
+
+
+class RenderPool:
+    """
+    Pool de workers de rendu.
+
+    Args:
+        size (int): nombre de workers (rendus simultanés).
+        max_jobs (int): un worker est recyclé après ce nombre de jobs.
+        mem_mb (int): espace d'adressage maximal de chaque worker (0 = pas de limite).
+        job_timeout (float): au-delà, le worker est tué et le job échoue en TimeoutError.
+        max_rss_mb (float): un worker dont le RSS dépasse ce seuil après un job est
+            recyclé (0 = pas de limite).
+    """
+
+    def __init__(
+        self, size: int, max_jobs: int, mem_mb: int, job_timeout: float, max_rss_mb: float = 0
+    ) -> None:
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.job_timeout = job_timeout
+        self._workers = [RenderWorker(mem_mb) for _ in range(size)]
+        self._idle: asyncio.Queue[RenderWorker] = asyncio.Queue()
+        for worker in self._workers:
+            self._idle.put_nowait(worker)
+
+    async def render(self, url: str, out_dir: Path) -> list[ArticlePdf]:
+        """
+        Rend les PDFs d'un article dans un worker libre.
+
+        Raises:
+            TimeoutError: timeout côté lemonde_sl ou job trop long (compatible async_retry).
+            RenderError: erreur de rendu, limite mémoire ou crash du worker.
+        """
+        worker = await self._idle.get()
+        try:
+            if not worker.alive:
+                await worker.start()
+            try:
+                reply = await worker.render(url, out_dir, timeout=self.job_timeout)
+            except TimeoutError:
+                logger.error("worker lemonde bloqué depuis %.0fs, on le tue", self.job_timeout)
+                await worker.stop(grace=0)
+                raise
+            except asyncio.CancelledError:
+                # sa réponse arrivera quand même sur stdout : le job suivant la lirait
+                logger.warning("rendu lemonde annulé, on arrête le worker")
+                await worker.stop(grace=0)
+                raise
+            rss_mb = reply.get("rss_mb", 0)
+            if self.max_rss_mb and rss_mb > self.max_rss_mb:
+                logger.info("worker lemonde à %.1f MB de RSS : recyclé", rss_mb)
+                await worker.stop()
+            elif worker.jobs_done >= self.max_jobs:
+                await worker.stop()
+        finally:
+            self._idle.put_nowait(worker)
+
+        if not reply["ok"]:
+            if reply["kind"] == "timeout":
+                raise TimeoutError(reply["error"])
+            raise RenderError(reply["error"])
+        logger.info("worker lemonde : RSS du worker %.1f MB", reply["rss_mb"])
+        return [ArticlePdf(path=Path(a["path"]), warning=a["warning"]) for a in reply["articles"]]
+
+    async def close(self) -> None:
+        await asyncio.gather(*(worker.stop() for worker in self._workers))
@@ -0,0 +1,101 @@
+"""
+lemonde_prerender.py
+
+Pré-rendu spéculatif des liens Le Monde postés dans le chat.
+Il fournit :
+- PRERENDER_CHANNELS : salons surveillés (LM_PRERENDER_CHANNELS, ids séparés par des virgules)
+- find_article_urls : liens d'articles lemonde.fr dans un message
+- memory_pressure : True si la machine manque de mémoire pour un rendu spéculatif
+- PrerenderStats : pré-rendus lancés, terminés, abandonnés, et taux d'utilisation
+
+Un pré-rendu n'est utile que si quelqu'un lance ensuite /lemonde sur le même article :
+c'est ce que mesure le taux de "hits".
+"""
+
+import os
+import re
+from collections import OrderedDict
+
+from utils.monitoring import get_available_ram_mb
+
+from .lemonde_cache import ARTICLE_ID_RE
+
+PRERENDER_CHANNELS = {
+    int(channel) for channel in os.getenv("LM_PRERENDER_CHANNELS", "").split(",") if channel.strip()
+}
+# la VM fly.io n'a que 256 Mo : au-delà de ~64 Mo libres exigés, on ne pré-rendrait jamais
+PRERENDER_MIN_FREE_MB = float(os.getenv("LM_PRERENDER_MIN_FREE_MB", "64"))
+PRERENDER_MAX_LINKS = 3  # par message
+
+URL_RE = re.compile(r"https?://(?:www\.|m\.)?lemonde\.fr/[^\s<>|]+")
+
+
+def find_article_urls(text: str, limit: int = PRERENDER_MAX_LINKS) -> list[str]:
+    """Liens d'articles du Monde (pas les pages de rubrique), sans doublons, dans l'ordre."""
+    urls: list[str] = []
+    for match in URL_RE.finditer(text):
+        url = match.group(0).rstrip(").,>")
+        if ARTICLE_ID_RE.search(url.split("?")[0].split("#")[0]) and url not in urls:
+            urls.append(url)
+    return urls[:limit]
+
+
+def memory_pressure() -> bool:
+    """Moins de PRERENDER_MIN_FREE_MB disponibles sur la machine : pas de rendu spéculatif."""
+    return get_available_ram_mb() < PRERENDER_MIN_FREE_MB
+
+
+class PrerenderStats:
+    """Compteurs des pré-rendus ; un article pré-rendu compte au plus un hit."""
+
+    def __init__(self, max_keys: int = 500) -> None:
+        self.max_keys = max_keys
+        self.started = 0
+        self.done = 0
+        self.dropped = 0
+        self.hits = 0
+        self._keys: OrderedDict[str, None] = OrderedDict()  # pré-rendus en cache
+        self._running: dict[str, bool] = {}  # pré-rendus en cours -> déjà demandé ?
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._running
+
+    def record_start(self, key: str) -> None:
+        self.started += 1
+        self._running[key] = False
+
+    def record_end(self, key: str, ok: bool) -> None:
+        claimed = self._running.pop(key, False)
+        if not ok:
+            self.dropped += 1
+            return
+        self.done += 1
+        if claimed:
+            self.hits += 1
+            return
+        self._keys[key] = None
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+    def record_hit(self, key: str) -> bool:
+        """À appeler quand /lemonde demande un article : True si c'est un pré-rendu."""
+        if key in self._running:
+            if self._running[key]:
+                return False
+            self._running[key] = True  # compté à la fin du pré-rendu
+            return True
+        if key not in self._keys:
+            return False
+        del self._keys[key]
+        self.hits += 1
+        return True
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.done if self.done else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Pré-rendus : {self.started} lancés, {self.done} terminés, "
+            f"{self.dropped} abandonnés ou échoués, {self.hits} utilisés ({self.hit_rate:.0%})"
+        )
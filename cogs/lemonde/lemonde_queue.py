@@ -0,0 +1,332 @@
+"""
+lemonde_queue.py
+
+File d'attente bornée devant le rendu des articles.
+Il fournit :
+- RenderQueue : N rendus simultanés au maximum, une file bornée, une limite par utilisateur
+- QueueStats : profondeur de file, temps d'attente et de rendu (dimensionnement)
+- QueueFullError / UserLimitError : refus à l'admission
+- JobDropped : job spéculatif abandonné (mémoire, arrêt, préemption)
+
+Chaque job en attente est prévenu de sa position et d'une estimation d'attente à chaque
+mouvement de la file. Les jobs spéculatifs (pré-rendus) passent toujours après les
+jobs des utilisateurs, et peuvent être promus quand un utilisateur demande le même article.
+Si tous les rendus sont occupés quand un job utilisateur arrive (avec un seul worker,
+c'est le cas dès qu'un pré-rendu tourne), un job spéculatif en cours est interrompu
+pour lui laisser la place.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PositionCallback = Callable[[int, float], Awaitable[Any]]
+
+DEFAULT_RENDER_TIME = 30.0  # estimation tant qu'on n'a pas de mesure
+
+PRIORITY_USER = 0
+PRIORITY_SPECULATIVE = 1
+
+
+class AdmissionError(Exception):
+    """Le job a été refusé à l'entrée de la file."""
+
+
+class QueueFullError(AdmissionError):
+    pass
+
+
+class UserLimitError(AdmissionError):
+    pass
+
+
+class JobDropped(Exception):
+    """Job spéculatif retiré de la file avant d'avoir démarré, ou interrompu par un utilisateur."""
+
+
+@dataclass
+class Job:
+    fn: Callable[[], Awaitable[Any]]
+    user_id: int
+    future: asyncio.Future
+    on_position: PositionCallback | None = None
+    priority: int = PRIORITY_USER
+    key: str | None = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    last_position: int = -1
+    preempted: bool = False
+
+
+class QueueStats:
+    """Dernières mesures de la file, pour le dimensionnement."""
+
+    def __init__(self, maxlen: int = 200) -> None:
+        self.depths: deque[int] = deque(maxlen=maxlen)
+        self.waits: deque[float] = deque(maxlen=maxlen)
+        self.renders: deque[float] = deque(maxlen=maxlen)
+        self.rejected = 0
+        self.dropped = 0
+        self.done = 0
+
+    @property
+    def avg_render(self) -> float:
+        return statistics.fmean(self.renders) if self.renders else DEFAULT_RENDER_TIME
+
+    @staticmethod
+    def _describe(values: deque[float] | deque[int]) -> str:
+        if not values:
+            return "n/a"
+        ordered = sorted(values)
+        p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+        return f"moy {statistics.fmean(ordered):.1f} / p95 {p95:.1f} / max {ordered[-1]:.1f}"
+
+    def summary(self) -> str:
+        return (
+            f"Jobs terminés : {self.done}, refusés : {self.rejected}, "
+            f"abandonnés : {self.dropped}\n"
+            f"Profondeur de file : {self._describe(self.depths)}\n"
+            f"Attente (s) : {self._describe(self.waits)}\n"
+            f"Rendu (s) : {self._describe(self.renders)}"
+        )
+
+
+class RenderQueue:
+    """
+    File d'attente des rendus.
+
+    Args:
+        workers (int): nombre de rendus simultanés.
+        max_pending (int): nombre maximum de jobs en attente (au-delà : QueueFullError).
+        per_user (int): nombre maximum de jobs (en attente ou en cours) par utilisateur.
+        max_speculative (int): nombre maximum de jobs spéculatifs en attente.
+        pressure (Callable[[], bool] | None): si elle renvoie True au moment de démarrer
+            un job spéculatif, tous les jobs spéculatifs en attente sont abandonnés.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_pending: int,
+        per_user: int,
+        max_speculative: int = 2,
+        pressure: Callable[[], bool] | None = None,
+    ) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self.per_user = per_user
+        self.max_speculative = max_speculative
+        self.pressure = pressure
+        self.stats = QueueStats()
+        self._pending: deque[Job] = deque()
+        self._per_user: Counter[int] = Counter()
+        self._cond = asyncio.Condition()
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[asyncio.Task, Job] = {}  # rendu en cours -> son job
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def _count(self, priority: int) -> int:
+        return sum(1 for job in self._pending if job.priority == priority)
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+
+    async def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        while self._pending:
+            self._pending.popleft().future.cancel()
+
+    def eta(self, position: int) -> float:
+        """Attente estimée (secondes) pour un job à la position donnée (1 = le prochain)."""
+        rounds = (position - 1) // self.workers + 1
+        return rounds * self.stats.avg_render
+
+    def check_admission(self, user_id: int, priority: int = PRIORITY_USER) -> None:
+        """Lève une AdmissionError si un nouveau job de cet utilisateur serait refusé.
+
+        Les jobs spéculatifs ne comptent pas dans les limites des utilisateurs, et ne sont
+        admis que si aucun job utilisateur n'attend.
+        """
+        if priority == PRIORITY_SPECULATIVE:
+            if self._count(PRIORITY_USER) or self._count(priority) >= self.max_speculative:
+                raise QueueFullError("pas de place pour un pré-rendu")
+            return
+        if self._per_user[user_id] >= self.per_user:
+            self.stats.rejected += 1
+            raise UserLimitError(f"{self.per_user} rendus maximum par utilisateur")
+        if self._count(PRIORITY_USER) >= self.max_pending:
+            self.stats.rejected += 1
+            raise QueueFullError(f"file pleine ({self.max_pending} jobs en attente)")
+
+    async def submit(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        user_id: int,
+        on_position: PositionCallback | None = None,
+        priority: int = PRIORITY_USER,
+        key: str | None = None,
+    ) -> T:
+        """
+        Ajoute un job à la file et attend son résultat.
+
+        Args:
+            fn (Callable[[], Awaitable[T]]): le rendu à exécuter.
+            user_id (int): utilisateur à l'origine du job (limite par utilisateur).
+            on_position (PositionCallback | None): appelé avec (position, eta) à chaque
+                mouvement de la file ; position 0 quand le rendu démarre.
+            priority (int): PRIORITY_USER ou PRIORITY_SPECULATIVE.
+            key (str | None): clé de l'article, pour `promote`.
+
+        Raises:
+            QueueFullError, UserLimitError: job refusé.
+            JobDropped: job spéculatif abandonné avant son démarrage, ou interrompu.
+        """
+        self.check_admission(user_id, priority)
+        job = Job(
+            fn=fn,
+            user_id=user_id,
+            future=asyncio.get_running_loop().create_future(),
+            on_position=on_position,
+            priority=priority,
+            key=key,
+        )
+        counted = priority == PRIORITY_USER
+        if counted:
+            self._per_user[user_id] += 1
+        self._enqueue(job)
+        self.stats.depths.append(len(self._pending))
+        if priority == PRIORITY_USER:
+            self._preempt()
+        try:
+            async with self._cond:
+                self._cond.notify()
+            await self._notify_positions()
+            result: T = await job.future
+            return result
+        finally:
+            if job in self._pending:  # demandeur annulé avant le démarrage
+                self._pending.remove(job)
+            if counted:
+                self._per_user[user_id] -= 1
+                if self._per_user[user_id] <= 0:
+                    del self._per_user[user_id]
+
+    def _enqueue(self, job: Job) -> None:
+        """Un job utilisateur passe devant tous les jobs spéculatifs."""
+        if job.priority == PRIORITY_USER:
+            for index, other in enumerate(self._pending):
+                if other.priority == PRIORITY_SPECULATIVE:
+                    self._pending.insert(index, job)
+                    return
+        self._pending.append(job)
+
+    def _preempt(self) -> None:
+        """Tous les rendus sont occupés : interrompt un job spéculatif en cours."""
+        if len(self._running) < self.workers:
+            return
+        for run, job in self._running.items():
+            if job.priority == PRIORITY_SPECULATIVE and not job.preempted:
+                job.preempted = True
+                run.cancel()
+                logger.info("file lemonde : pré-rendu %s interrompu pour un utilisateur", job.key)
+                return
+
+    async def promote(self, key: str) -> bool:
+        """
+        Passe le job spéculatif pour `key` en priorité utilisateur : en attente, il passe
+        devant les autres pré-rendus ; en cours, il ne peut plus être interrompu.
+        """
+        for job in self._running.values():
+            if job.key == key and job.priority == PRIORITY_SPECULATIVE and not job.preempted:
+                job.priority = PRIORITY_USER
+                return True
+        for job in self._pending:
+            if job.key == key and job.priority == PRIORITY_SPECULATIVE:
+                self._pending.remove(job)
+                job.priority = PRIORITY_USER
+                self._enqueue(job)
+                await self._notify_positions()
+                return True
+        return False
+
+    def drop_speculative(self, reason: str) -> int:
+        """Retire de la file tous les jobs spéculatifs en attente."""
+        dropped = [job for job in self._pending if job.priority == PRIORITY_SPECULATIVE]
+        for job in dropped:
+            self._pending.remove(job)
+            if not job.future.done():
+                job.future.set_exception(JobDropped(reason))
+        if dropped:
+            self.stats.dropped += len(dropped)
+            logger.info("file lemonde : %d pré-rendus abandonnés (%s)", len(dropped), reason)
+        return len(dropped)
+
+    async def _notify_positions(self) -> None:
+        calls = []
+        for position, job in enumerate(list(self._pending), start=1):
+            if job.on_position is not None and job.last_position != position:
+                job.last_position = position
+                calls.append(job.on_position(position, self.eta(position)))
+        await asyncio.gather(*calls, return_exceptions=True)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(lambda: bool(self._pending))
+                job = self._pending.popleft()
+            if job.future.done():
+                continue
+            if job.priority == PRIORITY_SPECULATIVE and self.pressure and self.pressure():
+                self._pending.appendleft(job)
+                self.drop_speculative("mémoire")
+                continue
+
+            wait = time.monotonic() - job.enqueued_at
+            self.stats.waits.append(wait)
+            if job.on_position is not None:
+                await asyncio.gather(job.on_position(0, 0.0), return_exceptions=True)
+            await self._notify_positions()
+
+            start = time.monotonic()
+            run = asyncio.ensure_future(job.fn())
+            self._running[run] = job
+            try:
+                result = await run
+                if not job.future.done():
+                    job.future.set_result(result)
+            except asyncio.CancelledError:
+                if not job.preempted or not run.cancelled():  # arrêt de la file
+                    job.future.cancel()
+                    raise
+                self.stats.dropped += 1
+                if not job.future.done():
+                    job.future.set_exception(JobDropped("interrompu pour un utilisateur"))
+                continue
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                del self._running[run]
+            render = time.monotonic() - start
+            self.stats.renders.append(render)
+            self.stats.done += 1
+            logger.info(
+                "file lemonde [worker %d] : attente %.1fs, rendu %.1fs, profondeur %d",
+                index,
+                wait,
+                render,
+                len(self._pending),
+            )
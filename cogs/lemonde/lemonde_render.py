@@ -0,0 +1,123 @@
+"""
+lemonde_render.py
+
+Rendu PDF des articles du Monde avec lemonde_sl (WeasyPrint).
+Il fournit :
+- get_article : login + scraping + rendu des PDFs d'un article
+- render_to_dir : même chose, avec les PDFs déplacés dans un dossier donné
+
+Ce module n'importe pas discord : il est exécuté dans les processus de rendu
+(lemonde_worker.py), ou directement dans le bot si le pool est désactivé.
+"""
+
+import logging
+import os
+import shutil
+from pathlib import Path
+
+from lemonde_sl import LeMondeAsync, MyArticle
+
+from utils.monitoring import get_ram_usage_mb
+
+from .lemonde_models import ArticlePdf
+from .lemonde_session import LeMondeSession
+
+logger = logging.getLogger(__name__)
+
+
+# async def get_article(url: str, mobile: bool, dark_mode: bool) -> MyArticle:
+#     """
+#     Fetch and generate a PDF version of a Le Monde article using the library's
+#     asynchronous client.
+
+#     This helper function encapsulates the interaction with ``LeMondeAsync`` so
+#     that the Discord bot does not need to manage the client lifecycle, login
+#     details, or PDF generation logic directly. Centralizing this logic keeps the
+#     bot code clean, makes error handling consistent, and allows the underlying
+#     implementation to evolve without requiring changes in the bot.
+
+#     Args:
+#         url (str): The URL of the Le Monde article to fetch.
+#         mobile (bool): Whether to render the article using the mobile layout
+#             (A6 format, reduced margins).
+#         dark_mode (bool): Whether to apply the dark theme to the generated PDF.
+
+#     Returns:
+#         MyArticle: A structured result containing:
+#             - ``path``: Path to the generated PDF file.
+#             - ``success``: Whether the PDF was generated without fatal errors.
+#             - ``warning``: Optional warning message (e.g., multimedia removed).
+
+#     Notes:
+#         This function exists to decouple the bot from the internal details of
+#         the Le Monde scraping and PDF generation pipeline. It provides a stable
+#         interface for the bot, while allowing the library to change its internal
+#         behavior (authentication, HTML parsing, fallback strategies, etc.)
+#         without requiring modifications in the bot code.
+#     """
+
+#     # Load environment variables (idempotent)
+#     load_dotenv()
+
+#     EMAIL = os.getenv("LM_SL_EMAIL")
+#     PASSWORD = os.getenv("LM_SL_PASSWD")
+
+#     if not EMAIL or not PASSWORD:
+#         raise RuntimeError("Missing LM_SL_EMAIL or LM_SL_PASSWD in environment")
+
+#     async with LeMondeAsync() as lm:
+#         return await lm.fetch_pdf(
+#             url=url,
+#             email=EMAIL,
+#             password=PASSWORD,
+#             mobile=mobile,
+#             dark=dark_mode,
+#         )
+
+
+async def get_article(url: str, session: LeMondeSession | None = None) -> list[MyArticle]:
+    # Load_dotenv is executed once in the main bot (or in test file) but not here
+    EMAIL = os.getenv("LM_SL_EMAIL")
+    PASSWORD = os.getenv("LM_SL_PASSWD")
+    MAX_IMGS: int = int(os.environ["LM_SL_MAX_IMGS"])
+    logger.info("get_article called with url=%s and max imgs=%d", url, MAX_IMGS)
+
+    if not EMAIL or not PASSWORD:
+        raise RuntimeError("Missing LM_SL_EMAIL or LM_SL_PASSWD in environment")
+    before = get_ram_usage_mb()
+    logger.info("RAM before render: %.1f MB", before)
+    if session is not None:
+        my_pdf_list: list[MyArticle] = await session.fetch_all_pdf(url=url, max_img=MAX_IMGS)
+    else:
+        async with LeMondeAsync() as lm:
+            my_pdf_list = await lm.fetch_all_pdf(
+                url=url,
+                email=EMAIL,
+                password=PASSWORD,
+                max_img=MAX_IMGS,
+            )
+    after = get_ram_usage_mb()
+    logger.info("RAM after render: %.1f MB (delta: %.1f MB)", after, after - before)
+    return my_pdf_list
+
+
+async def render_to_dir(
+    url: str, out_dir: Path, session: LeMondeSession | None = None
+) -> list[ArticlePdf]:
+    """Rend les PDFs d'un article et les déplace dans `out_dir`.
+
+    Args:
+        url (str): URL de l'article.
+        out_dir (Path): dossier de destination (fourni par l'appelant, qui le nettoie).
+        session (LeMondeSession | None): session persistante, sinon un client jetable.
+
+    Returns:
+        list[ArticlePdf]: les PDFs, dans `out_dir`.
+    """
+    out = []
+    for my_article in await get_article(url=url, session=session):
+        pdf = ArticlePdf.from_my_article(my_article)
+        dest = out_dir / pdf.path.name
+        shutil.move(pdf.path, dest)
+        out.append(ArticlePdf(path=dest, warning=pdf.warning))
+    return out
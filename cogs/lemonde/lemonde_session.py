@@ -0,0 +1,237 @@
+"""
+lemonde_session.py
+
+Session Le Monde authentifiée et persistante.
+Il fournit :
+- LeMondeSession : un client LeMondeAsync ouvert une seule fois et réutilisé
+  (connexions TLS, cookies de login), avec cookies sauvegardés sur disque
+- is_auth_error : l'échec vient-il de la session (401/403) ?
+
+Les identifiants ne sont envoyés à lemonde_sl que si la session n'a pas de cookies :
+au premier rendu sans cookies sauvegardés, ou après un refus d'authentification.
+Les rendus suivants passent `email=None, password=None` et réutilisent les cookies
+du client. Les cookies survivent aux redémarrages (et aux recyclages des workers) ;
+le client n'est remplacé que lorsque la session a dépassé max_age, et l'ancien n'est
+fermé qu'une fois les rendus qui s'en servent terminés.
+
+Tout cela suppose que LeMondeAsync expose son client httpx (attribut `client`, non
+documenté). Sinon la session passe en mode sans état, le comportement d'origine :
+un LeMondeAsync neuf et un login complet à chaque rendu, avec un avertissement.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .lemonde_cookies import COOKIE_PATH, read_cookies, write_cookies
+
+if TYPE_CHECKING:
+    from lemonde_sl import MyArticle
+
+logger = logging.getLogger(__name__)
+
+SESSION_MAX_AGE = float(os.getenv("LM_SESSION_MAX_AGE_HOURS", "12")) * 3600
+AUTH_STATUSES = {401, 403}
+
+
+def is_auth_error(error: BaseException) -> bool:
+    """La session a été refusée (login expiré ou révoqué) : un nouveau login peut suffire."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code in AUTH_STATUSES
+
+
+def _credentials() -> tuple[str, str]:
+    email = os.getenv("LM_SL_EMAIL")
+    password = os.getenv("LM_SL_PASSWD")
+    if not email or not password:
+        raise RuntimeError("Missing LM_SL_EMAIL or LM_SL_PASSWD in environment")
+    return email, password
+
+
+def _http_client(lm: Any) -> httpx.AsyncClient | None:
+    """Client httpx de LeMondeAsync (attribut `client`), dont on persiste les cookies."""
+    client = getattr(lm, "client", None)
+    return client if isinstance(client, httpx.AsyncClient) else None
+
+
+def _default_factory() -> Any:
+    from lemonde_sl import LeMondeAsync  # lourd (WeasyPrint) : seulement à l'ouverture
+
+    return LeMondeAsync()
+
+
+class LeMondeSession:
+    """
+    Client Le Monde longue durée.
+
+    Args:
+        cookie_path (Path): fichier JSON des cookies (partagé entre processus).
+        max_age (float): durée (secondes) au-delà de laquelle on force un nouveau login.
+        factory (Callable | None): crée le client LeMondeAsync (tests), sinon lemonde_sl.
+    """
+
+    def __init__(
+        self,
+        cookie_path: Path = COOKIE_PATH,
+        max_age: float = SESSION_MAX_AGE,
+        factory: Callable[[], Any] | None = None,
+    ) -> None:
+        self.cookie_path = cookie_path
+        self.max_age = max_age
+        self.factory = factory or _default_factory
+        self.logins = 0  # rendus qui ont envoyé les identifiants
+        self.stateless = False  # client httpx introuvable : un login par rendu
+        self._lm: Any = None
+        self._opened_at = 0.0
+        self._logged_in = False
+        self._users: dict[int, int] = {}  # id(client) -> rendus en cours
+        self._lock = asyncio.Lock()
+        self._login_lock = asyncio.Lock()  # un seul login : les autres rendus attendent ses cookies
+
+    @contextlib.asynccontextmanager
+    async def _lease(self) -> AsyncIterator[Any]:
+        """
+        Client courant, réservé le temps d'un rendu ; rouvert si la session est trop vieille.
+        None si la session est passée en mode sans état.
+        """
+        async with self._lock:
+            if self._lm is not None and time.time() - self._opened_at > self.max_age:
+                logger.info("session lemonde trop vieille : nouveau login")
+                self.invalidate()
+                await self._retire(save=False)
+            if self._lm is None and not self.stateless:
+                await self._open()
+            lm = self._lm
+            if lm is not None:
+                self._users[id(lm)] = self._users.get(id(lm), 0) + 1
+        if lm is None:
+            yield None
+            return
+        try:
+            yield lm
+        finally:
+            self._users[id(lm)] -= 1
+            if self._users[id(lm)] == 0:
+                del self._users[id(lm)]
+                if lm is not self._lm:  # remplacé pendant le rendu : on peut le fermer
+                    await lm.__aexit__(None, None, None)
+
+    async def _open(self) -> None:
+        lm = self.factory()
+        await lm.__aenter__()
+        client = _http_client(lm)
+        if client is None:
+            await lm.__aexit__(None, None, None)
+            self.stateless = True
+            logger.warning(
+                "⚠️ %s n'expose pas de client httpx (attribut `client`) : "
+                "session lemonde sans état, un login par rendu",
+                type(lm).__name__,
+            )
+            return
+        self._lm = lm
+        self._opened_at = time.time()
+        self._logged_in = self._load_cookies(client)
+
+    async def _retire(self, save: bool) -> None:
+        """Détache le client courant ; il est fermé tout de suite s'il ne sert à personne."""
+        lm, self._lm = self._lm, None
+        self._logged_in = False
+        if lm is None:
+            return
+        if save and (client := _http_client(lm)) is not None:
+            write_cookies(client.cookies, self.cookie_path)
+        if id(lm) not in self._users:
+            await lm.__aexit__(None, None, None)
+
+    async def close(self, save: bool = True) -> None:
+        """Ferme le client (et sauvegarde les cookies)."""
+        async with self._lock:
+            await self._retire(save)
+
+    def invalidate(self) -> None:
+        """Oublie les cookies sauvegardés : le prochain appel refera un login complet."""
+        self.cookie_path.unlink(missing_ok=True)
+
+    async def _fetch(self, lm: Any, url: str, max_img: int, login: bool) -> "list[MyArticle]":
+        email: str | None = None
+        password: str | None = None
+        if login:
+            email, password = _credentials()
+            self.logins += 1
+        articles: list[MyArticle] = await lm.fetch_all_pdf(
+            url=url, email=email, password=password, max_img=max_img
+        )
+        return articles
+
+    async def _fetch_stateless(self, url: str, max_img: int) -> "list[MyArticle]":
+        """Comportement d'origine : un client neuf et un login complet par rendu."""
+        lm = self.factory()
+        await lm.__aenter__()
+        try:
+            return await self._fetch(lm, url, max_img, login=True)
+        finally:
+            await lm.__aexit__(None, None, None)
+
+    async def fetch_all_pdf(self, url: str, max_img: int) -> "list[MyArticle]":
+        """
+        Rend les PDFs d'un article avec la session courante.
+
+        Sans identifiants si la session a des cookies ; un refus d'authentification
+        (401/403) fait oublier les cookies et réessayer une fois avec un login complet.
+        Les autres erreurs (timeouts compris) remontent telles quelles.
+        """
+        _credentials()  # échoue tôt si la configuration est incomplète
+        async with self._lease() as lm:
+            if lm is None:
+                return await self._fetch_stateless(url, max_img)
+            start = time.perf_counter()
+            articles = None
+            login = False
+            if not self._logged_in:
+                async with self._login_lock:
+                    if not self._logged_in:
+                        articles = await self._fetch(lm, url, max_img, login=True)
+                        login = True
+                        self._saved(lm)
+            if articles is None:
+                try:
+                    articles = await self._fetch(lm, url, max_img, login=False)
+                except Exception as e:
+                    if not is_auth_error(e):
+                        raise
+                    logger.warning("session lemonde refusée (%s) : nouveau login", e)
+                    async with self._lock:
+                        if lm is self._lm:
+                            self._logged_in = False
+                            self.invalidate()
+                    articles = await self._fetch(lm, url, max_img, login=True)
+                    login = True
+                self._saved(lm)
+            logger.info(
+                "session lemonde : rendu en %.1fs (%s)",
+                time.perf_counter() - start,
+                "login" if login else "cookies réutilisés",
+            )
+        return articles
+
+    def _saved(self, lm: Any) -> None:
+        """Rendu réussi : la session est connectée, ses cookies sont sauvegardés."""
+        if lm is self._lm:
+            self._logged_in = True
+            if (client := _http_client(lm)) is not None:
+                write_cookies(client.cookies, self.cookie_path)
+
+    def _load_cookies(self, client: httpx.AsyncClient) -> bool:
+        cookies = read_cookies(self.cookie_path)
+        if cookies is None:
+            return False
+        client.cookies.update(cookies)
+        logger.info("session lemonde : %d cookies rechargés", len(cookies.jar))
+        return True
@@ -0,0 +1,200 @@
+"""
+lemonde_text.py
+
+Mode texte de /lemonde : l'article sans rendu PDF.
+Il fournit :
+- ArticleText : titre, chapô, image principale et corps (paragraphes et intertitres)
+- parse_article : extraction (selectolax) depuis le HTML d'un article, paywall compris
+- fetch_article_text : téléchargement avec les cookies de la session Le Monde
+  (passés à chaque requête : le client partagé ne garde aucun cookie)
+- split_image : sépare l'image principale du texte Markdown
+- paginate : découpage d'un texte Markdown en pages (embeds Discord)
+
+Le texte complet des articles abonnés demande les cookies sauvegardés par LeMondeSession
+(après un premier rendu PDF) : sans eux, ou s'ils ne sont plus valides, la page affiche
+le paywall et seul le début de l'article est disponible.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+from selectolax.parser import HTMLParser, Node
+
+from utils.tools import headers
+
+from .lemonde_cookies import read_cookies
+
+logger = logging.getLogger(__name__)
+
+MAX_REDIRECTS = 5
+IMAGE_RE = re.compile(r"^!\[\]\((\S+)\)\n\n", re.MULTILINE)
+TEXT_TIMEOUT = 10.0
+PARTIAL_WARNING = (
+    "🔒 Pas de session Le Monde enregistrée : seul le début des articles abonnés est disponible."
+)
+EXPIRED_WARNING = (
+    "🔒 La session Le Monde n'est plus connectée : seul le début de l'article est disponible."
+)
+# blocs du paywall, présents seulement quand la suite est réservée aux abonnés
+# (pas le badge "abonnés", affiché aussi aux abonnés connectés)
+PAYWALL_SELECTORS = ".paywall, .article__paywall, #js-paywall-content"
+# cherché dans le corps de l'article seulement : scripts, pieds de page et encarts
+# de la page peuvent contenir la phrase même quand l'article est complet
+PAYWALL_TEXT = "La suite est réservée aux abonnés"
+
+
+@dataclass
+class ArticleText:
+    url: str
+    title: str
+    lead: str = ""
+    image_url: str | None = None
+    blocks: list[tuple[str, str]] = field(default_factory=list)  # ("h2" | "p", texte)
+    truncated: bool = False  # la page affichait le paywall
+
+    def to_markdown(self) -> str:
+        lines = [f"# {self.title}", ""]
+        if self.lead:
+            lines += [f"*{self.lead}*", ""]
+        if self.image_url:
+            lines += [f"![]({self.image_url})", ""]
+        for kind, text in self.blocks:
+            lines += [f"## {text}" if kind == "h2" else text, ""]
+        lines.append(f"<{self.url}>")
+        return "\n".join(lines)
+
+
+def _text(node: Node | None) -> str:
+    return " ".join(node.text().split()) if node is not None else ""
+
+
+def parse_article(html: str, url: str) -> ArticleText:
+    """
+    Extrait le contenu d'une page article du Monde.
+
+    Args:
+        html (str): HTML de la page.
+        url (str): URL de l'article (reprise dans le Markdown).
+
+    Returns:
+        ArticleText: l'article (corps vide si la structure de la page n'est pas reconnue).
+    """
+    tree = HTMLParser(html)
+    image = tree.css_first('meta[property="og:image"]')
+    article = ArticleText(
+        url=url,
+        title=_text(tree.css_first("h1.article__title, h1")),
+        lead=_text(tree.css_first("p.article__desc")),
+        image_url=image.attributes.get("content") if image is not None else None,
+        truncated=tree.css_first(PAYWALL_SELECTORS) is not None,
+    )
+    body = tree.css_first("section.article__content, article")
+    if body is None:
+        return article
+    article.truncated = article.truncated or PAYWALL_TEXT in body.text()
+    # parcours dans l'ordre du document (css() groupe les résultats par sélecteur)
+    for node in body.traverse():
+        classes = node.attributes.get("class") or ""
+        if node.tag == "h2" and "article__sub-title" in classes:
+            kind = "h2"
+        elif node.tag == "p" and "article__paragraph" in classes:
+            kind = "p"
+        else:
+            continue
+        if text := _text(node):
+            article.blocks.append((kind, text))
+    return article
+
+
+def make_text_client(transport: httpx.AsyncBaseTransport | None = None) -> httpx.AsyncClient:
+    """Client HTTP du mode texte, partagé : il ne garde aucun cookie (ni reçu, ni envoyé).
+
+    Les cookies de session sont passés à chaque requête (`fetch_article_text`) :
+    deux articles demandés en même temps ne se marchent pas dessus.
+    """
+    jar = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(
+        headers=headers, timeout=TEXT_TIMEOUT, cookies=jar, transport=transport
+    )
+
+
+def cookie_header(cookies: httpx.Cookies) -> str:
+    return "; ".join(f"{c.name}={c.value}" for c in cookies.jar)
+
+
+def _is_lemonde(url: httpx.URL) -> bool:
+    return url.host == "lemonde.fr" or url.host.endswith(".lemonde.fr")
+
+
+async def _get(client: httpx.AsyncClient, url: str, cookie: str | None) -> httpx.Response:
+    """GET qui suit les redirections en renvoyant les cookies aux seuls hôtes lemonde.fr.
+
+    (httpx retire l'en-tête Cookie d'une requête quand il suit lui-même une redirection.)
+    """
+    target = httpx.URL(url)
+    for _ in range(MAX_REDIRECTS + 1):
+        request_headers = {"Cookie": cookie} if cookie and _is_lemonde(target) else None
+        resp = await client.get(target, headers=request_headers)
+        if not resp.is_redirect:
+            return resp
+        target = target.join(resp.headers["Location"])
+    raise httpx.TooManyRedirects(f"plus de {MAX_REDIRECTS} redirections", request=resp.request)
+
+
+async def fetch_article_text(client: httpx.AsyncClient, url: str) -> tuple[ArticleText, str | None]:
+    """
+    Télécharge et extrait un article.
+
+    Returns:
+        tuple[ArticleText, str | None]: l'article, et un avertissement s'il est tronqué
+        (pas de session enregistrée, ou session qui n'est plus connectée).
+    """
+    cookies = read_cookies()
+    resp = await _get(client, url, cookie_header(cookies) if cookies is not None else None)
+    resp.raise_for_status()
+    article = parse_article(resp.text, url)
+    logger.info(
+        "📰 article texte : %d blocs, %d octets de HTML, session=%s, paywall=%s",
+        len(article.blocks),
+        len(resp.content),
+        cookies is not None,
+        article.truncated,
+    )
+    if not article.truncated:
+        return article, None
+    return article, PARTIAL_WARNING if cookies is None else EXPIRED_WARNING
+
+
+def split_image(markdown: str) -> tuple[str, str | None]:
+    """Retire la ligne d'image principale du Markdown, et renvoie son URL."""
+    m = IMAGE_RE.search(markdown)
+    if m is None:
+        return markdown, None
+    return markdown[: m.start()] + markdown[m.end() :], m.group(1)
+
+
+def paginate(markdown: str, limit: int) -> list[str]:
+    """Découpe un texte en pages d'au plus `limit` caractères, entre deux paragraphes."""
+    pages: list[str] = []
+    current = ""
+    for paragraph in markdown.split("\n\n"):
+        while len(paragraph) > limit:  # paragraphe géant : coupé au dernier espace
+            cut = paragraph.rfind(" ", 1, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                pages.append(current)
+                current = ""
+            pages.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip()
+        candidate = f"{current}\n\n{paragraph}" if current else paragraph
+        if len(candidate) > limit:
+            pages.append(current)
+            current = paragraph
+        else:
+            current = candidate
+    if current:
+        pages.append(current)
+    return pages
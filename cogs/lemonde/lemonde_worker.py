@@ -0,0 +1,93 @@
+"""
+lemonde_worker.py
+
+Processus de rendu PDF, lancé par lemonde_pool.py :
+    python -m cogs.lemonde.lemonde_worker
+
+Protocole : une requête JSON par ligne sur stdin ({"url": ..., "out_dir": ...}),
+une réponse JSON par ligne sur stdout :
+- {"ok": true, "articles": [{"path": ..., "warning": ...}], "rss_mb": ...}
+- {"ok": false, "kind": "timeout" | "memory" | "error", "error": "..."}
+
+Le vrai stdout est réservé au protocole : tout ce que les librairies impriment part
+sur stderr. L'espace d'adressage du processus est plafonné par LM_WORKER_MEM_MB
+(RLIMIT_AS, mémoire virtuelle et non RSS) ; le RSS renvoyé après chaque job permet
+au pool de recycler un worker trop gros.
+Le worker garde une boucle asyncio et une LeMondeSession pour toute sa durée de vie :
+le login et les connexions sont réutilisés d'un job à l'autre.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from utils.monitoring import get_ram_usage_mb
+
+from .lemonde_render import render_to_dir
+from .lemonde_session import LeMondeSession
+
+logger = logging.getLogger(__name__)
+
+
+def set_memory_limit(limit_mb: int) -> None:
+    """Plafonne l'espace d'adressage du processus (Linux/macOS uniquement)."""
+    if limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        logger.warning("resource indisponible : pas de limite mémoire pour le worker")
+        return
+    limit = limit_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def handle(loop: asyncio.AbstractEventLoop, session: LeMondeSession, job: dict) -> dict:
+    try:
+        articles = loop.run_until_complete(
+            render_to_dir(job["url"], Path(job["out_dir"]), session=session)
+        )
+    except TimeoutError as e:
+        return {"ok": False, "kind": "timeout", "error": str(e) or "timeout"}
+    except MemoryError:
+        return {"ok": False, "kind": "memory", "error": "limite mémoire du worker atteinte"}
+    except Exception as e:
+        logger.exception("rendu échoué pour %s", job.get("url"))
+        return {"ok": False, "kind": "error", "error": f"{type(e).__name__}: {e}"}
+    return {
+        "ok": True,
+        "articles": [{"path": str(a.path), "warning": a.warning} for a in articles],
+        "rss_mb": get_ram_usage_mb(),
+    }
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    set_memory_limit(int(os.getenv("LM_WORKER_MEM_MB", "0")))
+
+    # stdout -> protocole uniquement ; print() des librairies -> stderr
+    proto = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8", buffering=1)
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    loop = asyncio.new_event_loop()
+    session = LeMondeSession()
+    logger.info("worker lemonde %d prêt", os.getpid())
+    try:
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            reply = handle(loop, session, json.loads(line))
+            proto.write(json.dumps(reply, ensure_ascii=False) + "\n")
+            if reply.get("kind") == "memory":
+                break  # état du processus incertain : on laisse le pool en relancer un
+    finally:
+        loop.run_until_complete(session.close())
+        loop.close()
+    logger.info("worker lemonde %d terminé", os.getpid())
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import logging
 
 from discord.ext import commands
 
-from utils.tools import get_ram_usage_mb
+from utils.monitoring import get_ram_usage_mb
 
 logger = logging.getLogger(__name__)
 
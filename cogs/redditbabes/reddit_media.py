@@ -0,0 +1,145 @@
+"""
+reddit_media.py
+
+Ce module gère le téléchargement des images d'un album Reddit et leur regroupement
+en messages Discord.
+Il fournit :
+- un téléchargement concurrent (limite de concurrence, d'octets et timeout)
+- un regroupement en messages de 10 pièces jointes maximum, sous la limite d'upload
+
+Utilisé par reddit_poster.py pour le mode "album complet".
+"""
+
+import asyncio
+import io
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from urllib.parse import urlparse
+
+import discord
+import httpx
+
+from utils.tools import headers
+
+logger = logging.getLogger(__name__)
+
+FULL_GALLERY = os.getenv("REDDIT_FULL_GALLERY", "").strip().lower() in ("1", "true", "yes", "on")
+MAX_BYTES = int(os.getenv("REDDIT_MEDIA_MAX_BYTES", str(10 * 1024 * 1024)))
+CONCURRENCY = int(os.getenv("REDDIT_MEDIA_CONCURRENCY", "4"))
+TIMEOUT = float(os.getenv("REDDIT_MEDIA_TIMEOUT", "20"))
+MAX_ATTACHMENTS = 10  # limite Discord par message
+
+
+@dataclass
+class MediaFile:
+    url: str
+    filename: str
+    data: bytes | None = None
+
+    @property
+    def size(self) -> int:
+        return len(self.data) if self.data is not None else 0
+
+    def to_file(self) -> discord.File:
+        return discord.File(io.BytesIO(self.data or b""), filename=self.filename)
+
+
+@dataclass
+class MediaBatch:
+    """Un message Discord : des pièces jointes, et les URLs des images trop lourdes."""
+
+    files: list[MediaFile]
+    urls: list[str]
+
+
+async def _download_one(
+    client: httpx.AsyncClient, media: MediaFile, semaphore: asyncio.Semaphore, max_bytes: int
+) -> None:
+    async with semaphore:
+        try:
+            async with client.stream("GET", media.url) as resp:
+                resp.raise_for_status()
+                length = int(resp.headers.get("Content-Length", 0))
+                if length > max_bytes:
+                    logger.info("\t  🐘 image trop lourde (%d octets) : %s", length, media.url)
+                    return
+                buffer = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    buffer += chunk
+                    if len(buffer) > max_bytes:
+                        logger.info(
+                            "\t  🐘 image trop lourde (> %d octets) : %s", max_bytes, media.url
+                        )
+                        return
+                media.data = bytes(buffer)
+        except httpx.HTTPError as e:
+            logger.warning("\t  ❌ téléchargement échoué pour %s : %s", media.url, e)
+
+
+async def download_media(
+    urls: list[str],
+    max_bytes: int = MAX_BYTES,
+    concurrency: int = CONCURRENCY,
+    timeout: float = TIMEOUT,
+) -> list[MediaFile]:
+    """
+    Télécharge les images d'un album en parallèle.
+
+    Les images en échec ou plus lourdes que `max_bytes` sont rendues sans données
+    (`data=None`) : elles seront postées par URL.
+
+    Args:
+        urls (list[str]): URLs des images, dans l'ordre de l'album.
+        max_bytes (int): taille maximale d'une image.
+        concurrency (int): nombre maximum de téléchargements simultanés.
+        timeout (float): timeout (secondes) de chaque requête.
+
+    Returns:
+        list[MediaFile]: une entrée par URL, dans le même ordre.
+    """
+    medias = [
+        MediaFile(url=url, filename=f"{i:02d}_{PurePosixPath(urlparse(url).path).name}")
+        for i, url in enumerate(urls, start=1)
+    ]
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(headers=headers, timeout=timeout, follow_redirects=True) as client:
+        await asyncio.gather(*(_download_one(client, m, semaphore, max_bytes) for m in medias))
+    return medias
+
+
+def group_media(
+    medias: list[MediaFile], size_limit: int, max_files: int = MAX_ATTACHMENTS
+) -> list[MediaBatch]:
+    """
+    Regroupe les images en messages : au plus `max_files` pièces jointes et `size_limit`
+    octets par message. Les images non téléchargées ou plus lourdes que la limite
+    sont ajoutées en URL au dernier message.
+
+    Args:
+        medias (list[MediaFile]): images téléchargées (ou non).
+        size_limit (int): limite d'upload Discord (`guild.filesize_limit`).
+        max_files (int): nombre maximum de pièces jointes par message.
+
+    Returns:
+        list[MediaBatch]: les messages à envoyer, dans l'ordre.
+    """
+    batches: list[MediaBatch] = []
+    current: list[MediaFile] = []
+    current_size = 0
+    urls: list[str] = []
+
+    for media in medias:
+        if media.data is None or media.size > size_limit:
+            urls.append(media.url)
+            continue
+        if len(current) == max_files or current_size + media.size > size_limit:
+            batches.append(MediaBatch(files=current, urls=[]))
+            current, current_size = [], 0
+        current.append(media)
+        current_size += media.size
+
+    if current or urls:
+        batches.append(MediaBatch(files=current, urls=urls))
+    return batches
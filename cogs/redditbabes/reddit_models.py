@@ -6,6 +6,8 @@ from datetime import UTC, datetime, timedelta
 import discord
 from asyncpraw.models import Submission
 
+from .reddit_tools import select_media_url
+
 logger = logging.getLogger(__name__)
 
 PREFIXES: list[str] = [
@@ -24,6 +26,7 @@ class RedditSubmissionInfo:
     is_album: bool = field(init=False)
     image_count: int = field(init=False)
     image_url: str | None = field(init=False)
+    gallery_urls: list[str] = field(init=False)
     created_at: datetime = field(init=False)
 
     def __post_init__(self):
@@ -36,6 +39,7 @@ class RedditSubmissionInfo:
         )
         self.image_url = None
         self.image_count = 0
+        self.gallery_urls = []
         self.created_at = datetime.fromtimestamp(self.submission.created_utc, tz=UTC)
         logger.info("\t🧵 self.post_url : %s", self.post_url)
 
@@ -49,6 +53,7 @@ class RedditSubmissionInfo:
         ):
             self.image_url = self.submission.url
             self.image_count = 1
+            self.gallery_urls = [self.image_url]
             logger.info("\t  🍑 standard submission with one pic : %s", self.submission)
         else:
             logger.error(
@@ -84,7 +89,7 @@ class RedditSubmissionInfo:
                 )
 
             image_info = self.submission.media_metadata.get(first_media_id, {})
-            self.image_url = image_info.get("s", {}).get("u")
+            self.image_url = select_media_url(image_info)
             logger.warning("\t  🖼️ Image found in album : %s", self.image_url)
             if not self.image_url:
                 raise RedditException(
@@ -94,6 +99,7 @@ class RedditSubmissionInfo:
                 )
 
             self.image_count = len(items)
+            self.gallery_urls = self._gallery_urls(items)
         except (AttributeError, TypeError, KeyError) as e:
             raise RedditException(
                 f"Erreur lors de l'extraction des images : {e}",
@@ -101,6 +107,15 @@ class RedditSubmissionInfo:
                 url=self.post_url,
             ) from e
 
+    def _gallery_urls(self, items: list[dict]) -> list[str]:
+        """URLs de toutes les images de l'album, dans l'ordre de gallery_data."""
+        urls = []
+        for item in items:
+            media = self.submission.media_metadata.get(item.get("media_id"), {})
+            if url := select_media_url(media):
+                urls.append(url)
+        return urls
+
     @staticmethod
     def _extract_suffix_regex(s: str, prefix: str) -> str:
         """Extract suffix
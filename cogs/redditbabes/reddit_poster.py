@@ -6,7 +6,8 @@ import discord
 from utils.tools import fetch_history
 
 from .reddit_client import fetch_new_submissions
-from .reddit_models import RedditException
+from .reddit_media import FULL_GALLERY, download_media, group_media
+from .reddit_models import RedditException, RedditSubmissionInfo
 
 logger = logging.getLogger(__name__)
 
@@ -84,10 +85,46 @@ class RedditPoster:
                         )
                         embed = sub_object.to_embed()
                         await self.channel.send(embed=embed)
-                        await self.channel.send(sub_object.image_url)
+                        if FULL_GALLERY and len(sub_object.gallery_urls) > 1:
+                            await self.send_gallery(sub_object)
+                        else:
+                            await self.channel.send(sub_object.image_url)
                     else:
                         logger.info("\t✂️ Déjà posté récemment, on skip : %s", sub_object.image_url)
                 except RedditException as err:
                     logger.warning("Erreur sur le post '%s' : %s", sub_object.title, err)
         except Exception as e:
             logger.error(f"Erreur lors du traitement du subreddit {sub} : {e}")
+
+    async def send_gallery(
+        self, sub_object: RedditSubmissionInfo, urls_per_message: int = 5
+    ) -> None:
+        """
+        Envoie toutes les images d'un album, regroupées en pièces jointes.
+
+        Le premier message garde l'URL de la première image en contenu (embeds masqués) :
+        c'est ce que `fetch_recent_image_urls` utilise pour éviter les doublons.
+        Les images trop lourdes pour l'upload sont envoyées par URL.
+
+        Args:
+            sub_object (RedditSubmissionInfo): la soumission (album) à publier.
+            urls_per_message (int): nombre d'URLs par message pour les images non jointes.
+        """
+        medias = await download_media(sub_object.gallery_urls)
+        batches = group_media(medias, size_limit=self.channel.guild.filesize_limit)
+        logger.info(
+            "\t📚 Album de %d images en %d messages", len(sub_object.gallery_urls), len(batches)
+        )
+        for index, batch in enumerate(batches):
+            content = sub_object.image_url if index == 0 else None
+            if batch.files:
+                await self.channel.send(
+                    content=content,
+                    files=[media.to_file() for media in batch.files],
+                    suppress_embeds=True,
+                )
+            elif content:
+                await self.channel.send(content)
+            urls = [url for url in batch.urls if url != content]
+            for start in range(0, len(urls), urls_per_message):
+                await self.channel.send("\n".join(urls[start : start + urls_per_message]))
@@ -1,9 +1,14 @@
+import html
+import os
 import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from asyncpraw.models import Submission
 
+# Budget en pixels pour les images d'albums (défaut : 1080x1920, la plus grande preview Reddit)
+MAX_PIXELS = int(os.getenv("REDDIT_MAX_PIXELS", str(1080 * 1920)))
+
 
 def canonical_id_from_url(url: str) -> str | None:
     """Extract the canonical Reddit ID from a submission URL.
@@ -13,6 +18,36 @@ def canonical_id_from_url(url: str) -> str | None:
     return m.group(1) if m else None
 
 
+def select_media_url(media: dict, max_pixels: int = MAX_PIXELS) -> str | None:
+    """Choisit l'URL d'une image d'album selon un budget en pixels.
+
+    `media` est une entrée de `submission.media_metadata` : "s" est la source,
+    "p" les previews redimensionnées par Reddit (x, y, u).
+    On prend la source si elle tient dans le budget, sinon la plus grande preview
+    qui y tient, sinon la source quand même.
+    Les URLs de l'API sont échappées en HTML (&amp;) : on les déséchappe.
+
+    Args:
+        media (dict): métadonnées d'une image de l'album
+        max_pixels (int): budget en pixels (largeur x hauteur)
+
+    Returns:
+        str | None: URL de l'image choisie, ou None si aucune URL n'est disponible
+    """
+    source = media.get("s", {})
+    source_url = source.get("u") or source.get("gif")
+    if source_url and source.get("x", 0) * source.get("y", 0) <= max_pixels:
+        return html.unescape(source_url)
+
+    previews = [p for p in media.get("p", []) if p.get("u") and p.get("x") and p.get("y")]
+    fitting = [p for p in previews if p["x"] * p["y"] <= max_pixels]
+    if fitting:
+        best = max(fitting, key=lambda p: p["x"] * p["y"])
+        return html.unescape(best["u"])
+
+    return html.unescape(source_url) if source_url else None
+
+
 async def resolve_submission(submission: "Submission") -> "Submission":
     """Retourne la vraie submission (ID canonique), si l'ID API est un alias."""
     await submission.load()
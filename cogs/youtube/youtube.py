@@ -0,0 +1,253 @@
+"""Youtube cog."""
+
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from .youtube_api import Result, YoutubeClient, get_youtube_url
+from .youtube_cache import SearchCache
+from .youtube_details import Details, DetailsCache
+from .youtube_prompts import PromptDispatcher
+from .youtube_quota import PARIS, QuotaExhausted, QuotaLedger, QuotaLevel, next_reset
+from .youtube_suggest import Suggester
+
+logger = logging.getLogger(__name__)
+
+TitleURL = tuple[str, str]
+SearchFn = Callable[[str, int], Awaitable[list[Result]]]
+
+CACHE_SIZE = int(os.getenv("YOUTUBE_CACHE_SIZE", "500"))
+CACHE_TTL = float(os.getenv("YOUTUBE_CACHE_TTL_HOURS", "24")) * 3600
+# fichier du cache ("" : cache en mémoire seulement)
+CACHE_PATH = os.getenv(
+    "YOUTUBE_CACHE_PATH", str(Path.home() / ".cache" / "gourgandin" / "youtube_cache.jsonl")
+)
+DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+QUOTA_PATH = Path(
+    os.getenv("YOUTUBE_QUOTA_PATH", Path.home() / ".cache" / "gourgandin" / "youtube_quota.json")
+)
+REDUCED_MAX_RESULTS = 3  # palier REDUCED : résultats demandés à l'API au plus
+DETAILS_TTL = float(os.getenv("YOUTUBE_DETAILS_TTL_HOURS", "6")) * 3600
+LINK_WATCH = 1200  # secondes pendant lesquelles supprimer la commande supprime le lien
+CHOICE_TIMEOUT = 15  # secondes pour choisir dans un youtubelist
+
+
+def quota_refusal() -> str:
+    return (
+        "🙏 Le quota YouTube du jour est épuisé, désolé ! "
+        f"Réessayez après {next_reset().astimezone(PARIS):%Hh%M}."
+    )
+
+
+def string_is_int(string: str) -> bool:  # pragma: no cover
+    """Return if 'string' is an int or not (bool)."""
+    try:
+        int(string)
+        return True
+    except ValueError:
+        return False
+
+
+async def youtube_top_link(search: SearchFn, user_input: str) -> TitleURL | None:
+    """Return title and url of 1st Youtube search.
+
+    Args:
+        search (SearchFn): fonction de recherche (cache, puis API)
+        user_input (str): user search on Youtube
+
+    Returns:
+        TitleURL: title, url or None
+
+    """
+    results_list = await search(user_input, 1)
+    try:
+        result: Result = results_list[0]
+    except IndexError:
+        logger.warning("No results found for %s", user_input)
+        return None
+    url = get_youtube_url(result)
+    if url is None:  # type de résultat inconnu
+        return None
+    return result.title, url
+
+
+class Youtube(commands.Cog):
+    """Youtube cog.
+    Commands are youtube and youtubelist
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.quota = QuotaLedger(DAILY_QUOTA, QUOTA_PATH)
+        self.api = YoutubeClient(ledger=self.quota)
+        self.cache = SearchCache(CACHE_SIZE, CACHE_TTL, Path(CACHE_PATH) if CACHE_PATH else None)
+        self.suggester = Suggester(self.cache)
+        self.details = DetailsCache(self.api, DETAILS_TTL)
+        self.prompts = PromptDispatcher()
+
+    async def cog_load(self) -> None:
+        self.prompts.start()
+
+    async def cog_unload(self) -> None:
+        await self.prompts.close()
+        await self.api.aclose()
+        await self.suggester.aclose()
+
+    async def search(self, query: str, number: int) -> list[Result]:
+        """Recherche YouTube, servie par le cache quand c'est possible.
+
+        Quand le quota baisse : le cache répond même périmé ou incomplet, puis les
+        recherches sont réduites à REDUCED_MAX_RESULTS résultats, puis refusées.
+
+        Raises:
+            QuotaExhausted: plus de quota et rien en cache.
+        """
+        level = self.quota.level()
+        results = self.cache.get(query, number, relaxed=level >= QuotaLevel.CACHE_FIRST)
+        if results is not None:
+            logger.info("🗃️ recherche youtube en cache : %s (%d)", query, number)
+            return results
+        if level == QuotaLevel.EXHAUSTED:
+            raise QuotaExhausted(f"{self.quota.spent}/{self.quota.daily_quota}")
+        if level == QuotaLevel.REDUCED:
+            number = min(number, REDUCED_MAX_RESULTS)
+        results = await self.api.search(query, number)
+        self.cache.put(query, number, results)
+        return results
+
+    async def get_details(self, results: list[Result]) -> dict[str, Details]:
+        """Durée, vues et chaîne des résultats ; facultatif : rien si le quota est épuisé."""
+        if self.quota.level() == QuotaLevel.EXHAUSTED:
+            return {}
+        try:
+            return await self.details.get(results)
+        except Exception as e:
+            logger.warning("détails youtube indisponibles : %s", e)
+            return {}
+
+    async def refuse_quota(self, ctx: commands.Context, error: QuotaExhausted) -> None:
+        """Quota épuisé : refus poli avec l'heure de remise à zéro.
+
+        Traité dans les commandes plutôt que par un cog_command_error, qui masquerait
+        les autres erreurs (rôles manquants...) au gestionnaire par défaut du bot.
+        """
+        logger.warning("quota youtube épuisé : %s", error)
+        await ctx.send(quota_refusal(), delete_after=30)
+
+    async def query_autocomplete(
+        self, interaction: discord.Interaction, current: str
+    ) -> list[app_commands.Choice[str]]:
+        """Autocomplétion de /youtube : recherches en cache et suggestions YouTube."""
+        start = time.perf_counter()
+        suggestions = await self.suggester.suggest(interaction.user.id, current)
+        logger.debug(
+            "autocomplétion youtube %r : %d choix en %.0f ms",
+            current,
+            len(suggestions),
+            (time.perf_counter() - start) * 1000,
+        )
+        return [app_commands.Choice(name=s[:100], value=s[:100]) for s in suggestions]
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        await self.prompts.on_message_delete(payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message) -> None:
+        self.prompts.on_message(message)
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    @app_commands.autocomplete(query=query_autocomplete)
+    async def youtube(self, ctx: commands.Context, *, query: str) -> None:
+        """Send first Youtube search result.
+
+        Args:
+            query (str): Search on youtube
+        """
+        try:
+            top = await youtube_top_link(self.search, query.lower())
+        except QuotaExhausted as e:
+            await self.refuse_quota(ctx, e)
+            return
+        if top is None:
+            await ctx.send("Aucun résultat.", delete_after=5)
+            return
+        title, url = top
+        link = await ctx.send(content=f"{title}\n{url}")
+        self.prompts.watch_delete(ctx.message.id, link.delete, timeout=LINK_WATCH)
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    async def youtubelist(self, ctx: commands.Context, num: int, *, query: str) -> None:
+        """Send <n> Youtube search results.
+
+        Args:
+            num (int): amount of desired results.
+            query (str): search on youtube.
+        """
+        num = num if num <= 10 else 10
+        try:
+            results = await self.search(query, num)
+        except QuotaExhausted as e:
+            await self.refuse_quota(ctx, e)
+            return
+        details = await self.get_details(results)
+        embed = discord.Embed(color=0xFF0000)
+        embed.set_footer(
+            text='Tapez un nombre pour faire votre choix ou dites "cancel" pour annuler'
+        )
+        for res in results:
+            url = get_youtube_url(res)
+            value = f"[{res.title}]({url})"
+            if res.id_ in details:
+                value += f"\n{details[res.id_].describe()}"
+            embed.add_field(
+                name=f"{results.index(res) + 1}.{res.type_}",
+                value=value,
+                inline=False,
+            )
+        self_message = await ctx.send(embed=embed)
+
+        def check(message):
+            return message.content == "cancel" or string_is_int(message.content)
+
+        try:
+            msg = await self.prompts.wait_reply(
+                ctx.channel.id, ctx.author.id, check, timeout=CHOICE_TIMEOUT
+            )
+            if msg is None:  # un autre youtubelist a pris le relais
+                await self_message.delete(delay=None)
+            elif msg.content == "cancel":
+                await ctx.send("Annulé !", delete_after=5)
+                await self_message.delete(delay=None)
+                await ctx.message.delete(delay=2)
+                await msg.delete(delay=1)
+            else:
+                num = int(msg.content)
+                if 0 < num <= len(results):
+                    url = get_youtube_url(results[num - 1])
+                    await ctx.send(content=f"{url}")
+                    await ctx.message.delete(delay=2)
+                    await self_message.delete(delay=None)
+                    await msg.delete(delay=1)
+
+        except TimeoutError:
+            await ctx.send("Tu as pris trop de temps pour répondre !", delete_after=5)
+            await self_message.delete(delay=None)
+            await ctx.message.delete(delay=2)
+
+    @commands.hybrid_command()  # type: ignore[arg-type]
+    @commands.has_any_role("modo", "Admin")
+    async def youtube_stats(self, ctx: commands.Context) -> None:
+        """Quota YouTube du jour (dépense, prévision) et statistiques du cache."""
+        await ctx.send(f"📊 YouTube\n{self.quota.summary()}\n{self.cache.summary()}")
+
+
+async def setup(bot):
+    await bot.add_cog(Youtube(bot))
+    logger.info("⚙️ Youtube cog added")
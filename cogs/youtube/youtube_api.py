@@ -0,0 +1,134 @@
+"""
+youtube_api.py
+
+Client asynchrone de l'API YouTube Data v3.
+Il fournit :
+- Result : un résultat de recherche (titre, type, id)
+- parse_search_items : conversion des items de `search.list` en Result
+- get_youtube_url : URL d'une vidéo, playlist ou chaîne
+- YoutubeClient : client httpx créé une fois par cog (connexions réutilisées) :
+  recherche, et détails de vidéos/playlists par lots d'ids
+
+Les requêtes ne bloquent plus la boucle asyncio (heartbeats, autres commandes) :
+voir scripts/bench_youtube_loop.py pour la comparaison avec googleapiclient.
+"""
+
+import html
+import logging
+import os
+from typing import NamedTuple
+
+import httpx
+
+from .youtube_quota import QuotaExhausted, QuotaLedger
+
+logger = logging.getLogger(__name__)
+
+TOKEN_YOUTUBE = os.getenv("TOKEN_YOUTUBE")
+API_URL = "https://www.googleapis.com/youtube/v3"
+API_TIMEOUT = 10.0
+MAX_IDS = 50  # ids par appel videos.list / playlists.list
+
+
+class Result(NamedTuple):  # pylint: disable=missing-class-docstring
+    title: str
+    type_: str
+    id_: str
+
+
+def parse_search_items(items: list[dict]) -> list[Result]:
+    """Convertit les items d'une réponse `search.list` en Result."""
+    out = []
+
+    for item in items:
+        title = html.unescape(item["snippet"]["title"])
+        try:
+            if item["id"]["kind"] == "youtube#channel":
+                type_ = "channel"
+                id_ = item["id"]["channelId"]
+            elif item["id"]["kind"] == "youtube#playlist":
+                type_ = "playlist"
+                id_ = item["id"]["playlistId"]
+            elif item["id"]["kind"] == "youtube#video":
+                type_ = "video"
+                id_ = item["id"]["videoId"]
+            else:
+                type_ = "unknown"
+                id_ = "NoID"
+        except KeyError:  # pragma: no cover
+            type_ = "unknown"
+            id_ = "NoID"
+
+        out.append(Result(title=title, type_=type_, id_=id_))
+
+    return out
+
+
+def get_youtube_url(result: Result) -> str | None:
+    """Make youtube url of 'result' (video, playlist, or channel)."""
+    if result.type_ == "channel":
+        return f"https://www.youtube.com/channel/{result.id_}"
+    if result.type_ == "playlist":
+        return f"https://www.youtube.com/playlist?list={result.id_}"
+    if result.type_ == "video":
+        return f"https://www.youtube.com/watch?v={result.id_}"
+    return None
+
+
+class YoutubeClient:
+    """
+    Client de l'API YouTube Data, à créer une fois et à fermer avec `aclose()`.
+
+    Args:
+        api_key (str | None): clé d'API (TOKEN_YOUTUBE).
+        client (httpx.AsyncClient | None): client HTTP à utiliser (tests), sinon un client dédié.
+        ledger (QuotaLedger | None): registre où chaque appel est décompté.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = TOKEN_YOUTUBE,
+        client: httpx.AsyncClient | None = None,
+        ledger: QuotaLedger | None = None,
+    ) -> None:
+        self.api_key = api_key
+        self.ledger = ledger
+        self._client = client or httpx.AsyncClient(base_url=API_URL, timeout=API_TIMEOUT)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get(self, endpoint: str, **params: str | int) -> dict:
+        resp = await self._client.get(endpoint, params={**params, "key": self.api_key})
+        if self.ledger is not None:
+            self.ledger.record(endpoint)  # Google décompte aussi les requêtes en erreur
+            if resp.status_code == 403 and "quotaExceeded" in resp.text:
+                self.ledger.exhaust()
+                raise QuotaExhausted(resp.text)
+        resp.raise_for_status()
+        data: dict = resp.json()
+        return data
+
+    async def search(self, user_input: str, number: int) -> list[Result]:
+        """Search on Youtube.
+
+        Args:
+            user_input (str): search string
+            number (int): number of search results
+
+        Returns:
+            list: list of results
+        """
+        response = await self._get("/search", part="snippet", maxResults=number, q=user_input)
+        return parse_search_items(response["items"])
+
+    async def list_by_ids(self, endpoint: str, ids: list[str], part: str) -> list[dict]:
+        """Items de `videos.list` ou `playlists.list` (un appel par tranche de 50 ids)."""
+        items: list[dict] = []
+        for start in range(0, len(ids), MAX_IDS):
+            chunk = ids[start : start + MAX_IDS]
+            response = await self._get(
+                endpoint, part=part, id=",".join(chunk), maxResults=len(chunk)
+            )
+            items.extend(response.get("items", []))
+        return items
@@ -0,0 +1,156 @@
+"""
+youtube_cache.py
+
+Cache des recherches YouTube (chaque recherche coûte 100 unités de quota).
+Il fournit :
+- normalize_query : clé de cache d'une recherche (minuscules, espaces normalisés)
+- SearchCache : cache LRU en mémoire avec TTL, doublé d'un fichier JSON-lines optionnel
+
+Une entrée garde le plus grand nombre de résultats demandé pour une recherche :
+un `youtubelist` de 10 résultats répond aussi au `youtube` (top 1) de la même recherche.
+"""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from .youtube_api import Result
+
+logger = logging.getLogger(__name__)
+
+SEARCH_COST = 100  # unités de quota d'un search.list
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+@dataclass
+class CacheEntry:
+    query: str
+    number: int
+    created: float
+    results: list[Result]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "q": self.query,
+                "n": self.number,
+                "t": self.created,
+                "r": [list(r) for r in self.results],
+            },
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> "CacheEntry":
+        data = json.loads(line)
+        return cls(data["q"], data["n"], data["t"], [Result(*r) for r in data["r"]])
+
+
+class SearchCache:
+    """
+    Cache des résultats de recherche.
+
+    Args:
+        max_entries (int): nombre de recherches gardées en mémoire (LRU).
+        ttl (float): durée de vie d'une entrée, en secondes.
+        path (Path | None): fichier JSON-lines (survit aux redémarrages), None : mémoire seule.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, path: Path | None = None) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        if path is not None:
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def quota_saved(self) -> int:
+        return self.hits * SEARCH_COST
+
+    def _fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.created < self.ttl
+
+    def get(self, query: str, number: int, relaxed: bool = False) -> list[Result] | None:
+        """Les `number` premiers résultats de `query`, s'ils sont en cache et frais.
+
+        En mode `relaxed` (quota bas), une entrée périmée ou plus petite répond quand même.
+        """
+        key = normalize_query(query)
+        entry = self._entries.get(key)
+        if entry is None or (not relaxed and (not self._fresh(entry) or entry.number < number)):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.results[:number]
+
+    def queries(self, prefix: str, limit: int = 25) -> list[str]:
+        """Recherches en cache qui commencent par `prefix`, les plus récentes d'abord."""
+        prefix = normalize_query(prefix)
+        out = []
+        for key in reversed(self._entries):
+            if key.startswith(prefix) and self._fresh(self._entries[key]):
+                out.append(key)
+                if len(out) == limit:
+                    break
+        return out
+
+    def put(self, query: str, number: int, results: list[Result]) -> None:
+        key = normalize_query(query)
+        current = self._entries.get(key)
+        if current is not None and self._fresh(current) and current.number > number:
+            return  # on garde la recherche la plus complète
+        entry = CacheEntry(key, number, time.time(), results)
+        self._store(entry)
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(entry.to_json() + "\n")
+
+    def _store(self, entry: CacheEntry) -> None:
+        self._entries[entry.query] = entry
+        self._entries.move_to_end(entry.query)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self) -> None:
+        """Relit le fichier (dernière entrée de chaque recherche) puis le compacte."""
+        assert self.path is not None
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = CacheEntry.from_json(line)
+            except (ValueError, KeyError, TypeError):
+                continue
+            if self._fresh(entry):
+                self._store(entry)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text("".join(e.to_json() + "\n" for e in self._entries.values()), "utf-8")
+        tmp.replace(self.path)
+        logger.info("🗃️ cache youtube : %d recherches rechargées", len(self._entries))
+
+    def summary(self) -> str:
+        return (
+            f"Cache : {len(self)} recherches, {self.hits} hits / {self.misses} miss "
+            f"({self.hit_ratio:.0%}), {self.quota_saved} unités de quota économisées"
+        )
@@ -0,0 +1,136 @@
+"""
+youtube_details.py
+
+Détails des résultats de youtubelist (durée, vues, chaîne).
+Il fournit :
+- Details : les informations affichées sous un résultat
+- format_duration / format_views : mise en forme (ISO 8601 -> 3:45, 1234567 -> 1,2 M)
+- DetailsCache : détails par id, récupérés par lots (un videos.list et un playlists.list
+  au plus par page de résultats, en parallèle) et gardés en mémoire
+
+Les chaînes n'ont pas d'appel dédié : leur nom est déjà le titre du résultat.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass
+
+from .youtube_api import Result, YoutubeClient
+
+logger = logging.getLogger(__name__)
+
+DURATION_RE = re.compile(r"P(?:(\d+)D)?T?(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+@dataclass(frozen=True)
+class Details:
+    channel: str = ""
+    duration: str = ""
+    views: int | None = None
+    videos: int | None = None  # nombre de vidéos d'une playlist
+
+    def describe(self) -> str:
+        parts = []
+        if self.duration:
+            parts.append(f"⏱️ {self.duration}")
+        if self.views is not None:
+            parts.append(f"👁️ {format_views(self.views)} vues")
+        if self.videos is not None:
+            parts.append(f"🎞️ {self.videos} vidéos")
+        if self.channel:
+            parts.append(f"📺 {self.channel}")
+        return " · ".join(parts)
+
+
+def format_duration(iso: str) -> str:
+    """Durée ISO 8601 de l'API ("PT1H2M3S") en "1:02:03"."""
+    m = DURATION_RE.fullmatch(iso or "")
+    if m is None:
+        return ""
+    days, hours, minutes, seconds = (int(g or 0) for g in m.groups())
+    hours += days * 24
+    if not (hours or minutes or seconds):  # direct : "P0D"
+        return ""
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def format_views(views: int) -> str:
+    for threshold, suffix in ((1_000_000_000, "Md"), (1_000_000, "M"), (1_000, "k")):
+        if views >= threshold:
+            value = f"{views / threshold:.1f}".removesuffix(".0").replace(".", ",")
+            return f"{value} {suffix}"
+    return str(views)
+
+
+def parse_video(item: dict) -> Details:
+    stats = item.get("statistics", {})
+    return Details(
+        channel=item.get("snippet", {}).get("channelTitle", ""),
+        duration=format_duration(item.get("contentDetails", {}).get("duration", "")),
+        views=int(stats["viewCount"]) if "viewCount" in stats else None,
+    )
+
+
+def parse_playlist(item: dict) -> Details:
+    count = item.get("contentDetails", {}).get("itemCount")
+    return Details(
+        channel=item.get("snippet", {}).get("channelTitle", ""),
+        videos=int(count) if count is not None else None,
+    )
+
+
+class DetailsCache:
+    """
+    Détails des vidéos et playlists, par id.
+
+    Args:
+        api (YoutubeClient): client de l'API.
+        ttl (float): durée de vie des détails (les vues changent), en secondes.
+    """
+
+    def __init__(self, api: YoutubeClient, ttl: float) -> None:
+        self.api = api
+        self.ttl = ttl
+        self._details: dict[str, tuple[float, Details]] = {}
+
+    def _cached(self, id_: str) -> Details | None:
+        entry = self._details.get(id_)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    async def get(self, results: list[Result]) -> dict[str, Details]:
+        """Détails des résultats (les chaînes et les ids inconnus de l'API sont absents)."""
+        missing: dict[str, list[str]] = {"video": [], "playlist": []}
+        for res in results:
+            if res.type_ in missing and self._cached(res.id_) is None:
+                missing[res.type_].append(res.id_)
+
+        calls = []
+        if missing["video"]:
+            calls.append(
+                self._fetch("/videos", missing["video"], "snippet,contentDetails,statistics")
+            )
+        if missing["playlist"]:
+            calls.append(self._fetch("/playlists", missing["playlist"], "snippet,contentDetails"))
+        await asyncio.gather(*calls)
+
+        found = {res.id_: self._cached(res.id_) for res in results}
+        return {id_: details for id_, details in found.items() if details is not None}
+
+    async def _fetch(self, endpoint: str, ids: list[str], part: str) -> None:
+        parse = parse_video if endpoint == "/videos" else parse_playlist
+        now = time.time()
+        for item in await self.api.list_by_ids(endpoint, ids, part):
+            self._details[item["id"]] = (now, parse(item))
+        logger.info("🔎 détails youtube %s : %d ids", endpoint, len(ids))
+        self._purge(now)
+
+    def _purge(self, now: float) -> None:
+        expired = [id_ for id_, (created, _) in self._details.items() if now - created > self.ttl]
+        for id_ in expired:
+            del self._details[id_]
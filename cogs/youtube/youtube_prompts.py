@@ -0,0 +1,168 @@
+"""
+youtube_prompts.py
+
+Attentes d'événements Discord du cog Youtube, sans un `bot.wait_for` par commande.
+Il fournit :
+- TimerWheel : roue temporelle (expiration en O(1) par attente)
+- PromptDispatcher : un seul point d'entrée par type d'événement, qui retrouve
+  l'attente concernée dans un dict :
+  - suppression d'un message -> par id de message (`watch_delete`)
+  - réponse à une liste -> par (salon, auteur) (`wait_reply`)
+
+Le coût d'un événement ne dépend plus du nombre d'attentes en cours.
+"""
+
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, cast
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+ReplyKey = tuple[int, int]  # (salon, auteur)
+Reply = asyncio.Future[discord.Message | None]
+
+
+class TimerWheel:
+    """
+    Roue temporelle : `slots` cases de `tick` secondes ; les délais plus longs qu'un tour
+    de roue comptent leurs tours restants.
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 64) -> None:
+        self.tick = tick
+        self._slots: list[dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._where: dict[Hashable, int] = {}
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def schedule(self, key: Hashable, delay: float) -> None:
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay / self.tick))
+        slot = (self._cursor + ticks) % len(self._slots)
+        self._slots[slot][key] = (ticks - 1) // len(self._slots)
+        self._where[key] = slot
+
+    def cancel(self, key: Hashable) -> None:
+        slot = self._where.pop(key, None)
+        if slot is not None:
+            del self._slots[slot][key]
+
+    def advance(self) -> list[Hashable]:
+        """Avance d'une case et renvoie les clés expirées."""
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        bucket = self._slots[self._cursor]
+        expired = [key for key, rounds in bucket.items() if rounds == 0]
+        for key in bucket:
+            bucket[key] -= 1
+        for key in expired:
+            del bucket[key]
+            del self._where[key]
+        return expired
+
+
+class PromptDispatcher:
+    """
+    Attentes en cours du cog, servies par les listeners du cog.
+
+    Args:
+        tick (float): résolution des expirations, en secondes.
+    """
+
+    def __init__(self, tick: float = 1.0) -> None:
+        self.wheel = TimerWheel(tick=tick)
+        self._deletes: dict[int, Callable[[], Awaitable[Any]]] = {}
+        self._replies: dict[ReplyKey, tuple[Callable[[discord.Message], bool], Reply]] = {}
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._deletes) + len(self._replies)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        for _, future in self._replies.values():
+            future.cancel()
+        self._replies.clear()
+        self._deletes.clear()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.wheel.tick)
+            for key in self.wheel.advance():
+                self._expire(key)
+
+    def _expire(self, key: Hashable) -> None:
+        kind, ident = cast(tuple[str, Any], key)  # ("delete", message_id) ou ("reply", ReplyKey)
+        if kind == "delete":
+            self._deletes.pop(ident, None)
+        elif (entry := self._replies.pop(ident, None)) is not None:
+            if not entry[1].done():
+                entry[1].set_exception(TimeoutError())
+
+    # --- suppression d'un message ---
+    def watch_delete(
+        self, message_id: int, callback: Callable[[], Awaitable[Any]], timeout: float
+    ) -> None:
+        """Appelle `callback` si le message `message_id` est supprimé avant `timeout`."""
+        self._deletes[message_id] = callback
+        self.wheel.schedule(("delete", message_id), timeout)
+
+    async def on_message_delete(self, message_id: int) -> None:
+        callback = self._deletes.pop(message_id, None)
+        if callback is None:
+            return
+        self.wheel.cancel(("delete", message_id))
+        try:
+            await callback()
+        except discord.HTTPException as e:
+            logger.info("suppression liée au message %d impossible : %s", message_id, e)
+
+    # --- réponse d'un utilisateur ---
+    async def wait_reply(
+        self,
+        channel_id: int,
+        author_id: int,
+        check: Callable[[discord.Message], bool],
+        timeout: float,
+    ) -> discord.Message | None:
+        """
+        Attend le prochain message de `author_id` dans `channel_id` qui passe `check`.
+
+        Returns:
+            discord.Message | None: le message, ou None si l'utilisateur a lancé une autre
+            attente au même endroit entre-temps.
+
+        Raises:
+            TimeoutError: pas de réponse avant `timeout`.
+        """
+        key = (channel_id, author_id)
+        previous = self._replies.pop(key, None)
+        if previous is not None and not previous[1].done():
+            previous[1].set_result(None)
+        future: Reply = asyncio.get_running_loop().create_future()
+        self._replies[key] = (check, future)
+        self.wheel.schedule(("reply", key), timeout)
+        try:
+            return await future
+        finally:
+            if self._replies.get(key, (None, None))[1] is future:
+                del self._replies[key]
+                self.wheel.cancel(("reply", key))
+
+    def on_message(self, message: discord.Message) -> None:
+        entry = self._replies.get((message.channel.id, message.author.id))
+        if entry is None:
+            return
+        check, future = entry
+        if not future.done() and check(message):
+            future.set_result(message)
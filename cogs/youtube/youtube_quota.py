@@ -0,0 +1,173 @@
+"""
+youtube_quota.py
+
+Comptabilité du quota journalier de l'API YouTube Data.
+Il fournit :
+- COSTS : coût en unités de chaque endpoint
+- QuotaLevel : paliers de dégradation selon le quota restant
+- QuotaExhausted : plus assez de quota pour une recherche
+- QuotaLedger : dépense du jour, persistée, remise à zéro à minuit (heure du Pacifique)
+
+Le quota Google est remis à zéro à minuit heure du Pacifique (9h à Paris, le plus souvent).
+"""
+
+import datetime
+import json
+import logging
+import os
+import time
+from collections import Counter, deque
+from enum import IntEnum
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+logger = logging.getLogger(__name__)
+
+PACIFIC = ZoneInfo("America/Los_Angeles")
+PARIS = ZoneInfo("Europe/Paris")
+
+COSTS = {"/search": 100, "/videos": 1, "/playlists": 1}
+RATE_WINDOW = 3600.0  # fenêtre (secondes) pour estimer le rythme de dépense
+
+# paliers, en part du quota journalier restante
+CACHE_FIRST_BELOW = 0.25
+REDUCED_BELOW = 0.10
+
+
+class QuotaLevel(IntEnum):
+    NORMAL = 0
+    CACHE_FIRST = 1  # le cache répond même périmé ou incomplet
+    REDUCED = 2  # recherches limitées à quelques résultats
+    EXHAUSTED = 3  # plus de recherche : refus poli
+
+
+class QuotaExhausted(Exception):
+    """Quota YouTube du jour épuisé."""
+
+
+def quota_day(now: datetime.datetime | None = None) -> datetime.date:
+    """Jour de quota (heure du Pacifique) correspondant à `now`."""
+    return (now or datetime.datetime.now(datetime.UTC)).astimezone(PACIFIC).date()
+
+
+def next_reset(now: datetime.datetime | None = None) -> datetime.datetime:
+    """Prochaine remise à zéro du quota."""
+    day = quota_day(now) + datetime.timedelta(days=1)
+    return datetime.datetime.combine(day, datetime.time(), tzinfo=PACIFIC)
+
+
+class QuotaLedger:
+    """
+    Registre des unités de quota dépensées aujourd'hui.
+
+    Args:
+        daily_quota (int): quota journalier du projet Google.
+        path (Path | None): fichier JSON où le registre survit aux redémarrages.
+    """
+
+    def __init__(self, daily_quota: int, path: Path | None = None) -> None:
+        self.daily_quota = daily_quota
+        self.path = path
+        self.day = quota_day()
+        self.spent = 0
+        self.by_endpoint: Counter[str] = Counter()
+        self.recent: deque[tuple[float, int]] = deque()
+        if path is not None:
+            self._load()
+
+    def _roll(self) -> None:
+        today = quota_day()
+        if today != self.day:
+            logger.info("📅 quota youtube remis à zéro (%d unités dépensées hier)", self.spent)
+            self.day = today
+            self.spent = 0
+            self.by_endpoint.clear()
+
+    @property
+    def remaining(self) -> int:
+        self._roll()
+        return max(self.daily_quota - self.spent, 0)
+
+    def record(self, endpoint: str, cost: int | None = None) -> None:
+        """Enregistre un appel à `endpoint` (coût de COSTS par défaut)."""
+        self._roll()
+        cost = COSTS.get(endpoint, 1) if cost is None else cost
+        self.spent += cost
+        self.by_endpoint[endpoint] += cost
+        self.recent.append((time.time(), cost))
+        self._save()
+
+    def exhaust(self) -> None:
+        """L'API a répondu quotaExceeded : notre compte était faux, on s'aligne."""
+        self._roll()
+        self.spent = max(self.spent, self.daily_quota)
+        self._save()
+
+    def level(self) -> QuotaLevel:
+        remaining = self.remaining
+        if remaining < COSTS["/search"]:
+            return QuotaLevel.EXHAUSTED
+        if remaining < self.daily_quota * REDUCED_BELOW:
+            return QuotaLevel.REDUCED
+        if remaining < self.daily_quota * CACHE_FIRST_BELOW:
+            return QuotaLevel.CACHE_FIRST
+        return QuotaLevel.NORMAL
+
+    def rate(self) -> float:
+        """Unités dépensées par heure, sur la dernière heure."""
+        limit = time.time() - RATE_WINDOW
+        while self.recent and self.recent[0][0] < limit:
+            self.recent.popleft()
+        return sum(cost for _, cost in self.recent) * 3600 / RATE_WINDOW
+
+    def forecast(self) -> datetime.datetime | None:
+        """Heure d'épuisement au rythme actuel, ou None si la remise à zéro arrive avant."""
+        rate = self.rate()
+        if rate <= 0:
+            return None
+        now = datetime.datetime.now(datetime.UTC)
+        exhausted_at = now + datetime.timedelta(hours=self.remaining / rate)
+        return exhausted_at if exhausted_at < next_reset(now) else None
+
+    def summary(self) -> str:
+        forecast = self.forecast()
+        reset = next_reset().astimezone(PARIS)
+        lines = [
+            f"Quota : {self.spent}/{self.daily_quota} unités ({self.level().name}), "
+            f"remise à zéro à {reset:%H:%M} (Paris)",
+            f"Rythme : {self.rate():.0f} unités/h — "
+            + (
+                f"épuisement prévu à {forecast.astimezone(PARIS):%H:%M}"
+                if forecast
+                else "pas d'épuisement prévu avant la remise à zéro"
+            ),
+        ]
+        if self.by_endpoint:
+            lines.append(", ".join(f"{e} : {c}" for e, c in self.by_endpoint.most_common()))
+        return "\n".join(lines)
+
+    def _load(self) -> None:
+        assert self.path is not None
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return
+        self.recent = deque((t, c) for t, c in data.get("recent", []))
+        if data.get("day") == self.day.isoformat():
+            self.spent = data["spent"]
+            self.by_endpoint = Counter(data.get("by_endpoint", {}))
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.rate()  # purge les appels hors fenêtre
+        data = {
+            "day": self.day.isoformat(),
+            "spent": self.spent,
+            "by_endpoint": self.by_endpoint,
+            "recent": list(self.recent),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,109 @@
+"""
+youtube_suggest.py
+
+Suggestions pour l'autocomplétion de /youtube.
+Il fournit :
+- Suggester : recherches déjà en cache, complétées par les suggestions YouTube de Google
+
+Discord envoie une requête d'autocomplétion à chaque frappe : la requête réseau n'est
+lancée qu'après DEBOUNCE secondes sans nouvelle frappe du même utilisateur, et celle
+d'une frappe précédente est annulée. Une réponse part toujours avant DEADLINE secondes
+(Discord abandonne au bout de 3 s), au pire avec les seules recherches en cache.
+Les suggestions Google ne consomment pas de quota YouTube.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+
+import httpx
+
+from utils.tools import headers
+
+from .youtube_cache import SearchCache, normalize_query
+
+logger = logging.getLogger(__name__)
+
+SUGGEST_URL = "https://suggestqueries.google.com/complete/search"
+DEBOUNCE = 0.3
+DEADLINE = 2.5
+MIN_CHARS = 2  # pas de requête réseau en dessous
+MAX_CHOICES = 25  # limite Discord
+
+
+class Suggester:
+    """
+    Source de suggestions, une par cog.
+
+    Args:
+        cache (SearchCache): cache des recherches (suggestions locales, sans réseau).
+        client (httpx.AsyncClient | None): client HTTP (tests), sinon un client dédié.
+        debounce (float): délai sans frappe avant la requête réseau.
+        deadline (float): temps maximum pour répondre.
+        memo_size (int): nombre de préfixes dont les suggestions sont gardées en mémoire.
+    """
+
+    def __init__(
+        self,
+        cache: SearchCache,
+        client: httpx.AsyncClient | None = None,
+        debounce: float = DEBOUNCE,
+        deadline: float = DEADLINE,
+        memo_size: int = 500,
+    ) -> None:
+        self.cache = cache
+        self.debounce = debounce
+        self.deadline = deadline
+        self.memo_size = memo_size
+        self._client = client or httpx.AsyncClient(headers=headers, timeout=deadline)
+        self._pending: dict[int, asyncio.Task] = {}
+        self._memo: OrderedDict[str, list[str]] = OrderedDict()
+
+    async def aclose(self) -> None:
+        for task in self._pending.values():
+            task.cancel()
+        await self._client.aclose()
+
+    async def suggest(self, user_id: int, current: str) -> list[str]:
+        """Suggestions pour le texte `current` tapé par `user_id` (au plus MAX_CHOICES)."""
+        prefix = normalize_query(current)
+        local = self.cache.queries(prefix, limit=MAX_CHOICES)
+        if len(prefix) < MIN_CHARS:
+            return local
+        if prefix in self._memo:
+            self._memo.move_to_end(prefix)
+            return self._merge(local, self._memo[prefix])
+
+        previous = self._pending.pop(user_id, None)
+        if previous is not None:
+            previous.cancel()  # l'utilisateur a continué à taper
+        task = asyncio.create_task(self._remote(prefix))
+        self._pending[user_id] = task
+        try:
+            await asyncio.wait({task}, timeout=self.deadline)
+        finally:
+            if self._pending.get(user_id) is task:
+                del self._pending[user_id]
+        if not task.done() or task.cancelled() or task.exception() is not None:
+            return local
+        return self._merge(local, task.result())
+
+    async def _remote(self, prefix: str) -> list[str]:
+        await asyncio.sleep(self.debounce)
+        try:
+            resp = await self._client.get(
+                SUGGEST_URL, params={"client": "firefox", "ds": "yt", "q": prefix}
+            )
+            resp.raise_for_status()
+            suggestions = [str(s) for s in resp.json()[1]]
+        except (httpx.HTTPError, ValueError, IndexError) as e:
+            logger.info("suggestions youtube indisponibles pour %r : %s", prefix, e)
+            return []
+        self._memo[prefix] = suggestions
+        while len(self._memo) > self.memo_size:
+            self._memo.popitem(last=False)
+        return suggestions
+
+    @staticmethod
+    def _merge(local: list[str], remote: list[str]) -> list[str]:
+        return list(dict.fromkeys(local + remote))[:MAX_CHOICES]
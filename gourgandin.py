@@ -10,7 +10,7 @@ import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
-from utils.tools import get_ram_usage_mb
+from utils.monitoring import get_ram_usage_mb
 
 # Logging
 logging.basicConfig(level=logging.INFO)
@@ -56,13 +56,13 @@ bot = commands.Bot(
 )
 
 cogs_ext_list = [
-    "cogs.bonjourmadame",
+    "cogs.bonjourmadame.bonjourmadame",
     "cogs.misc",
-    "cogs.lemonde",
+    "cogs.lemonde.lemonde",
     "cogs.code",
-    #  "cogs.jv",
+    #  "cogs.jv.jv",
     "cogs.redditbabes.redditbabes",
-    "cogs.youtube",
+    "cogs.youtube.youtube",
     "cogs.nsfwapi",
 ]
 
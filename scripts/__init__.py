@@ -0,0 +1 @@
+"""Scripts de développement (benchmarks) : hors du bot, dépendances du groupe dev."""
@@ -0,0 +1,158 @@
+"""
+bench_jv.py
+
+Benchmarks du scraping des sorties, anciennes implémentations gardées ici comme référence :
+- extraction des pages : BeautifulSoup ("html.parser") contre selectolax (jv_scraper.extract_rows)
+- dates de sortie : dateparser contre jv_dates.parse_release_date (lignes/s, temps d'import)
+Il fournit :
+- extract_rows_bs4 : l'ancienne extraction, même sortie que jv_scraper.extract_rows
+- release_date_dateparser : l'ancienne lecture des dates, via dateparser
+- bench : temps et pic mémoire par page pour une implémentation (mémoire suivie par
+  tracemalloc : l'arbre lexbor de selectolax, alloué en C, n'y figure pas)
+- bench_dates : lignes par seconde d'une lecture de dates
+- import_time : temps d'import d'un module dans un interpréteur neuf
+
+BeautifulSoup n'est plus une dépendance du bot (groupe dev). Usage, depuis la racine
+du projet (fixture des tests par défaut) :
+    python -m scripts.bench_jv [page.html] [répétitions]
+"""
+
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+from cogs.jv.jv_dates import _parse_parts, parse_release_date
+from cogs.jv.jv_scraper import BASE_URL, Row, extract_rows
+
+if TYPE_CHECKING:
+    from dateparser.date import DateDataParser
+
+FIXTURE = Path(__file__).parents[1] / "tests" / "cogs" / "fixtures" / "jv_sorties.html"
+
+
+def _unbloat_title_bs4(title: Tag | None) -> None:
+    if title is not None and (em := title.find("em")) is not None:
+        em.decompose()  # remove some bloats
+
+
+def _href(tag: Tag | None) -> str | None:
+    href = tag.get("href") if tag is not None else None
+    return href if isinstance(href, str) else None
+
+
+def _find_page_urls_bs4(tag: Tag | None) -> list[str]:
+    if tag is None:
+        return []
+    hrefs = (_href(a) for a in tag.find_all("a", class_=re.compile("page")))
+    return list(dict.fromkeys(urljoin(BASE_URL, href) for href in hrefs if href))
+
+
+def extract_rows_bs4(html: str) -> tuple[list[Row], list[str]]:
+    """Ancienne extraction (BeautifulSoup, "html.parser")."""
+    soup = BeautifulSoup(html, "html.parser")
+    list_of_new_games = soup.select("div[class*='gameMetadatas']")
+    pages = _find_page_urls_bs4(soup.select_one("div[class*='pagination']"))
+
+    rows: list[Row] = []
+    for sortie in list_of_new_games:
+        title_tag = sortie.select_one("a[class*='gameTitleLink']")
+        date_tag = sortie.select_one("span[class*='releaseDate']")
+        if title_tag is None or date_tag is None:
+            continue
+        _unbloat_title_bs4(title_tag)
+        if (tmp := sortie.select_one("div[class*='platforms']")) is not None:
+            platform = f"Plateformes :\t {tmp.text}"
+        else:
+            platform = "no platform"
+        part = _href(sortie.select_one("div > span > h2 > a"))
+        rows.append((title_tag.text, date_tag.text, platform, part))
+    return rows, pages
+
+
+@lru_cache(maxsize=1)
+def _ddp() -> "DateDataParser":
+    from dateparser.date import DateDataParser
+
+    return DateDataParser(languages=["fr"])
+
+
+def release_date_dateparser(raw: str) -> date | None:
+    """Ancienne lecture des dates (dateparser, pour chaque ligne)."""
+    date_obj = _ddp().get_date_data(re.sub("Sortie: ", "", raw)).date_obj
+    return date_obj.date() if date_obj else None
+
+
+def bench(extract: Callable[[str], object], html: str, rounds: int) -> tuple[float, float]:
+    """Temps moyen (ms) et pic mémoire (Kio) de `extract` sur une page."""
+    tracemalloc.start()
+    extract(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        extract(html)
+    return (time.perf_counter() - start) * 1000 / rounds, peak / 1024
+
+
+def bench_dates(
+    parse: Callable[[str], date | None],
+    releases: list[str],
+    rounds: int,
+    reset: Callable[[], None] | None = None,
+) -> float:
+    """Lignes lues par seconde ; `reset` vide le mémo avant chaque passe (lecture à froid)."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if reset is not None:
+            reset()
+        for raw in releases:
+            parse(raw)
+    return len(releases) * rounds / (time.perf_counter() - start)
+
+
+def import_time(module: str) -> float:
+    """Temps (ms) d'import de `module` dans un interpréteur neuf, démarrage déduit."""
+
+    def run(code: str) -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        return time.perf_counter() - start
+
+    baseline = min(run("pass") for _ in range(3))
+    return (min(run(f"import {module}") for _ in range(3)) - baseline) * 1000
+
+
+if __name__ == "__main__":  # python -m scripts.bench_jv [page.html] [rounds]
+    page = Path(sys.argv[1]) if len(sys.argv) > 1 else FIXTURE
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    html = page.read_text(encoding="utf-8")
+    rows, _ = extract_rows(html)
+    assert extract_rows_bs4(html) == extract_rows(html), "sorties différentes"
+    print(f"{page.name} : {len(rows)} jeux, {len(html) / 1024:.0f} Kio, {rounds} passes")
+    for name, extract in (("bs4 html.parser", extract_rows_bs4), ("selectolax", extract_rows)):
+        ms, kib = bench(extract, html, rounds)
+        print(f"{name:16} {ms:7.2f} ms/page   pic mémoire {kib:8.0f} Kio")
+
+    releases = [release for _, release, _, _ in rows]
+    assert [parse_release_date(r) for r in releases] == [
+        release_date_dateparser(r) for r in releases
+    ], "dates différentes"
+    print(f"\ndates : {len(releases)} lignes")
+    for name, parse, reset in (
+        ("dateparser", release_date_dateparser, None),
+        ("jv_dates (froid)", parse_release_date, _parse_parts.cache_clear),
+        ("jv_dates (mémo)", parse_release_date, None),
+    ):
+        print(f"{name:16} {bench_dates(parse, releases, 20, reset):10.0f} lignes/s")
+    for module in ("dateparser.date", "cogs.jv.jv_dates"):
+        print(f"import {module:17} {import_time(module):6.0f} ms")
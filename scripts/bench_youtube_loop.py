@@ -0,0 +1,80 @@
+"""
+bench_youtube_loop.py
+
+Benchmark de la latence de la boucle asyncio pendant des recherches YouTube :
+l'ancien client bloquant (googleapiclient) contre YoutubeClient (httpx async).
+Il fournit :
+- measure_lag : durée d'un travail et pire retard de la boucle pendant ce travail
+- benchmark : les deux clients sur la même recherche
+
+google-api-python-client n'est plus une dépendance du bot (groupe dev) :
+    python -m scripts.bench_youtube_loop "ma recherche"
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Awaitable, Callable
+
+from dotenv import load_dotenv
+
+from cogs.youtube.youtube_api import YoutubeClient
+
+
+async def measure_lag(
+    work: Callable[[], Awaitable[None]], interval: float = 0.01
+) -> tuple[float, float]:
+    """Exécute `work()` et mesure le pire retard d'un tick de `interval` secondes."""
+    worst = 0.0
+    done = False
+
+    async def ticker() -> None:
+        nonlocal worst
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            worst = max(worst, time.perf_counter() - start - interval)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0)  # le ticker attend déjà quand le travail commence
+    start = time.perf_counter()
+    await work()
+    elapsed = time.perf_counter() - start
+    done = True
+    await tick
+    return elapsed, worst
+
+
+async def benchmark(query: str, rounds: int) -> None:
+    import googleapiclient.discovery  # ancien client, bloquant
+
+    api_key = os.getenv("TOKEN_YOUTUBE")
+
+    async def before() -> None:
+        for _ in range(rounds):
+            youtube = googleapiclient.discovery.build(
+                "youtube", "v3", developerKey=api_key, cache_discovery=False
+            )
+            youtube.search().list(part="snippet", maxResults=5, q=query).execute()  # pylint: disable=no-member
+
+    client = YoutubeClient(api_key)
+
+    async def after() -> None:
+        for _ in range(rounds):
+            await client.search(query, 5)
+
+    try:
+        for name, work in (("googleapiclient", before), ("httpx async", after)):
+            elapsed, worst = await measure_lag(work)
+            print(
+                f"{name:16} {rounds} recherches en {elapsed:.2f}s, "
+                f"retard max de la boucle : {worst * 1000:.0f} ms"
+            )
+    finally:
+        await client.aclose()
+
+
+if __name__ == "__main__":  # python -m scripts.bench_youtube_loop "query" from root folder
+    load_dotenv()
+    asyncio.run(benchmark(sys.argv[1] if len(sys.argv) > 1 else "daft punk", rounds=5))
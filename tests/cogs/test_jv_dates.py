@@ -0,0 +1,38 @@
+from datetime import date
+
+import pytest
+
+from cogs.jv import jv_dates
+from cogs.jv.jv_dates import parse_release_date
+
+TODAY = date(2025, 1, 31)
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Sortie: 12 mars 2025", date(2025, 3, 12)),
+        ("Sortie : 1er Août 2025", date(2025, 8, 1)),
+        ("04 avril 2025", date(2025, 4, 4)),
+        ("12/03/2025", date(2025, 3, 12)),
+        ("mars 2025", date(2025, 3, 31)),  # jour d'aujourd'hui, comme dateparser
+        ("Sortie: février 2025", date(2025, 2, 28)),  # ramené au dernier jour du mois
+        ("2026", date(2026, 1, 31)),
+        ("Sortie: TBA", None),
+        ("31 février 2025", None),
+    ],
+)
+def test_parse_release_date_common_formats(monkeypatch, raw, expected):
+    def no_fallback(raw):
+        raise AssertionError(f"dateparser appelé pour {raw!r}")
+
+    monkeypatch.setattr(jv_dates, "_parse_fallback", no_fallback)
+    jv_dates._parse_parts.cache_clear()
+    assert parse_release_date(raw, today=TODAY) == expected
+
+
+def test_parse_release_date_falls_back_to_dateparser_once():
+    jv_dates._parse_parts.cache_clear()
+    assert parse_release_date("Sortie: mardi 12 mars 2025") == date(2025, 3, 12)
+    parse_release_date("Sortie: mardi 12 mars 2025")
+    assert jv_dates._parse_parts.cache_info().hits == 1
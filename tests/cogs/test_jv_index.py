@@ -0,0 +1,49 @@
+from datetime import date, timedelta
+
+import httpx
+import pytest
+
+from cogs.jv.jv_index import ReleaseIndex
+from cogs.jv.jv_scraper import JVClient
+
+MONTHS = ["janvier", "fevrier", "mars", "avril", "mai", "juin", "juillet", "aout",
+          "septembre", "octobre", "novembre", "decembre"]  # fmt: skip
+
+
+def page(*games: tuple[str, date]) -> str:
+    rows = "".join(
+        f"""<div class="gameMetadatas__x"><div><span><h2>
+        <a class="gameTitleLink__x" href="/jeux/{name}.htm">{name}</a></h2></span></div>
+        <span class="releaseDate__x">Sortie: {day:%d/%m/%Y}</span></div>"""
+        for name, day in games
+    )
+    return f"<html><body>{rows}</body></html>"
+
+
+@pytest.mark.asyncio
+async def test_index_queries_both_months_from_memory():
+    today = date.today()
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if f"-{MONTHS[today.month - 1]}-" in request.url.path:
+            return httpx.Response(
+                200, text=page(("semaine", today + timedelta(days=5)), ("jour", today))
+            )
+        return httpx.Response(200, text=page(("mois", today + timedelta(days=20))))
+
+    index = ReleaseIndex(JVClient(httpx.AsyncClient(transport=httpx.MockTransport(handler))), 60)
+    assert index.age("PC") is None
+    await index.refresh()
+    assert len(requested) == 10  # 5 plateformes x 2 mois
+
+    assert [g.name for g in await index.query("PC", today, today)] == ["jour"]
+    week = await index.query("PC", today, today + timedelta(days=7))
+    assert [g.name for g in week] == ["jour", "semaine"]
+    month = await index.query("Toutes", today, today + timedelta(days=31))
+    assert [g.name for g in month] == ["jour", "semaine", "mois"]
+    assert len(requested) == 10  # servi depuis l'index
+    age = index.age("PC")
+    assert age is not None and age < 5
+    await index.client.aclose()
@@ -0,0 +1,85 @@
+import asyncio
+from datetime import date
+
+import httpx
+import pytest
+
+from cogs.jv.jv_scraper import JVClient, extract_rows, generate_url, next_month, parse_page
+from scripts.bench_jv import FIXTURE, extract_rows_bs4
+
+MONTH_URL = "https://www.jeuxvideo.com/sorties/dates-de-sortie-pc-mars-2025-date.htm"
+
+
+def game(name: str, release: str, href: str) -> str:
+    return f"""
+    <div class="gameMetadatas__x">
+      <div><span><h2><a class="gameTitleLink__x" href="{href}">{name}<em> sur PC</em></a></h2>
+      </span></div>
+      <span class="releaseDate__x">{release}</span>
+      <div class="platforms__x">PC</div>
+    </div>"""
+
+
+def page(games: str, *pages: int) -> str:
+    links = "".join(f'<a class="pagination__page" href="{MONTH_URL}?p={p}">{p}</a>' for p in pages)
+    return f"<html><body>{games}<div class='pagination__x'>{links}</div></body></html>"
+
+
+PAGES = {
+    MONTH_URL: page(game("Alpha", "Sortie: 12 mars 2025", "/jeux/alpha.htm"), 2, 3),
+    f"{MONTH_URL}?p=2": page(game("Beta", "Sortie: 20 mars 2025", "/jeux/beta.htm"), 3, 4),
+    f"{MONTH_URL}?p=3": page(game("Gamma", "mars 2025", "/jeux/gamma.htm"), 2, 4),
+    f"{MONTH_URL}?p=4": page(game("Delta", "TBA", "/jeux/delta.htm"), 3),
+}
+
+
+def test_parse_page():
+    games, links = parse_page(PAGES[MONTH_URL])
+    assert [(g.name, g.release, g.platforms, g.url, g.date) for g in games] == [
+        (
+            "Alpha",
+            "Sortie: 12 mars 2025",
+            "Plateformes :\t PC",
+            "https://www.jeuxvideo.com/jeux/alpha.htm",
+            date(2025, 3, 12),
+        )
+    ]
+    assert links == [f"{MONTH_URL}?p=2", f"{MONTH_URL}?p=3"]
+    assert generate_url(3, 2025, "PC") == MONTH_URL
+    assert next_month(12, 2025) == (1, 2026)
+
+
+def test_selectolax_rows_match_bs4():
+    html = FIXTURE.read_text(encoding="utf-8")
+    rows, pages = extract_rows(html)
+    assert (rows, pages) == extract_rows_bs4(html)
+    assert len(rows) == 40 and len(pages) == 2
+    assert any(platforms == "no platform" for _, _, platforms, _ in rows)
+
+
+@pytest.mark.asyncio
+async def test_fetch_month_prefetches_pages_once():
+    requested = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, text=PAGES[str(request.url)])
+
+    jv = JVClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    first, second = await asyncio.gather(jv.fetch_month(MONTH_URL), jv.fetch_month(MONTH_URL))
+
+    assert [g.name for g in first] == ["Alpha", "Beta", "Gamma", "Delta"]
+    assert [g.name for g in second] == ["Alpha", "Beta", "Gamma", "Delta"]
+    assert sorted(requested) == sorted(PAGES)  # chaque page une seule fois
+    memo = [len((await jv.fetch_page(url))[0]) for url in PAGES]
+    for _ in range(3):
+        assert [g.name for g in await jv.fetch_month(MONTH_URL)] == [
+            "Alpha",
+            "Beta",
+            "Gamma",
+            "Delta",
+        ]
+    assert [len((await jv.fetch_page(url))[0]) for url in PAGES] == memo == [1, 1, 1, 1]
+    assert jv.fetched == 4
+    await jv.aclose()
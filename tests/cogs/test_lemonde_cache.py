@@ -0,0 +1,71 @@
+import os
+import time
+from pathlib import Path
+
+from cogs.lemonde.lemonde_cache import ArticleCache, canonical_article_id
+from cogs.lemonde.lemonde_models import ArticlePdf
+
+ARTICLE = "https://www.lemonde.fr/societe/article/2024/10/05/proces-mazan_6344040_3224.html"
+
+
+def test_canonical_article_id_variants():
+    variants = [
+        ARTICLE,
+        ARTICLE + "?utm_source=x#comments",
+        ARTICLE.replace("www.lemonde.fr/", "www.lemonde.fr/amp/"),
+        ARTICLE.replace("www.", "m."),
+    ]
+    assert {canonical_article_id(url) for url in variants} == {"lemonde:6344040"}
+
+
+def test_canonical_article_id_without_numeric_id():
+    assert (
+        canonical_article_id("https://www.lemonde.fr/live/direct/?a=1") == "lemonde.fr/live/direct"
+    )
+
+
+def make_pdf(tmp_path: Path, name: str, size: int) -> ArticlePdf:
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return ArticlePdf(path=path, warning=None)
+
+
+def test_cache_put_get_and_ttl(tmp_path):
+    cache = ArticleCache(tmp_path / "cache", max_bytes=10_000, ttl=60)
+    cached = cache.put(
+        "lemonde:1", [ArticlePdf(path=make_pdf(tmp_path, "a.pdf", 10).path, warning="w")]
+    )
+
+    assert cache.get("lemonde:1") == cached
+    assert cached[0].warning == "w"
+
+    expired = ArticleCache(tmp_path / "cache", max_bytes=10_000, ttl=0)
+    time.sleep(0.01)
+    assert expired.get("lemonde:1") is None
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ArticleCache(tmp_path / "cache", max_bytes=500, ttl=60)
+    old = cache.put("old", [make_pdf(tmp_path, "old.pdf", 150)])
+    cache.put("used", [make_pdf(tmp_path, "used.pdf", 150)])
+    os.utime(old[0].path.parent / "meta.json", (0, 0))
+    cache.get("used")
+
+    cache.put("new", [make_pdf(tmp_path, "new.pdf", 150)])
+
+    assert "old" not in cache
+    assert "used" in cache
+    assert "new" in cache
+
+
+def test_cache_text_entries_are_separate_from_pdfs(tmp_path):
+    cache = ArticleCache(tmp_path / "cache", max_bytes=10_000, ttl=60)
+    cache.put_text("lemonde:1", "# Titre")
+
+    assert cache.get_text("lemonde:1") == "# Titre"
+    assert cache.get("lemonde:1") is None
+    assert "lemonde:1" not in cache
+
+    pdfs = cache.put("lemonde:1", [make_pdf(tmp_path, "a.pdf", 10)])
+    assert cache.get("lemonde:1") == pdfs
+    assert cache.get_text("lemonde:1") == "# Titre"
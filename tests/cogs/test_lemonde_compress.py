@@ -0,0 +1,87 @@
+import asyncio
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from cogs.lemonde import lemonde_compress
+from cogs.lemonde.lemonde_compress import PROFILES, compress_all
+from cogs.lemonde.lemonde_models import ArticlePdf
+
+FAKE_GS = """#!{python}
+import sys
+out = next(a for a in sys.argv if a.startswith("-sOutputFile=")).split("=", 1)[1]
+open(out, "wb").write(b"%PDF small")
+"""
+
+SLOW_GS = """#!{python}
+import time
+time.sleep(30)
+"""
+
+
+def install_gs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, script: str
+) -> list[asyncio.subprocess.Process]:
+    gs = tmp_path / "gs"
+    gs.write_text(script.format(python=sys.executable))
+    gs.chmod(0o755)
+    monkeypatch.setattr(lemonde_compress, "GS", str(gs))
+    procs: list[asyncio.subprocess.Process] = []
+    spawn = asyncio.create_subprocess_exec
+
+    async def tracked(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+        procs.append(await spawn(*args, **kwargs))
+        return procs[-1]
+
+    monkeypatch.setattr(lemonde_compress.asyncio, "create_subprocess_exec", tracked)
+    return procs
+
+
+def test_gs_command_applies_profile(monkeypatch, tmp_path):
+    monkeypatch.setattr(lemonde_compress, "GS", "gs")
+    args = lemonde_compress.gs_command(PROFILES["mobile"], tmp_path / "a.pdf", tmp_path / "b.pdf")
+
+    assert args[0] == "gs"
+    assert "-dColorImageResolution=110" in args
+    assert "-dJPEGQ=60" in args
+    assert args[-2:] == [f"-sOutputFile={tmp_path / 'b.pdf'}", str(tmp_path / "a.pdf")]
+
+
+@pytest.mark.asyncio
+async def test_compress_all_replaces_only_smaller_pdfs(monkeypatch, tmp_path):
+    install_gs(monkeypatch, tmp_path, FAKE_GS)
+
+    big = tmp_path / "big.pdf"
+    big.write_bytes(b"x" * 1000)
+    tiny = tmp_path / "tiny.pdf"
+    tiny.write_bytes(b"x")
+
+    articles = await compress_all([ArticlePdf(big), ArticlePdf(tiny, "w")], "mobile")
+
+    assert [a.path for a in articles] == [big, tiny]
+    assert big.read_bytes() == b"%PDF small"
+    assert tiny.read_bytes() == b"x"
+    assert articles[1].warning == "w"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["big.pdf", "gs", "tiny.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_slow_gs_is_killed_on_timeout_and_cancel(monkeypatch, tmp_path):
+    procs = install_gs(monkeypatch, tmp_path, SLOW_GS)
+    monkeypatch.setattr(lemonde_compress, "COMPRESS_TIMEOUT", 0.5)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_bytes(b"x" * 100)
+
+    result = await lemonde_compress.compress_pdf(ArticlePdf(pdf), PROFILES["mobile"])
+    assert result.after == 100 and procs[0].returncode is not None
+
+    task = asyncio.create_task(lemonde_compress.compress_pdf(ArticlePdf(pdf), PROFILES["mobile"]))
+    while len(procs) < 2:
+        await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert procs[1].returncode is not None  # tué et attendu, pas d'orphelin
+    assert pdf.read_bytes() == b"x" * 100
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+from cogs.lemonde.lemonde_delivery import deliver_pdfs, group_pdfs, join_lines
+from cogs.lemonde.lemonde_models import ArticlePdf
+
+
+def make(tmp_path: Path, name: str, size: int) -> ArticlePdf:
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return ArticlePdf(path=path)
+
+
+def test_group_pdfs_respects_count_and_size(tmp_path):
+    articles = [make(tmp_path, f"{i}.pdf", 10) for i in range(12)]
+    articles += [make(tmp_path, "big.pdf", 95), make(tmp_path, "huge.pdf", 500)]
+
+    batches, oversized = group_pdfs(articles, size_limit=100, max_files=10)
+
+    assert [len(b) for b in batches] == [10, 2, 1]
+    assert [a.path.name for a in oversized] == ["huge.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_deliver_pdfs_closes_files_on_failure(tmp_path):
+    articles = [make(tmp_path, "a.pdf", 60), make(tmp_path, "b.pdf", 60)]
+    sent = []
+
+    async def send(files):
+        sent.append(files)
+        if len(sent) == 2:
+            raise RuntimeError("upload")
+
+    with pytest.raises(RuntimeError):
+        await deliver_pdfs(send, articles, size_limit=100)
+
+    assert [f.filename for files in sent for f in files] == ["a.pdf", "b.pdf"]
+    assert all(f.fp.closed for files in sent for f in files)
+    assert all(a.path.exists() for a in articles)
+
+
+@pytest.mark.asyncio
+async def test_deliver_pdfs_streams_from_cache_files(tmp_path):
+    articles = [make(tmp_path, "a.pdf", 60), make(tmp_path, "b.pdf", 30)]
+    sent = []
+
+    async def send(files):
+        sent.append([(f.filename, f.fp.name, f.fp.read()) for f in files])
+
+    report = await deliver_pdfs(send, articles, size_limit=100)
+
+    # fichiers du cache ouverts tels quels, pas de copie en mémoire
+    assert sent == [
+        [("a.pdf", str(articles[0].path), b"x" * 60), ("b.pdf", str(articles[1].path), b"x" * 30)]
+    ]
+    assert (report.messages, report.files, report.bytes_sent) == (1, 2, 90)
+    assert report.rss_delta_mb >= 0
+
+
+def test_join_lines_stays_under_discord_limit():
+    lines = ["📚 3/40 articles"] + [
+        f"❌ <https://www.lemonde.fr/a_{i}.html> : délai dépassé" for i in range(40)
+    ]
+
+    text = join_lines(lines, limit=500)
+
+    assert len(text) <= 500
+    assert text.startswith("📚 3/40 articles\n❌")
+    assert text.endswith("lignes de plus")
+    assert join_lines(lines[:3]) == "\n".join(lines[:3])
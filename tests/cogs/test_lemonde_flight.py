@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+from cogs.lemonde.lemonde_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_result_and_events():
+    flights = SingleFlight()
+    calls = 0
+    seen = []
+    release = asyncio.Event()
+
+    async def factory(flight):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        await flight.emit("on_retry", 1, 2.0, TimeoutError())
+        return ["a.pdf"]
+
+    async def waiter(name):
+        async def on_retry(attempt, delay, exc):
+            seen.append((name, attempt))
+
+        return await flights.run("lemonde:1", factory, on_retry=on_retry)
+
+    tasks = [asyncio.create_task(waiter(name)) for name in ("alice", "bob")]
+    await asyncio.sleep(0)
+    assert "lemonde:1" in flights
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [["a.pdf"], ["a.pdf"]]
+    assert calls == 1
+    assert sorted(seen) == [("alice", 1), ("bob", 1)]
+    assert "lemonde:1" not in flights
@@ -0,0 +1,68 @@
+import asyncio
+from pathlib import Path
+from typing import Any, cast
+
+import pytest
+
+from cogs.lemonde.lemonde_pool import RenderPool, RenderWorker
+
+
+class FakeWorker:
+    """Worker sans processus : `render` renvoie `reply`, ou bloque si `reply` est None."""
+
+    def __init__(self, reply: dict | None = None) -> None:
+        self.reply = reply
+        self.alive = True
+        self.jobs_done = 0
+        self.stops = 0
+
+    async def start(self) -> None:
+        self.alive = True
+
+    async def render(self, url: str, out_dir: Path, timeout: float) -> dict:
+        if self.reply is None:
+            await asyncio.Event().wait()
+        assert self.reply is not None
+        self.jobs_done += 1
+        return self.reply
+
+    async def stop(self, grace: float = 5.0) -> None:
+        self.alive = False
+        self.stops += 1
+
+
+def make_pool(worker: FakeWorker, **kwargs: Any) -> RenderPool:
+    pool = RenderPool(size=0, max_jobs=10, mem_mb=0, job_timeout=5, **kwargs)
+    pool._workers = [cast(RenderWorker, worker)]
+    pool._idle.put_nowait(cast(RenderWorker, worker))
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_cancelled_render_stops_the_worker(tmp_path):
+    worker = FakeWorker(reply=None)
+    pool = make_pool(worker)
+
+    task = asyncio.create_task(pool.render("https://www.lemonde.fr/a_1.html", tmp_path))
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # rendu au pool, mais arrêté : sa réponse en retard ne sera lue par personne
+    assert worker.stops == 1 and not worker.alive
+    assert pool._idle.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_recycled_above_max_rss(tmp_path):
+    reply = {"ok": True, "articles": [], "rss_mb": 200.0}
+    worker = FakeWorker(reply=reply)
+    pool = make_pool(worker, max_rss_mb=128)
+
+    assert await pool.render("https://www.lemonde.fr/a_1.html", tmp_path) == []
+    assert worker.stops == 1
+
+    reply["rss_mb"] = 100.0
+    await pool.render("https://www.lemonde.fr/a_1.html", tmp_path)
+    assert worker.stops == 1
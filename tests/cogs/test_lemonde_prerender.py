@@ -0,0 +1,40 @@
+from cogs.lemonde import lemonde_prerender
+from cogs.lemonde.lemonde_prerender import PrerenderStats, find_article_urls
+
+
+def test_find_article_urls_keeps_articles_only():
+    text = (
+        "lisez ça https://www.lemonde.fr/societe/article/2024/10/05/x_6344040_3224.html, "
+        "et la rubrique https://www.lemonde.fr/societe/ "
+        "(https://www.lemonde.fr/sport/article/2024/10/06/y_6344041_3242.html?utm=1)"
+    )
+
+    assert find_article_urls(text) == [
+        "https://www.lemonde.fr/societe/article/2024/10/05/x_6344040_3224.html",
+        "https://www.lemonde.fr/sport/article/2024/10/06/y_6344041_3242.html?utm=1",
+    ]
+
+
+def test_prerender_stats_counts_each_article_once():
+    stats = PrerenderStats()
+    stats.record_start("a")
+    assert stats.record_hit("a")  # rejoint un pré-rendu en cours
+    assert not stats.record_hit("a")
+    stats.record_end("a", ok=True)
+    stats.record_start("b")
+    stats.record_end("b", ok=True)
+    stats.record_start("c")
+    stats.record_end("c", ok=False)
+
+    assert stats.record_hit("b")
+    assert not stats.record_hit("b")
+    assert (stats.done, stats.hits, stats.dropped) == (2, 2, 1)
+    assert stats.hit_rate == 1.0
+
+
+def test_memory_pressure_default_fits_small_vm(monkeypatch):
+    # 256 Mo au total, ~100 Mo libres une fois le bot chargé : le pré-rendu reste permis
+    monkeypatch.setattr(lemonde_prerender, "get_available_ram_mb", lambda: 100.0)
+    assert not lemonde_prerender.memory_pressure()
+    monkeypatch.setattr(lemonde_prerender, "get_available_ram_mb", lambda: 40.0)
+    assert lemonde_prerender.memory_pressure()
@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+from cogs.lemonde.lemonde_queue import (
+    PRIORITY_SPECULATIVE,
+    PRIORITY_USER,
+    JobDropped,
+    QueueFullError,
+    RenderQueue,
+    UserLimitError,
+)
+
+
+@pytest.mark.asyncio
+async def test_render_queue_positions_and_limits():
+    queue = RenderQueue(workers=1, max_pending=2, per_user=1)
+    queue.start()
+    release = asyncio.Event()
+    positions: dict[str, list[int]] = {}
+
+    async def job(name):
+        await release.wait()
+        return name
+
+    def submit(name, user_id):
+        async def on_position(position, eta):
+            positions.setdefault(name, []).append(position)
+
+        return asyncio.create_task(
+            queue.submit(lambda: job(name), user_id=user_id, on_position=on_position)
+        )
+
+    first = submit("a", 1)
+    await asyncio.sleep(0.01)  # "a" démarre, la file est vide
+    waiting = [submit("b", 2), submit("c", 3)]
+    await asyncio.sleep(0.01)
+
+    with pytest.raises(UserLimitError):
+        queue.check_admission(1)
+    with pytest.raises(QueueFullError):
+        queue.check_admission(4)
+
+    release.set()
+    assert await asyncio.gather(first, *waiting) == ["a", "b", "c"]
+    assert positions["a"][-1] == 0
+    assert positions["c"] == [2, 1, 0]
+    assert queue.stats.done == 3
+    assert queue.stats.rejected == 2
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_speculative_jobs_yield_promote_and_drop():
+    pressure = False
+    queue = RenderQueue(workers=1, max_pending=5, per_user=5, pressure=lambda: pressure)
+    queue.start()
+    release = asyncio.Event()
+    order = []
+
+    async def job(name):
+        await release.wait()
+        order.append(name)
+        return name
+
+    def submit(name, priority=PRIORITY_USER):
+        return asyncio.create_task(
+            queue.submit(lambda: job(name), user_id=1, priority=priority, key=name)
+        )
+
+    running = submit("running")
+    await asyncio.sleep(0.01)
+    spec = [submit("spec1", PRIORITY_SPECULATIVE), submit("spec2", PRIORITY_SPECULATIVE)]
+    await asyncio.sleep(0.01)
+    with pytest.raises(QueueFullError):
+        queue.check_admission(0, PRIORITY_SPECULATIVE)
+    user = submit("user")
+    await asyncio.sleep(0.01)
+    assert await queue.promote("spec2")
+
+    pressure = True  # spec1 sera abandonné au lieu de démarrer
+    release.set()
+    results = await asyncio.gather(running, user, *spec, return_exceptions=True)
+
+    assert order == ["running", "user", "spec2"]
+    assert isinstance(results[2], JobDropped)
+    assert queue.stats.dropped == 1
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_user_job_preempts_running_speculative_job():
+    queue = RenderQueue(workers=1, max_pending=5, per_user=5)
+    queue.start()
+    gates = {name: asyncio.Event() for name in ("spec", "user", "kept", "other")}
+    started = []
+
+    async def job(name):
+        started.append(name)
+        await gates[name].wait()
+        return name
+
+    def submit(name, priority):
+        return asyncio.create_task(
+            queue.submit(lambda: job(name), user_id=1, priority=priority, key=name)
+        )
+
+    spec = submit("spec", PRIORITY_SPECULATIVE)
+    await asyncio.sleep(0.01)
+    user = submit("user", PRIORITY_USER)
+    await asyncio.sleep(0.01)
+    assert started == ["spec", "user"]  # le seul worker est rendu à l'utilisateur
+    with pytest.raises(JobDropped):
+        await spec
+    gates["user"].set()
+    assert await user == "user"
+
+    # un pré-rendu promu en cours de route n'est plus interrompu
+    kept = submit("kept", PRIORITY_SPECULATIVE)
+    await asyncio.sleep(0.01)
+    assert await queue.promote("kept")
+    other = submit("other", PRIORITY_USER)
+    await asyncio.sleep(0.01)
+    assert started[-1] == "kept"
+    gates["kept"].set()
+    gates["other"].set()
+    assert await asyncio.gather(kept, other) == ["kept", "other"]
+    assert queue.stats.dropped == 1
+    await queue.close()
@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from cogs.lemonde.lemonde_session import LeMondeSession
+
+
+class FakeLeMonde:
+    """Se comporte comme LeMondeAsync : un login pose un cookie de session."""
+
+    instances: list["FakeLeMonde"] = []
+
+    def __init__(self, fail_with: list[Exception] | None = None) -> None:
+        self.client = httpx.AsyncClient()
+        self.calls: list[str | None] = []
+        self.fail_with = fail_with or []
+        self.closed = False
+        FakeLeMonde.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.closed = True
+        await self.client.aclose()
+
+    async def fetch_all_pdf(self, url, email, password, max_img):
+        self.calls.append(email)
+        await asyncio.sleep(0.01)
+        if self.fail_with:
+            raise self.fail_with.pop(0)
+        if email:
+            self.client.cookies.set("lmd_a_s", "token", domain=".lemonde.fr")
+        return [url]
+
+
+def auth_error(status: int = 401) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://www.lemonde.fr/")
+    return httpx.HTTPStatusError("refusé", request=request, response=httpx.Response(status))
+
+
+@pytest.fixture(autouse=True)
+def credentials(monkeypatch):
+    monkeypatch.setenv("LM_SL_EMAIL", "a@b.c")
+    monkeypatch.setenv("LM_SL_PASSWD", "secret")
+    FakeLeMonde.instances = []
+
+
+@pytest.mark.asyncio
+async def test_reused_session_logs_in_once(tmp_path):
+    cookies = tmp_path / "cookies.json"
+    session = LeMondeSession(cookie_path=cookies, factory=FakeLeMonde)
+
+    await asyncio.gather(*(session.fetch_all_pdf(f"u{i}", max_img=1) for i in range(1, 5)))
+    assert FakeLeMonde.instances[0].calls == ["a@b.c", None, None, None]
+    assert session.logins == 1
+    await session.close()
+
+    # nouveau processus : les cookies sauvegardés évitent le login
+    restarted = LeMondeSession(cookie_path=cookies, factory=FakeLeMonde)
+    await restarted.fetch_all_pdf("u5", max_img=1)
+    assert FakeLeMonde.instances[1].calls == [None]
+    assert restarted.logins == 0
+    await restarted.close()
+
+
+@pytest.mark.asyncio
+async def test_only_auth_errors_trigger_a_new_login(tmp_path):
+    session = LeMondeSession(cookie_path=tmp_path / "c.json", factory=FakeLeMonde)
+    await session.fetch_all_pdf("u1", max_img=1)
+    lm = FakeLeMonde.instances[0]
+
+    lm.fail_with = [RuntimeError("rendu cassé")]
+    with pytest.raises(RuntimeError):
+        await session.fetch_all_pdf("u2", max_img=1)
+    assert lm.calls == ["a@b.c", None]  # pas de second rendu
+
+    lm.fail_with = [auth_error(403)]
+    assert await session.fetch_all_pdf("u3", max_img=1) == ["u3"]
+    assert lm.calls == ["a@b.c", None, None, "a@b.c"]
+    assert len(FakeLeMonde.instances) == 1  # même client, pas de fermeture en plein rendu
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_client_closed_after_its_renders(tmp_path, monkeypatch):
+    session = LeMondeSession(cookie_path=tmp_path / "c.json", max_age=3600, factory=FakeLeMonde)
+    await session.fetch_all_pdf("u1", max_img=1)
+    first = FakeLeMonde.instances[0]
+    release = asyncio.Event()
+    original = first.fetch_all_pdf
+
+    async def blocked(url, email, password, max_img):
+        await release.wait()
+        return await original(url, email, password, max_img)
+
+    monkeypatch.setattr(first, "fetch_all_pdf", blocked)
+    in_flight = asyncio.create_task(session.fetch_all_pdf("lent", max_img=1))
+    await asyncio.sleep(0.01)
+    session.max_age = 0  # la session expire pendant le rendu
+    await session.fetch_all_pdf("u2", max_img=1)
+    assert len(FakeLeMonde.instances) == 2
+    closed_mid_render = first.closed
+    assert not closed_mid_render  # toujours utilisé par le rendu en cours
+
+    release.set()
+    assert await in_flight == ["lent"]
+    assert first.closed
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_missing_http_client_falls_back_to_stateless(tmp_path, caplog):
+    class NoClient(FakeLeMonde):
+        def __init__(self):
+            super().__init__()
+            del self.client
+
+        async def __aexit__(self, *exc):
+            self.closed = True
+
+        async def fetch_all_pdf(self, url, email, password, max_img):
+            self.calls.append(email)
+            return [url]
+
+    session = LeMondeSession(cookie_path=tmp_path / "c.json", factory=NoClient)
+    assert await session.fetch_all_pdf("u1", max_img=1) == ["u1"]
+    assert await session.fetch_all_pdf("u2", max_img=1) == ["u2"]
+
+    assert session.stateless
+    assert "sans état" in caplog.text
+    # comportement d'origine : un client neuf, identifiants compris, à chaque rendu
+    assert [lm.calls for lm in FakeLeMonde.instances] == [[], ["a@b.c"], ["a@b.c"]]
+    assert all(lm.closed for lm in FakeLeMonde.instances)
+    assert session.logins == 2
+    await session.close()
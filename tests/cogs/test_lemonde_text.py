@@ -0,0 +1,81 @@
+import httpx
+import pytest
+
+from cogs.lemonde import lemonde_text
+from cogs.lemonde.lemonde_text import paginate, parse_article, split_image
+
+HTML = """
+<html><head><meta property="og:image" content="https://img.lemonde.fr/lead.jpg"></head>
+<body><main>
+<h1 class="article__title">Le  titre</h1>
+<p class="article__desc">Le chapô.</p>
+<section class="article__content">
+  <p class="article__paragraph">Premier <a href="#">paragraphe</a>.</p>
+  <h2 class="article__sub-title">Un intertitre</h2>
+  <p class="article__paragraph">Second paragraphe.</p>
+  <p class="article__paragraph"> </p>
+</section>
+</main></body></html>
+"""
+URL = "https://www.lemonde.fr/a/article/2024/10/05/x_1_2.html"
+
+
+def test_parse_article_to_markdown():
+    article = parse_article(HTML, URL)
+
+    assert article.title == "Le titre"
+    assert article.blocks == [
+        ("p", "Premier paragraphe."),
+        ("h2", "Un intertitre"),
+        ("p", "Second paragraphe."),
+    ]
+    body, image = split_image(article.to_markdown())
+    assert image == "https://img.lemonde.fr/lead.jpg"
+    assert body.startswith("# Le titre\n\n*Le chapô.*\n\nPremier")
+    assert body.endswith(f"<{URL}>")
+
+
+def test_paginate_splits_between_paragraphs():
+    text = "\n\n".join(["a" * 40, "b" * 40, "c" * 40, "mot " * 30])
+
+    pages = paginate(text, limit=100)
+
+    assert all(len(page) <= 100 for page in pages)
+    assert pages[0] == "a" * 40 + "\n\n" + "b" * 40
+    assert "".join(pages).replace("\n", "").replace(" ", "") == text.replace("\n", "").replace(
+        " ", ""
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_sends_cookies_per_request_and_detects_paywall(monkeypatch):
+    cookies = httpx.Cookies()
+    cookies.set("lmd_a_s", "token", domain=".lemonde.fr")
+    monkeypatch.setattr(lemonde_text, "read_cookies", lambda: cookies)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("cookie")))
+        if request.url.path == "/old":
+            return httpx.Response(301, headers={"Location": URL})
+        paywall = '<div class="paywall">La suite est réservée aux abonnés.</div>'
+        return httpx.Response(200, text=HTML.replace("</main>", f"{paywall}</main>"))
+
+    client = lemonde_text.make_text_client(httpx.MockTransport(handler))
+    article, warning = await lemonde_text.fetch_article_text(client, "https://www.lemonde.fr/old")
+
+    assert seen == [("/old", "lmd_a_s=token"), (httpx.URL(URL).path, "lmd_a_s=token")]
+    assert article.truncated and warning == lemonde_text.EXPIRED_WARNING
+    assert not client.cookies.jar  # rien de partagé entre deux requêtes
+    assert parse_article(HTML, URL).truncated is False
+    await client.aclose()
+
+
+def test_paywall_text_outside_the_body_is_ignored():
+    teaser = '<script>var t = "La suite est réservée aux abonnés";</script>'
+    footer = "<footer>La suite est réservée aux abonnés</footer>"
+    html = HTML.replace("</main>", f"</main>{teaser}{footer}")
+    assert parse_article(html, URL).truncated is False
+
+    cut = '<p class="article__paragraph">La suite est réservée aux abonnés.</p></section>'
+    assert parse_article(HTML.replace("</section>", cut), URL).truncated is True
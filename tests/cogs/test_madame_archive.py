@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+from cogs.bonjourmadame import madame_archive
+from cogs.bonjourmadame.madame_archive import MadameArchive, MadameEntry, backfill
+from cogs.bonjourmadame.madame_scraper import extract_madame
+
+HTML = """
+<header class="post-header"><h1><a href="/x">Madame du jour</a></h1></header>
+<div class="post-content"><p>
+  <a href="https://book.example.com/madame"><img src="https://img.example.com/m.jpg?w=800"></a>
+</p></div>
+"""
+
+
+def test_extract_madame():
+    assert extract_madame(HTML) == (
+        "https://img.example.com/m.jpg",
+        "Madame du jour",
+        "https://book.example.com/madame",
+    )
+
+
+def test_archive_is_persisted(tmp_path):
+    path = tmp_path / "archive.jsonl"
+    day = datetime.date(2024, 10, 3)
+    archive = MadameArchive(path)
+    archive.add(MadameEntry(date=day, image_url="https://img/1.jpg", title="t", book=None))
+    archive.add(MadameEntry(date=day.replace(day=5), image_url=None, title=None, book=None))
+
+    reloaded = MadameArchive(path)
+    assert len(reloaded) == 2
+    entry = reloaded.get(day)
+    assert entry is not None and entry.image_url == "https://img/1.jpg"
+    assert reloaded.get(day.replace(day=5)) is None
+    picked = reloaded.random()
+    assert picked is not None and picked.date == day
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_known_days(tmp_path, monkeypatch):
+    fetched = []
+
+    async def fake_fetch(client, day):
+        fetched.append(day)
+        return f"https://img/{day}.jpg", "t", None
+
+    monkeypatch.setattr(madame_archive, "fetch_madame_day", fake_fetch)
+    archive = MadameArchive(tmp_path / "archive.jsonl")
+    archive.add(MadameEntry(date=datetime.date(2024, 1, 2), image_url="u", title="t", book=None))
+
+    added, failed = await backfill(archive, datetime.date(2024, 1, 1), datetime.date(2024, 1, 3))
+
+    assert (added, failed) == (2, 0)
+    assert sorted(fetched) == [datetime.date(2024, 1, 1), datetime.date(2024, 1, 3)]
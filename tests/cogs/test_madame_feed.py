@@ -0,0 +1,38 @@
+import httpx
+import pytest
+
+from cogs.bonjourmadame.madame_feed import FeedState, fetch_latest_feed
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+<channel><title>Bonjour Madame</title>
+<item><title>Nouvelle madame</title>
+<content:encoded><![CDATA[<p><a href="https://book.example.com/x"><img src="https://img.example.com/new.jpg?w=1"></a></p>]]></content:encoded>
+</item>
+<item><title>Ancienne madame</title>
+<content:encoded><![CDATA[<p><img src="https://img.example.com/old.jpg"></p>]]></content:encoded>
+</item>
+</channel></rss>
+"""
+
+
+@pytest.mark.asyncio
+async def test_fetch_latest_feed_newest_entry_then_not_modified():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=FEED, headers={"ETag": '"v1"'})
+
+    state = FeedState()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        madame, stats = await fetch_latest_feed(client, state)
+        again, cond_stats = await fetch_latest_feed(client, state)
+
+    assert madame == (
+        "https://img.example.com/new.jpg",
+        "Nouvelle madame",
+        "https://book.example.com/x",
+    )
+    assert not stats.not_modified
+    assert again == madame
+    assert cond_stats.not_modified
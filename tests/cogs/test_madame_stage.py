@@ -0,0 +1,83 @@
+import datetime
+from collections.abc import Callable
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from cogs.bonjourmadame import madame_feed, madame_stage
+from cogs.bonjourmadame.madame_feed import FeedError, FeedState, ingest_latest
+from cogs.bonjourmadame.madame_stage import StagedMadame, StagingError, stage_madame, stage_until
+
+DAY = datetime.date(2025, 3, 12)
+IMAGE = "https://img.example.com/2025/03/madame.jpg"
+
+
+def image_client(body: bytes, content_type: str = "image/jpeg") -> Callable[..., httpx.AsyncClient]:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+    return lambda timeout=10.0: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_stage_madame_excludes_book_and_attaches_image(monkeypatch):
+    async def ingest(state, backend):
+        return IMAGE, "Madame du jour", "https://shop.example.com/book"
+
+    monkeypatch.setattr(madame_stage, "ingest_latest", ingest)
+    monkeypatch.setattr(madame_stage, "make_client", image_client(b"x" * 100))
+
+    staged = await stage_madame(DAY, FeedState(), "feed", ["shop.example.com"], attach=True)
+    assert (staged.book, staged.image, staged.filename) == (None, b"x" * 100, "madame.jpg")
+    assert "file" in staged.to_message_kwargs(filesize_limit=1000)
+    # trop lourde pour le serveur : on poste l'URL
+    assert staged.to_message_kwargs(filesize_limit=10) == {"content": f"Madame du jour\n{IMAGE}"}
+
+    monkeypatch.setattr(madame_stage, "make_client", image_client(b"<html>", "text/html"))
+    staged = await stage_madame(DAY, FeedState(), "feed", [], attach=True)
+    assert staged.image is None and staged.book == "https://shop.example.com/book"
+
+
+@pytest.mark.asyncio
+async def test_stage_until_retries_then_gives_up(monkeypatch):
+    monkeypatch.setattr(madame_stage.asyncio, "sleep", lambda delay: _noop())
+    paris = ZoneInfo("Europe/Paris")
+    deadline = datetime.datetime.now(paris) + datetime.timedelta(minutes=10)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("réseau")
+        return StagedMadame(day=DAY, title="t", image_url=IMAGE)
+
+    staged = await stage_until(flaky, deadline, retry_delay=30, margin=60)
+    assert staged is not None and staged.image_url == IMAGE
+    assert len(attempts) == 3
+
+    async def broken():
+        attempts.append(1)
+        raise StagingError("pas d'image")
+
+    attempts.clear()
+    soon = datetime.datetime.now(paris) + datetime.timedelta(seconds=60)
+    assert await stage_until(broken, soon, retry_delay=30, margin=60) is None
+    assert len(attempts) == 1  # plus le temps de réessayer
+
+
+async def _noop():
+    return None
+
+
+@pytest.mark.asyncio
+async def test_ingest_latest_falls_back_to_html(monkeypatch):
+    async def broken_feed(client, state):
+        raise FeedError("flux vide")
+
+    async def html(client):
+        return (IMAGE, "Depuis le HTML", None), "html"
+
+    monkeypatch.setattr(madame_feed, "fetch_latest_feed", broken_feed)
+    monkeypatch.setattr(madame_feed, "fetch_latest_html", html)
+    assert await ingest_latest(FeedState(), backend="feed") == (IMAGE, "Depuis le HTML", None)
@@ -0,0 +1,18 @@
+from cogs.redditbabes.reddit_media import MediaFile, group_media
+
+
+def make(i: int, size: int | None) -> MediaFile:
+    return MediaFile(
+        url=f"https://i/{i}.jpg", filename=f"{i}.jpg", data=None if size is None else b"x" * size
+    )
+
+
+def test_group_media_respects_count_and_size():
+    medias = [make(i, 10) for i in range(12)] + [make(12, 95), make(13, None), make(14, 500)]
+
+    batches = group_media(medias, size_limit=100, max_files=10)
+
+    assert [len(b.files) for b in batches] == [10, 2, 1]
+    assert all(sum(m.size for m in b.files) <= 100 for b in batches)
+    assert batches[-1].urls == ["https://i/13.jpg", "https://i/14.jpg"]
+    assert [b.urls for b in batches[:-1]] == [[], []]
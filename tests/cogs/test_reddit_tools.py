@@ -0,0 +1,32 @@
+from cogs.redditbabes.reddit_tools import canonical_id_from_url, select_media_url
+
+MEDIA = {
+    "s": {"x": 3000, "y": 4000, "u": "https://preview.redd.it/src.jpg?width=3000&amp;s=a"},
+    "p": [
+        {"x": 108, "y": 144, "u": "https://preview.redd.it/p.jpg?width=108&amp;s=b"},
+        {"x": 640, "y": 853, "u": "https://preview.redd.it/p.jpg?width=640&amp;s=c"},
+        {"x": 1080, "y": 1440, "u": "https://preview.redd.it/p.jpg?width=1080&amp;s=d"},
+    ],
+}
+
+
+def test_canonical_id_from_url():
+    assert canonical_id_from_url("https://www.reddit.com/gallery/1rht5ue") == "1rht5ue"
+
+
+def test_select_media_url_best_preview_under_budget():
+    assert select_media_url(MEDIA, max_pixels=1000 * 1000) == (
+        "https://preview.redd.it/p.jpg?width=640&s=c"
+    )
+
+
+def test_select_media_url_source_when_it_fits():
+    assert select_media_url(MEDIA, max_pixels=4000 * 4000) == (
+        "https://preview.redd.it/src.jpg?width=3000&s=a"
+    )
+
+
+def test_select_media_url_fallback_to_source():
+    assert select_media_url(MEDIA, max_pixels=100) == (
+        "https://preview.redd.it/src.jpg?width=3000&s=a"
+    )
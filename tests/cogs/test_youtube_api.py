@@ -0,0 +1,34 @@
+import httpx
+import pytest
+
+from cogs.youtube.youtube_api import API_URL, Result, YoutubeClient, get_youtube_url
+
+ITEMS = [
+    {"id": {"kind": "youtube#video", "videoId": "v1"}, "snippet": {"title": "Rock &amp; roll"}},
+    {"id": {"kind": "youtube#playlist", "playlistId": "p1"}, "snippet": {"title": "Liste"}},
+    {"id": {"kind": "youtube#channel", "channelId": "c1"}, "snippet": {"title": "Chaîne"}},
+]
+
+
+@pytest.mark.asyncio
+async def test_search_maps_results():
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return httpx.Response(200, json={"items": ITEMS})
+
+    client = httpx.AsyncClient(base_url=API_URL, transport=httpx.MockTransport(handler))
+    api = YoutubeClient("KEY", client=client)
+
+    results = await api.search("rock", 3)
+    await api.aclose()
+
+    assert results == [
+        Result("Rock & roll", "video", "v1"),
+        Result("Liste", "playlist", "p1"),
+        Result("Chaîne", "channel", "c1"),
+    ]
+    assert seen[0].path == "/youtube/v3/search"
+    assert seen[0].params["q"] == "rock" and seen[0].params["maxResults"] == "3"
+    assert get_youtube_url(results[1]) == "https://www.youtube.com/playlist?list=p1"
@@ -0,0 +1,32 @@
+from cogs.youtube.youtube_api import Result
+from cogs.youtube.youtube_cache import SearchCache
+
+RESULTS = [Result(f"titre {i}", "video", f"v{i}") for i in range(10)]
+
+
+def test_bigger_search_answers_smaller_one():
+    cache = SearchCache(max_entries=10, ttl=60)
+    cache.put("Daft  Punk", 10, RESULTS)
+
+    assert cache.get("daft punk", 1) == RESULTS[:1]
+    assert cache.get("daft punk", 20) is None
+    cache.put("daft punk", 1, RESULTS[:1])  # n'écrase pas l'entrée plus complète
+    assert cache.get("DAFT PUNK", 5) == RESULTS[:5]
+    assert (cache.hits, cache.misses, cache.quota_saved) == (2, 1, 200)
+
+
+def test_lru_and_disk_tier(tmp_path):
+    path = tmp_path / "cache.jsonl"
+    cache = SearchCache(max_entries=2, ttl=60, path=path)
+    cache.put("a", 1, RESULTS[:1])
+    cache.put("b", 1, RESULTS[1:2])
+    cache.get("a", 1)
+    cache.put("c", 1, RESULTS[2:3])  # évince "b", le moins récemment utilisé
+
+    assert cache.get("b", 1) is None
+    reloaded = SearchCache(max_entries=10, ttl=60, path=path)
+    assert reloaded.get("c", 1) == RESULTS[2:3]
+    assert len(path.read_text().splitlines()) == 3  # fichier compacté au chargement
+
+    expired = SearchCache(max_entries=10, ttl=0, path=path)
+    assert len(expired) == 0
@@ -0,0 +1,54 @@
+import httpx
+import pytest
+
+from cogs.youtube.youtube_api import API_URL, Result, YoutubeClient
+from cogs.youtube.youtube_details import DetailsCache, format_duration, format_views
+
+
+def test_formats():
+    assert format_duration("PT3M5S") == "3:05"
+    assert format_duration("PT1H2M3S") == "1:02:03"
+    assert format_duration("P0D") == ""
+    assert format_views(1_234_567) == "1,2 M"
+    assert format_views(15_000) == "15 k"
+    assert format_views(999) == "999"
+
+
+@pytest.mark.asyncio
+async def test_details_are_batched_and_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.url.path, request.url.params["id"]))
+        if request.url.path.endswith("/videos"):
+            items = [
+                {
+                    "id": id_,
+                    "snippet": {"channelTitle": "Chaîne"},
+                    "contentDetails": {"duration": "PT4M"},
+                    "statistics": {"viewCount": "2000"},
+                }
+                for id_ in request.url.params["id"].split(",")
+            ]
+        else:
+            items = [{"id": "p1", "snippet": {}, "contentDetails": {"itemCount": 12}}]
+        return httpx.Response(200, json={"items": items})
+
+    client = httpx.AsyncClient(base_url=API_URL, transport=httpx.MockTransport(handler))
+    cache = DetailsCache(YoutubeClient("KEY", client=client), ttl=60)
+    results = [
+        Result("a", "video", "v1"),
+        Result("b", "playlist", "p1"),
+        Result("c", "video", "v2"),
+        Result("d", "channel", "c1"),
+    ]
+
+    details = await cache.get(results)
+    assert sorted(calls) == [("/youtube/v3/playlists", "p1"), ("/youtube/v3/videos", "v1,v2")]
+    assert details["v2"].describe() == "⏱️ 4:00 · 👁️ 2 k vues · 📺 Chaîne"
+    assert details["p1"].videos == 12
+    assert "c1" not in details
+
+    await cache.get(results[:3])
+    assert len(calls) == 2  # tout vient du cache
+    await client.aclose()
@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+from typing import cast
+
+import discord
+import pytest
+
+from cogs.youtube.youtube_prompts import PromptDispatcher, TimerWheel
+
+
+def message(channel: int, author: int, content: str) -> discord.Message:
+    fake = SimpleNamespace(
+        channel=SimpleNamespace(id=channel), author=SimpleNamespace(id=author), content=content
+    )
+    return cast(discord.Message, fake)
+
+
+def test_timer_wheel_expires_after_several_rounds():
+    wheel = TimerWheel(tick=1, slots=4)
+    wheel.schedule("a", 2)
+    wheel.schedule("b", 10)
+    wheel.schedule("c", 3)
+    wheel.cancel("c")
+    expired = [wheel.advance() for _ in range(10)]
+    assert expired[1] == ["a"]
+    assert expired[9] == ["b"]
+    assert sum(map(len, expired)) == 2
+    assert len(wheel) == 0
+
+
+@pytest.mark.asyncio
+async def test_dispatcher_replies_deletes_and_timeouts():
+    prompts = PromptDispatcher()
+    deleted = []
+
+    async def delete_link():
+        deleted.append("link")
+
+    prompts.watch_delete(42, delete_link, timeout=1200)
+    await prompts.on_message_delete(7)
+    await prompts.on_message_delete(42)
+    assert deleted == ["link"]
+
+    waiting = asyncio.create_task(prompts.wait_reply(1, 2, lambda m: m.content.isdigit(), 15))
+    await asyncio.sleep(0)
+    prompts.on_message(message(1, 3, "4"))  # autre auteur
+    prompts.on_message(message(1, 2, "hello"))  # refusé par le check
+    prompts.on_message(message(1, 2, "4"))
+    reply = await waiting
+    assert reply is not None and reply.content == "4"
+    assert prompts.pending == 0
+
+    waiting = asyncio.create_task(prompts.wait_reply(1, 2, lambda m: True, 1))
+    await asyncio.sleep(0)
+    for key in prompts.wheel.advance():
+        prompts._expire(key)
+    with pytest.raises(TimeoutError):
+        await waiting
+    await prompts.close()
@@ -0,0 +1,34 @@
+import datetime
+
+from cogs.youtube.youtube_quota import PACIFIC, QuotaLedger, QuotaLevel, next_reset, quota_day
+
+
+def test_quota_day_follows_pacific_midnight():
+    # 8h30 à Paris (UTC+2) = 23h30 la veille à Los Angeles
+    now = datetime.datetime(2026, 6, 10, 6, 30, tzinfo=datetime.UTC)
+
+    assert quota_day(now) == datetime.date(2026, 6, 9)
+    assert next_reset(now) == datetime.datetime(2026, 6, 10, tzinfo=PACIFIC)
+
+
+def test_ledger_levels_and_persistence(tmp_path):
+    path = tmp_path / "quota.json"
+    ledger = QuotaLedger(daily_quota=2000, path=path)
+    assert ledger.level() == QuotaLevel.NORMAL
+
+    for _ in range(16):
+        ledger.record("/search")
+    assert ledger.level() == QuotaLevel.CACHE_FIRST
+    ledger.record("/search")
+    ledger.record("/search")
+    ledger.record("/videos")
+    assert ledger.level() == QuotaLevel.REDUCED
+    assert ledger.rate() == 1801
+
+    reloaded = QuotaLedger(daily_quota=2000, path=path)
+    assert reloaded.spent == 1801
+    assert reloaded.by_endpoint["/search"] == 1800
+    reloaded.exhaust()
+    assert reloaded.level() == QuotaLevel.EXHAUSTED
+    forecast = reloaded.forecast()
+    assert forecast is not None and forecast <= datetime.datetime.now(datetime.UTC)  # déjà épuisé
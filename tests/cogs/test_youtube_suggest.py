@@ -0,0 +1,34 @@
+import asyncio
+
+import httpx
+import pytest
+
+from cogs.youtube.youtube_api import Result
+from cogs.youtube.youtube_cache import SearchCache
+from cogs.youtube.youtube_suggest import Suggester
+
+
+@pytest.mark.asyncio
+async def test_suggester_debounces_and_cancels_per_user():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        q = request.url.params["q"]
+        calls.append(q)
+        return httpx.Response(200, json=[q, [f"{q} live", f"{q} clip"]])
+
+    cache = SearchCache(max_entries=10, ttl=60)
+    cache.put("daft punk", 1, [Result("Around the world", "video", "v1")])
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    suggester = Suggester(cache, client=client, debounce=0.05, deadline=1)
+
+    first = asyncio.create_task(suggester.suggest(1, "daft"))
+    await asyncio.sleep(0.01)
+    second = await suggester.suggest(1, "daft p")
+
+    assert await first == ["daft punk"]  # annulée : cache seulement
+    assert second == ["daft punk", "daft p live", "daft p clip"]
+    assert calls == ["daft p"]
+    assert await suggester.suggest(2, "DAFT P") == second  # mémoïsé
+    assert calls == ["daft p"]
+    await suggester.aclose()
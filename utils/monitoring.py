@@ -0,0 +1,15 @@
+"""Monitoring tools (no discord import : usable from worker processes)."""
+
+import os
+
+import psutil
+
+
+def get_ram_usage_mb() -> float:
+    process = psutil.Process(os.getpid())
+    return float(process.memory_info().rss) / (1024 * 1024)
+
+
+def get_available_ram_mb() -> float:
+    """Mémoire disponible sur la machine (tous processus confondus)."""
+    return float(psutil.virtual_memory().available) / (1024 * 1024)